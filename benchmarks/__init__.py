@@ -0,0 +1,2 @@
+# Paquete benchmarks: Mediciones de rendimiento y memoria
+# Cada módulo se ejecuta con `python -m benchmarks.<modulo>` desde la raíz
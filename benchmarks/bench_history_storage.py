@@ -0,0 +1,134 @@
+# =============================================================================
+# Benchmark: tamaño del historial en memoria y en disco por modo de guardado
+# =============================================================================
+#
+# Alimenta un controlador (HeadlessView) con una carga de WorkloadGenerator
+# y un reloj virtual que avanza con el tiempo de reflexión de cada evento,
+# de modo que las marcas del historial tengan los intervalos de una sesión
+# real. Compara bytes por registro de HistoryManager (un dict por registro),
+# CompactHistoryManager y TieredHistoryManager (memoria y disco), y el tamaño
+# de las exportaciones .json, .txt y .chist. Verifica además que los modos
+# compacto y por niveles devuelvan los mismos registros.
+#
+#   python -m benchmarks.bench_history_storage --events 200000 --seed 7 --hot 1000
+# =============================================================================
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+from controllers.calculator_controller import CalculatorController
+from models.compact_history import CompactHistoryManager
+from models.history_manager import HistoryManager
+from models.tiered_history import TieredHistoryManager
+from services.file_manager import FileManager
+from services.workload_generator import WorkloadGenerator
+from utils.clock import Clock
+from views.headless_view import HeadlessView
+
+
+def record_session(events: int, seed: int) -> list[tuple]:
+    """Retorna (expresión, resultado, marca) de los registros de la sesión."""
+    controller = CalculatorController(HeadlessView())
+    controller.initialize()
+    now = [time.time_ns()]
+    real_stamp = Clock.stamp
+    Clock.stamp = staticmethod(lambda: now[0])
+    try:
+        for delta_us, name, args in WorkloadGenerator(seed).events(events):
+            now[0] += delta_us * 1000
+            getattr(controller, name)(*args)
+    finally:
+        Clock.stamp = real_stamp
+    return [(r["expression"], r["result"], r["stamp"])
+            for r in controller.history.get_all_records()]
+
+
+def fill(history: HistoryManager, session: list[tuple]) -> HistoryManager:
+    """Agrega los registros conservando sus marcas originales."""
+    stamps = iter([stamp for _, _, stamp in session])
+    real_stamp = Clock.stamp
+    Clock.stamp = staticmethod(lambda: next(stamps))
+    try:
+        for expression, result, _ in session:
+            history.add_record(expression, result)
+    finally:
+        Clock.stamp = real_stamp
+    return history
+
+
+def rows(records) -> list[tuple]:
+    return [(r["expression"], repr(r["result"]), r["timestamp"]) for r in records]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tamaño del historial por modo.")
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--hot", type=int, default=1000,
+                        help="registros en memoria del modo por niveles")
+    options = parser.parse_args()
+
+    session = record_session(options.events, options.seed)
+    count = len(session)
+    plain = fill(HistoryManager(), session)
+    start = time.perf_counter()
+    compact = fill(CompactHistoryManager(), session)
+    append_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    decoded = compact.get_all_records()
+    decode_s = time.perf_counter() - start
+    expected = rows(plain.get_all_records())
+    same = rows(decoded) == expected
+
+    tiered = fill(TieredHistoryManager(options.hot), session)
+    start = time.perf_counter()
+    newest_first = rows(tiered.get_records_reversed())
+    reverse_s = time.perf_counter() - start
+    same = same and newest_first[::-1] == expected
+
+    plain_size = plain.memory_bytes()
+    compact_size = compact.memory_bytes()
+    print(f"{count:,} registros ({options.events:,} eventos, semilla {options.seed})")
+    print(f"\n{'memoria':<26}{'bytes/registro':>16}")
+    print(f"  {'HistoryManager':<24}{plain_size / count:>16,.1f}")
+    print(f"  {'CompactHistoryManager':<24}{compact_size / count:>16,.1f}"
+          f"   ({plain_size / compact_size:.1f}x menos)")
+    storage = tiered.get_storage_stats()
+    tiered_size = tiered.memory_bytes()
+    print(f"  {'TieredHistoryManager':<24}{tiered_size / count:>16,.1f}"
+          f"   ({tiered_size / 1024:,.0f} KiB: {storage['hot_records']:,} en memoria; "
+          f"{storage['disk_bytes'] / max(storage['spilled_records'], 1):,.1f} bytes/registro"
+          f" en {storage['segments']} segmento(s))")
+    tiered.close()
+
+    stats = {"sum": count}
+    with tempfile.TemporaryDirectory() as directory:
+        sizes = {}
+        for extension in (".json", ".txt", ".chist"):
+            path = os.path.join(directory, f"historial{extension}")
+            FileManager().save(path, plain.get_all_records(), stats)
+            sizes[extension] = os.path.getsize(path)
+        loaded, _ = FileManager.load_compact(os.path.join(directory, "historial.chist"))
+        same = same and [(r["expression"], repr(r["result"])) for r in loaded] == [
+            (e, repr(r)) for e, r, _ in session
+        ]
+
+    print(f"\n{'disco':<26}{'bytes/registro':>16}")
+    for extension, size in sizes.items():
+        ratio = "" if extension == ".chist" else f"   ({size / sizes['.chist']:.1f}x el .chist)"
+        print(f"  {extension:<24}{size / count:>16,.1f}{ratio}")
+
+    print(f"\nagregar (compacto): {append_s / count * 1e9:,.0f} ns/registro; "
+          f"decodificar todo: {decode_s / count * 1e9:,.0f} ns/registro")
+    print(f"recorrer al revés (por niveles): {reverse_s / count * 1e9:,.0f} ns/registro")
+    print(f"registros idénticos tras decodificar: {'sí' if same else 'NO'}")
+    if not same:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# =============================================================================
+# Benchmark: memoria por ventana adicional en un solo proceso
+# =============================================================================
+#
+# Abre N calculadoras sobre una única raíz Tk (como calculator_main con
+# CALC_WINDOWS=N) y mide cuánto crece la memoria con cada ventana extra.
+# Requiere un display (en servidores: xvfb-run python -m ...).
+#
+#   python -m benchmarks.bench_multi_window --windows 10
+# =============================================================================
+
+import argparse
+import os
+import resource
+import tkinter as tk
+import tracemalloc
+
+from calculator_main import create_calculator
+from controllers.component_pool import ComponentPool
+
+
+def rss_bytes() -> int:
+    """Memoria residente actual del proceso (pico si no hay /proc)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # ru_maxrss está en KiB en Linux y en bytes en macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run(windows: int) -> list[tuple[int, int, int]]:
+    """Retorna (ventanas, rss, bytes Python) tras abrir cada ventana."""
+    tracemalloc.start()
+    root = tk.Tk()
+    pool = ComponentPool.shared()
+    samples = []
+
+    controllers = []
+    for index in range(windows):
+        window = root if index == 0 else tk.Toplevel(root)
+        controller = create_calculator(window, pool)
+        controller.initialize()
+        controllers.append(controller)
+        root.update()
+
+        current, _ = tracemalloc.get_traced_memory()
+        samples.append((index + 1, rss_bytes(), current))
+
+    root.destroy()
+    tracemalloc.stop()
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Memoria por ventana adicional en un solo proceso."
+    )
+    parser.add_argument("--windows", type=int, default=10)
+    options = parser.parse_args()
+
+    samples = run(options.windows)
+    print(f"{'ventanas':>9}{'RSS MiB':>10}{'Δ RSS KiB':>11}{'Python KiB':>12}")
+    previous = None
+    for count, rss, py_bytes in samples:
+        delta = "" if previous is None else f"{(rss - previous) / 1024:,.0f}"
+        print(f"{count:>9}{rss / 2**20:>10.1f}{delta:>11}{py_bytes / 1024:>12,.0f}")
+        previous = rss
+
+    if len(samples) > 1:
+        first, last = samples[0], samples[-1]
+        extra = len(samples) - 1
+        print(
+            f"\nPor ventana adicional: "
+            f"{(last[1] - first[1]) / extra / 1024:,.0f} KiB RSS, "
+            f"{(last[2] - first[2]) / extra / 1024:,.0f} KiB Python"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# =============================================================================
+# Benchmark: historial compartido entre procesos
+# =============================================================================
+#
+# P procesos agregan M registros cada uno al mismo SharedHistorySegment y
+# el proceso padre los agrega sin serializar nada. Verifica que no falte
+# ningún registro y reporta registros agregados por segundo.
+#
+#   python -m benchmarks.bench_shared_history --processes 8 --records 100000
+# =============================================================================
+
+import argparse
+import multiprocessing
+import sys
+import time
+
+from models.shared_history import SharedHistorySegment
+
+
+def writer(name: str, lock, index: int, records: int) -> None:
+    segment = SharedHistorySegment.attach(name, lock)
+    try:
+        for i in range(records):
+            segment.append("+", float(index), float(i), float(index + i))
+    finally:
+        segment.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Historial en memoria compartida.")
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument("--records", type=int, default=50_000,
+                        help="registros por proceso")
+    options = parser.parse_args()
+
+    total = options.processes * options.records
+    segment = SharedHistorySegment.create(total)
+    try:
+        procs = [
+            multiprocessing.Process(
+                target=writer,
+                args=(segment.name, segment.lock, n, options.records),
+            )
+            for n in range(options.processes)
+        ]
+        start = time.perf_counter()
+        for p in procs:
+            p.start()
+        for p in procs:
+            p.join()
+        write_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        summary = segment.aggregate()
+        read_s = time.perf_counter() - start
+
+        expected_sum = sum(
+            float(n + i)
+            for n in range(options.processes)
+            for i in range(options.records)
+        )
+        ok = summary["count"] == total and summary["sum"] == expected_sum
+        print(
+            f"{options.processes} procesos × {options.records} registros\n"
+            f"  escritura: {total / write_s:,.0f} registros/s\n"
+            f"  lectura:   {total / read_s:,.0f} registros/s\n"
+            f"  conteo {summary['count']} / {total}  {'OK' if ok else 'ERROR'}"
+        )
+    finally:
+        segment.close()
+        segment.unlink()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,465 @@
+# =============================================================================
+# Benchmark: suite de micro-benchmarks de los caminos calientes
+# =============================================================================
+#
+# Mide con timeit los modelos, servicios, utilidades y el bucle de teclas del
+# controlador (con HeadlessView, sin display). Los resultados se guardan en
+# JSON y `compare` los contrasta con una línea base guardada.
+#
+#   python -m benchmarks.bench_suite run -o actual.json
+#   python -m benchmarks.bench_suite run --quick --filter history
+#   python -m benchmarks.bench_suite compare base.json actual.json --threshold 0.10
+#
+# `compare` termina con código 1 si algún benchmark empeora más que el umbral.
+# =============================================================================
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import timeit
+
+from controllers.calculator_controller import CalculatorController
+from models.compact_history import CompactHistoryManager
+from models.history_manager import HistoryManager
+from models.input_accumulator import InputAccumulator
+from models.tiered_history import TieredHistoryManager
+from models.math_engine import MathEngine
+from models.numeric_backend import NumericBackend
+from models.scientific_operations import ScientificOperations
+from models.statistics_reporter import StatisticsReporter
+from services.file_manager import FileManager
+from utils.input_validator import InputValidator
+from utils.number_formatter import NumberFormatter
+from views.headless_view import HeadlessView
+
+try:
+    import numpy
+except ImportError:  # Sin NumPy se omiten los casos de arreglos
+    numpy = None
+
+HISTORY_SIZES = (10**3, 10**4, 10**5, 10**6)
+QUICK_HISTORY_SIZES = (10**3, 10**4)
+REDUCE_SIZE = 10**6
+QUICK_REDUCE_SIZE = 10**4
+FORMAT_MANY_SIZE = 10**6
+QUICK_FORMAT_MANY_SIZE = 10**4
+NUMERIC_MODES = ("float", "decimal:28", "decimal:50", "fraction")
+
+# Teclas de una sesión típica: operandos, operadores, "=", borrar y limpiar
+KEYSTROKES = [
+    ("1", "1"), ("2", "2"), (".", "period"), ("5", "5"), ("+", "plus"),
+    ("3", "3"), ("4", "4"), ("=", "equal"), ("*", "asterisk"), ("2", "2"),
+    ("", "Return"), ("9", "9"), ("", "BackSpace"), ("-", "minus"), ("7", "7"),
+    ("", "Return"), ("", "Delete"),
+]
+
+
+# =============================================================================
+#  Casos: cada uno retorna (función sin argumentos, operaciones por llamada)
+# =============================================================================
+
+def case_math(operator: str):
+    engine = MathEngine()
+    return lambda: engine.calculate(operator, 1234.5678, 98.76), 1
+
+
+def case_reduce(operator: str, size: int):
+    engine = MathEngine()
+    values = [1.0 + i * 1e-6 for i in range(size)]
+    return lambda: engine.reduce(operator, values), size
+
+
+def case_pairwise(operator: str, size: int):
+    """Línea base de case_reduce: una llamada a calculate por elemento."""
+    engine = MathEngine()
+    values = [1.0 + i * 1e-6 for i in range(size)]
+
+    def fold():
+        result = values[0]
+        for value in values[1:]:
+            result = engine.calculate(operator, result, value)
+        return result
+
+    return fold, size
+
+
+def case_scientific(name: str):
+    fn = getattr(ScientificOperations(), name)
+    if name == "get_pi":
+        return fn, 1
+    return lambda: fn(1234.5678), 1
+
+
+def case_format(value):
+    formatter = NumberFormatter()
+    return lambda: formatter.format(value), 1
+
+
+def format_values(kind: str, size: int) -> list:
+    """Resultados típicos: la mitad enteros; "repeated" con 1000 distintos."""
+    if kind == "repeated":
+        return [(i % 1000) * 0.5 for i in range(size)]
+    return [i * 0.5 + (i % 7) * 1e-3 for i in range(size)]
+
+
+def case_format_many(kind: str, size: int):
+    formatter = NumberFormatter()
+    values = format_values(kind, size)
+    return lambda: formatter.format_many(values), size
+
+
+def case_format_loop(kind: str, size: int):
+    """Línea base de case_format_many: formateo sin caché por elemento."""
+    format_one = NumberFormatter._format_uncached
+    values = format_values(kind, size)
+    return lambda: [format_one(value) for value in values], size
+
+
+def case_format_array(kind: str, size: int):
+    """
+    format_many sobre un arreglo float de NumPy (camino vectorizado). Antes
+    de medir se compara una vez con el formateo elemento a elemento.
+    """
+    formatter = NumberFormatter()
+    values = format_values(kind, size) + [-0.0, 1e300, -2.5e-7, float("inf")]
+    array = numpy.array(values)
+    if formatter.format_many(array) != NumberFormatter._format_list(values):
+        raise RuntimeError("format_many(ndarray) difiere de format() por elemento")
+    return lambda: formatter.format_many(array), len(values)
+
+
+def case_backspace(size: int):
+    """Backspace sobre un número de `size` dígitos (no depende del largo)."""
+    accumulator = InputAccumulator().append("1" * (size // 2) + "." + "7" * (size // 2))
+    return accumulator.backspace, 1
+
+
+def case_parse(text: str):
+    validator = InputValidator()
+    return lambda: validator.parse_number(text), 1
+
+
+def filled_history(size: int, history_class=HistoryManager) -> HistoryManager:
+    history = history_class()
+    for i in range(size):
+        history.add_record(f"{i} + 1", i + 1)
+    return history
+
+
+def case_history_add(size: int, history_class=HistoryManager):
+    history = filled_history(size, history_class)
+    return lambda: history.add_record("2 + 2", 4), 1
+
+
+def case_history_reversed(size: int):
+    history = filled_history(size)
+    return history.get_records_reversed, 1
+
+
+def case_report(results_count: int):
+    stats = StatisticsReporter()
+    for operator in "+-*/" * 25:
+        stats.record_operation(operator)
+    results = [float(i) for i in range(results_count)]
+    cache_stats = {"hits": 10, "disk_hits": 2, "misses": 5,
+                   "entries": 13, "bytes": 4096}
+    return lambda: stats.generate_report(results, cache_stats), 1
+
+
+def case_record_operation(windowed: bool):
+    """
+    Camino caliente de las estadísticas. Con windowed=True se muestrea cada
+    1000 operaciones (una muestra por segundo equivale a mucho menos): el
+    costo de las ventanas repartido por operación.
+    """
+    stats = StatisticsReporter()
+    operators = "+-*/" * 250
+    record = stats.record_operation
+
+    def loop():
+        for operator in operators:
+            record(operator)
+        if windowed:
+            stats.sample_rates()
+
+    return loop, len(operators)
+
+
+def case_rates_report():
+    stats = StatisticsReporter()
+    for _ in range(60):
+        for operator in "+-*/" * 25:
+            stats.record_operation(operator)
+        stats.sample_rates()
+    return stats.get_rates, 1
+
+
+def case_file_save(extension: str, directory: str):
+    history = filled_history(1000).get_all_records()
+    stats = {"sum": 250, "sub": 250, "mul": 250, "div": 250, "sci": 0}
+    path = os.path.join(directory, f"history{extension}")
+    manager = FileManager()
+    return lambda: manager.save(path, history, stats), 1
+
+
+def case_numeric_calculate(mode: str, operator: str):
+    backend = NumericBackend.from_spec(mode)
+    engine = MathEngine(backend)
+    a, b = backend.parse("1234.5678"), backend.parse("98.76")
+    return lambda: engine.calculate(operator, a, b), 1
+
+
+def case_numeric_square_root(mode: str):
+    backend = NumericBackend.from_spec(mode)
+    fn = ScientificOperations(backend).square_root
+    value = backend.parse("1234.5678")
+    return lambda: fn(value), 1
+
+
+def case_numeric_format(mode: str):
+    backend = NumericBackend.from_spec(mode)
+    value = MathEngine(backend).divide(backend.parse("1"), backend.parse("7"))
+    formatter = NumberFormatter()
+    return lambda: formatter.format(value), 1
+
+
+def case_numeric_parse(mode: str):
+    parse = NumericBackend.from_spec(mode).parse
+    validator = InputValidator()
+    return lambda: validator.parse_number("3.14159", parse), 1
+
+
+def case_keystrokes(mode: str = None):
+    controller = CalculatorController(HeadlessView())
+    if mode is not None:
+        controller.set_numeric_backend(NumericBackend.from_spec(mode))
+    controller.initialize()
+    dispatch = controller.dispatch_key
+
+    def loop():
+        for char, keysym in KEYSTROKES:
+            dispatch(char, keysym)
+
+    return loop, len(KEYSTROKES)
+
+
+def case_cached_scientific(handler: str):
+    """
+    √ o % repetido sobre el mismo valor en modo float: desde la segunda vez
+    lo resuelve el ResultCache. Antes de medir se verifica que el caché
+    registre el acierto.
+    """
+    controller = CalculatorController(HeadlessView())
+    controller.initialize()
+    apply = getattr(controller, handler)
+
+    def once():
+        controller.on_clear()
+        controller.on_digit("1")
+        controller.on_digit("6")
+        apply()
+
+    once()
+    hits = controller.cache.get_stats()["hits"]
+    once()
+    if controller.cache.get_stats()["hits"] != hits + 1:
+        raise RuntimeError(f"{handler} repetido no acierta en el ResultCache")
+    return once, 1
+
+
+def build_cases(quick: bool, directory: str) -> dict:
+    """Nombre del benchmark → fábrica (se prepara solo si se ejecuta)."""
+    cases = {}
+    for operator in "+-*/":
+        cases[f"math.calculate[{operator}]"] = lambda o=operator: case_math(o)
+    reduce_size = QUICK_REDUCE_SIZE if quick else REDUCE_SIZE
+    for operator in "+*":
+        cases[f"math.reduce[{operator},{reduce_size}]"] = (
+            lambda o=operator: case_reduce(o, reduce_size)
+        )
+        cases[f"math.pairwise[{operator},{reduce_size}]"] = (
+            lambda o=operator: case_pairwise(o, reduce_size)
+        )
+    for name in ("square_root", "square", "percentage", "negate", "get_pi"):
+        cases[f"scientific.{name}"] = lambda n=name: case_scientific(n)
+    for label, value in (("int", 42.0), ("float", 3.14159265), ("large", 1.5e300)):
+        cases[f"formatter.format[{label}]"] = lambda v=value: case_format(v)
+    format_size = QUICK_FORMAT_MANY_SIZE if quick else FORMAT_MANY_SIZE
+    for kind in ("distinct", "repeated"):
+        cases[f"formatter.format_many[{kind},{format_size}]"] = (
+            lambda k=kind: case_format_many(k, format_size)
+        )
+        cases[f"formatter.format_loop[{kind},{format_size}]"] = (
+            lambda k=kind: case_format_loop(k, format_size)
+        )
+        if numpy is not None:
+            cases[f"formatter.format_many[ndarray,{kind},{format_size}]"] = (
+                lambda k=kind: case_format_array(k, format_size)
+            )
+    for size in (10, 10**5):
+        cases[f"input.backspace[{size}]"] = lambda s=size: case_backspace(s)
+    for label, text in (("int", "12345"), ("float", "3.14159"), ("invalid", "1.2.3")):
+        cases[f"validator.parse_number[{label}]"] = lambda t=text: case_parse(t)
+    for size in QUICK_HISTORY_SIZES if quick else HISTORY_SIZES:
+        cases[f"history.add_record[{size}]"] = lambda s=size: case_history_add(s)
+        cases[f"history.add_record[compact,{size}]"] = (
+            lambda s=size: case_history_add(s, CompactHistoryManager)
+        )
+        cases[f"history.add_record[tiered,{size}]"] = (
+            lambda s=size: case_history_add(
+                s, lambda: TieredHistoryManager(directory=directory)
+            )
+        )
+        cases[f"history.get_records_reversed[{size}]"] = (
+            lambda s=size: case_history_reversed(s)
+        )
+    cases["statistics.generate_report[1000]"] = lambda: case_report(1000)
+    cases["statistics.record_operation"] = lambda: case_record_operation(False)
+    cases["statistics.record_operation[sampled]"] = lambda: case_record_operation(True)
+    cases["statistics.get_rates"] = case_rates_report
+    cases["file_manager.save[json]"] = lambda: case_file_save(".json", directory)
+    cases["file_manager.save[txt]"] = lambda: case_file_save(".txt", directory)
+    cases["file_manager.save[chist]"] = lambda: case_file_save(".chist", directory)
+    cases["controller.keystroke"] = case_keystrokes
+    cases["controller.cached[sqrt]"] = lambda: case_cached_scientific("on_sqrt")
+    cases["controller.cached[percentage]"] = lambda: case_cached_scientific("on_percentage")
+    for mode in NUMERIC_MODES:
+        for operator in "+/":
+            cases[f"numeric.calculate[{mode},{operator}]"] = (
+                lambda m=mode, o=operator: case_numeric_calculate(m, o)
+            )
+        cases[f"numeric.square_root[{mode}]"] = lambda m=mode: case_numeric_square_root(m)
+        cases[f"numeric.format[{mode}]"] = lambda m=mode: case_numeric_format(m)
+        cases[f"numeric.parse[{mode}]"] = lambda m=mode: case_numeric_parse(m)
+        cases[f"numeric.keystroke[{mode}]"] = lambda m=mode: case_keystrokes(m)
+    return cases
+
+
+# =============================================================================
+#  Ejecución y comparación
+# =============================================================================
+
+def measure(fn, ops_per_call: int, repeat: int, min_time: float) -> dict:
+    """
+    Calibra el número de llamadas para que cada repetición dure al menos
+    min_time y reporta nanosegundos por operación (mínimo y mediana).
+    """
+    timer = timeit.Timer(fn)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2 if number < 10 else 10
+    runs = timer.repeat(repeat=repeat, number=number)
+    per_op = [t / (number * ops_per_call) * 1e9 for t in runs]
+    return {
+        "ns_per_op": min(per_op),
+        "median_ns": statistics.median(per_op),
+        "calls": number,
+        "repeat": repeat,
+    }
+
+
+def run_suite(quick: bool = False, name_filter: str = None, repeat: int = 5,
+              min_time: float = 0.05, verbose: bool = True) -> dict:
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, factory in build_cases(quick, directory).items():
+            if name_filter and name_filter not in name:
+                continue
+            fn, ops = factory()
+            results[name] = measure(fn, ops, repeat, min_time)
+            if verbose:
+                print(f"  {name:<42} {results[name]['ns_per_op']:>14,.1f} ns/op",
+                      file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> list[dict]:
+    """Filas (nombre, base, actual, cambio relativo, regresión) en común."""
+    rows = []
+    for name, base in baseline["results"].items():
+        if name not in current["results"]:
+            continue
+        before = base["ns_per_op"]
+        after = current["results"][name]["ns_per_op"]
+        change = (after - before) / before if before else 0.0
+        rows.append({
+            "name": name,
+            "baseline_ns": before,
+            "current_ns": after,
+            "change": change,
+            "regression": change > threshold,
+        })
+    return rows
+
+
+def print_comparison(rows: list[dict], threshold: float) -> None:
+    print(f"{'benchmark':<42} {'base ns':>12} {'actual ns':>12} {'cambio':>9}")
+    for row in rows:
+        flag = "  ← REGRESIÓN" if row["regression"] else ""
+        print(f"{row['name']:<42} {row['baseline_ns']:>12,.1f} "
+              f"{row['current_ns']:>12,.1f} {row['change']:>+8.1%}{flag}")
+    regressions = sum(row["regression"] for row in rows)
+    print(f"\n{regressions} regresiones (umbral {threshold:.0%}) "
+          f"de {len(rows)} benchmarks comparados")
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Suite de benchmarks de la calculadora."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="ejecuta la suite")
+    run.add_argument("-o", "--output", help="archivo JSON de resultados")
+    run.add_argument("--quick", action="store_true",
+                     help="historiales de hasta 10^4 registros")
+    run.add_argument("--filter", help="solo benchmarks cuyo nombre contenga esto")
+    run.add_argument("--repeat", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.05,
+                     help="segundos mínimos por repetición")
+
+    cmp = commands.add_parser("compare", help="compara contra una línea base")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=0.10,
+                     help="empeoramiento relativo tolerado (0.10 = 10%%)")
+
+    options = parser.parse_args()
+
+    if options.command == "run":
+        report = run_suite(options.quick, options.filter,
+                           options.repeat, options.min_time)
+        text = json.dumps(report, indent=2)
+        if options.output:
+            with open(options.output, "w", encoding="utf-8") as f:
+                f.write(text + "\n")
+        else:
+            print(text)
+        return
+
+    rows = compare(load(options.baseline), load(options.current), options.threshold)
+    print_comparison(rows, options.threshold)
+    sys.exit(1 if any(row["regression"] for row in rows) else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+# =============================================================================
+# Benchmark: cliente de carga y throughput del servidor JSON-RPC
+# =============================================================================
+#
+# Lanza el servidor en el mismo proceso (o se conecta a uno existente con
+# --connect) y abre N conexiones concurrentes, cada una enviando M peticiones.
+# Reporta peticiones por segundo y latencias p50 / p99 / máx.
+#
+#   python -m benchmarks.rpc_load_test --clients 2000 --requests 50
+#   python -m benchmarks.rpc_load_test --connect 127.0.0.1:8765
+#   python -m benchmarks.rpc_load_test --unix /tmp/calc.sock
+# =============================================================================
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import resource
+import tempfile
+import time
+
+from services.rpc_server import CalculationServer
+from services.session_pool import SessionPool
+
+
+class RpcClient:
+    """Cliente JSON-RPC mínimo (una línea por mensaje) para pruebas de carga."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+
+    @classmethod
+    async def connect(cls, host: str = None, port: int = None,
+                      unix_path: str = None) -> "RpcClient":
+        if unix_path:
+            reader, writer = await asyncio.open_unix_connection(unix_path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def call(self, method: str, *params):
+        """Envía una petición y espera su respuesta. Lanza RuntimeError si falla."""
+        request = {"jsonrpc": "2.0", "id": next(self._ids),
+                   "method": method, "params": list(params)}
+        self._writer.write((json.dumps(request) + "\n").encode())
+        reply = json.loads(await self._reader.readline())
+        if "error" in reply:
+            raise RuntimeError(reply["error"]["message"])
+        return reply["result"]
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+def random_request(rng: random.Random) -> tuple:
+    """Mezcla de operaciones parecida a la de la interfaz."""
+    roll = rng.random()
+    a, b = rng.uniform(1, 1000), rng.uniform(1, 1000)
+    if roll < 0.7:
+        return "calculate", rng.choice("+-*/"), a, b
+    if roll < 0.85:
+        return rng.choice(("sqrt", "square", "percentage")), a
+    if roll < 0.95:
+        return "memory.add", a
+    return "history.count",
+
+
+async def client_worker(address: dict, requests: int, seed: int,
+                        latencies: list) -> None:
+    rng = random.Random(seed)
+    client = await RpcClient.connect(**address)
+    clock = time.perf_counter
+    try:
+        for _ in range(requests):
+            method, *params = random_request(rng)
+            t0 = clock()
+            await client.call(method, *params)
+            latencies.append(clock() - t0)
+    finally:
+        await client.close()
+
+
+async def run_load(address: dict, clients: int, requests: int) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client_worker(address, requests, seed, latencies)
+        for seed in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "clients": clients,
+        "requests": count,
+        "elapsed_s": elapsed,
+        "requests_per_second": count / elapsed,
+        "p50_ms": latencies[count // 2] * 1000,
+        "p99_ms": latencies[min(count - 1, int(count * 0.99))] * 1000,
+        "max_ms": latencies[-1] * 1000,
+    }
+
+
+def raise_open_file_limit() -> None:
+    """Miles de conexiones (cliente + servidor) necesitan muchos descriptores."""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if hard == resource.RLIM_INFINITY or soft < hard:
+        target = hard if hard != resource.RLIM_INFINITY else 65536
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+
+
+async def main_async(options) -> dict:
+    server = None
+    if options.connect:
+        host, port = options.connect.rsplit(":", 1)
+        address = {"host": host, "port": int(port)}
+    else:
+        server = CalculationServer(SessionPool())
+        if options.unix:
+            await server.start(unix_path=options.unix)
+            address = {"unix_path": options.unix}
+        else:
+            await server.start("127.0.0.1", 0)
+            address = {"host": "127.0.0.1", "port": server.addresses()[0][1]}
+
+    try:
+        report = await run_load(address, options.clients, options.requests)
+    finally:
+        if server is not None:
+            report_pool = server.pool.get_stats_dict()
+            await server.close()
+    if server is not None:
+        report["pool"] = report_pool
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Prueba de carga del servidor JSON-RPC."
+    )
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=100,
+                        help="peticiones por cliente")
+    parser.add_argument("--connect", help="host:puerto de un servidor existente")
+    parser.add_argument("--unix", nargs="?", const="",
+                        help="usar socket Unix (ruta opcional)")
+    parser.add_argument("--json", action="store_true")
+    options = parser.parse_args()
+
+    if options.unix == "":
+        options.unix = os.path.join(tempfile.mkdtemp(), "calc.sock")
+
+    raise_open_file_limit()
+    report = asyncio.run(main_async(options))
+
+    if options.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"{report['clients']} clientes, {report['requests']} peticiones "
+            f"en {report['elapsed_s']:.2f} s\n"
+            f"  {report['requests_per_second']:,.0f} peticiones/s\n"
+            f"  latencia p50 {report['p50_ms']:.2f} ms, "
+            f"p99 {report['p99_ms']:.2f} ms, máx {report['max_ms']:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
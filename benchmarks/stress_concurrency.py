@@ -0,0 +1,273 @@
+# =============================================================================
+# Prueba de estrés: contadores, memoria e historial bajo 32 hilos
+# =============================================================================
+#
+# Cada hilo registra operaciones, suma a memoria y agrega al historial, y
+# luego se repiten el registro con un hilo que llama reset() en medio y el
+# agregado al historial con un hilo que deshace y rehace en medio.
+# Verifica que las variantes concurrentes no pierdan ningún incremento y
+# muestra, a modo de comparación, lo que ocurre con las clases originales.
+# Termina con código 1 si alguna variante concurrente pierde datos.
+#
+#   python -m benchmarks.stress_concurrency --threads 32 --iterations 20000
+# =============================================================================
+
+import argparse
+import sys
+import threading
+import time
+
+from models.statistics_reporter import StatisticsReporter
+from models.memory_manager import MemoryManager
+from models.history_manager import HistoryManager
+from models.sharded_statistics import ShardedStatisticsReporter
+from models.atomic_memory import AtomicMemoryManager
+from models.concurrent_history import ConcurrentHistoryManager
+from models.operator_registry import OperatorRegistry
+
+
+def hammer(stats, memory, history, threads: int, iterations: int) -> float:
+    """Lanza los hilos simultáneamente y retorna el tiempo transcurrido."""
+    barrier = threading.Barrier(threads)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        for i in range(iterations):
+            stats.record_operation("+")
+            stats.record_scientific()
+            memory.add(1)
+            if i % 10 == 0:
+                history.add_record(f"{index} + {i}", i)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return time.perf_counter() - start
+
+
+def check(label: str, stats, memory, history, threads: int, iterations: int) -> bool:
+    # Intervalo de cambio de hilo mínimo: maximiza las intercalaciones
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        elapsed = hammer(stats, memory, history, threads, iterations)
+    finally:
+        sys.setswitchinterval(previous)
+
+    expected = threads * iterations
+    expected_history = threads * len(range(0, iterations, 10))
+    got = stats.get_stats_dict()
+    results = {
+        "sum": (got["sum"], expected),
+        "sci": (got["sci"], expected),
+        "memory": (memory.recall(), expected),
+        "history": (history.count(), expected_history),
+    }
+    ok = all(value == target for value, target in results.values())
+
+    print(f"{label:<14} {elapsed:6.2f} s  {'OK' if ok else 'PÉRDIDAS'}")
+    for name, (value, target) in results.items():
+        lost = target - value
+        print(f"    {name:<8} {value:>10} / {target:<10} perdidos: {lost}")
+    return ok
+
+
+class YieldingKey(str):
+    """
+    Categoría que cede el GIL al calcular su hash: `shard[key] += 1` lo
+    calcula al leer y al escribir, así otro hilo corre en medio del
+    incremento y la carrera con reset() se da en cada vuelta.
+    """
+
+    def __hash__(self):
+        time.sleep(0)
+        return str.__hash__(self)
+
+
+def yielding_registry() -> OperatorRegistry:
+    """Registro con "+" contado en la categoría "sum" vía YieldingKey."""
+    registry = OperatorRegistry()
+    registry.register("+", "add", symbol="+", category=YieldingKey("sum"))
+    return registry
+
+
+def check_reset(label: str, stats, threads: int, iterations: int) -> bool:
+    """
+    Un hilo llama reset() en bucle mientras los demás registran. Tras cada
+    reset la cuenta no puede superar lo iniciado desde justo antes de él,
+    y al final debe caer entre lo iniciado después del último reset y lo
+    no terminado antes de él: un reset pisado por un `+= 1` o un
+    incremento perdido la sacan de ese rango.
+    """
+    started = [0] * threads
+    done = [0] * threads
+    running = threading.Event()
+    running.set()
+    bounds = [0, 0]
+    violations = [0]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        for i in range(iterations):
+            started[index] = i + 1
+            stats.record_operation("+")
+            done[index] = i + 1
+
+    def resetter() -> None:
+        barrier.wait()
+        while running.is_set():
+            before = sum(done)
+            stats.reset()
+            bounds[:] = before, sum(started)
+            # Justo después del reset solo puede haber lo iniciado desde antes
+            if stats.get_stats_dict()["sum"] > sum(started) - before:
+                violations[0] += 1
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    reset_thread = threading.Thread(target=resetter)
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        reset_thread.start()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        running.clear()
+        reset_thread.join()
+    finally:
+        sys.setswitchinterval(previous)
+
+    issued = threads * iterations
+    low, high = issued - bounds[1], issued - bounds[0]
+    got = stats.get_stats_dict()["sum"]
+    ok = low <= got <= high and not violations[0]
+    print(f"{label:<14} reset   {'OK' if ok else 'PÉRDIDAS'}")
+    print(f"    sum      {got:>10}   esperado entre {low} y {high}")
+    print(f"    resets perdidos: {violations[0]}")
+    return ok
+
+
+class YieldingRedo:
+    """
+    Mezcla para historiales: leer la pila de rehacer cede el GIL, así un
+    rewind() de otro hilo corre entre el append de add_record() y el
+    descarte de esa pila.
+    """
+
+    @property
+    def _rewound(self):
+        time.sleep(0)
+        return self.__dict__["_yielding_rewound"]
+
+    @_rewound.setter
+    def _rewound(self, value):
+        self.__dict__["_yielding_rewound"] = value
+
+
+class YieldingHistory(YieldingRedo, HistoryManager):
+    """HistoryManager original que además cuenta lo que descarta add_record."""
+
+    redo_discarded = 0
+
+    def add_record(self, expression: str, result: float) -> None:
+        self.redo_discarded += len(self._rewound)
+        super().add_record(expression, result)
+
+
+class YieldingConcurrentHistory(YieldingRedo, ConcurrentHistoryManager):
+    pass
+
+
+def check_rewind(label: str, history, threads: int, iterations: int) -> bool:
+    """
+    Un hilo deshace y rehace en bucle mientras los demás agregan. Todo
+    registro agregado termina en el historial o descartado por un agregado
+    posterior (redo_discarded): uno que su propio add_record() vacía de la
+    pila de rehacer se pierde sin contarse.
+    """
+    running = threading.Event()
+    running.set()
+    errors = [0]
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(index: int) -> None:
+        barrier.wait()
+        for i in range(iterations):
+            history.add_record(f"{index} + {i}", i)
+
+    def rewinder() -> None:
+        barrier.wait()
+        while running.is_set():
+            try:
+                history.rewind(max(history.count() - 1, 0))
+                history.rewind(history.count() + 1)
+            except IndexError:
+                # rewind() sin lock puede sacar de una lista ya vaciada
+                errors[0] += 1
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    rewind_thread = threading.Thread(target=rewinder)
+    previous = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        rewind_thread.start()
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        running.clear()
+        rewind_thread.join()
+    finally:
+        sys.setswitchinterval(previous)
+
+    history.rewind(threads * iterations)  # rehace lo que quedó deshecho
+    added = threads * iterations
+    kept, discarded = history.count(), history.redo_discarded
+    lost = added - kept - discarded
+    ok = lost == 0 and not errors[0]
+    print(f"{label:<14} rewind  {'OK' if ok else 'PÉRDIDAS'}")
+    print(f"    history  {kept:>10} + {discarded} descartados / {added:<10} perdidos: {lost}")
+    print(f"    rewind() con error: {errors[0]}")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Estrés concurrente de los modelos.")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    parser.add_argument("--skip-baseline", action="store_true",
+                        help="no ejecutar las clases originales")
+    options = parser.parse_args()
+    # Con YieldingKey / YieldingRedo cada operación cede el GIL: menos vueltas
+    reset_iterations = max(1, options.iterations // 10)
+    rewind_iterations = max(1, options.iterations // 100)
+
+    if not options.skip_baseline:
+        check("original", StatisticsReporter(), MemoryManager(), HistoryManager(),
+              options.threads, options.iterations)
+        check_reset("original", StatisticsReporter(yielding_registry()),
+                    options.threads, reset_iterations)
+        check_rewind("original", YieldingHistory(), options.threads, rewind_iterations)
+
+    ok = check(
+        "concurrente",
+        ShardedStatisticsReporter(),
+        AtomicMemoryManager(),
+        ConcurrentHistoryManager(),
+        options.threads,
+        options.iterations,
+    )
+    ok &= check_reset("concurrente", ShardedStatisticsReporter(yielding_registry()),
+                      options.threads, reset_iterations)
+    ok &= check_rewind("concurrente", YieldingConcurrentHistory(),
+                       options.threads, rewind_iterations)
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
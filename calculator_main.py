@@ -1,22 +1,157 @@
+import os
 import tkinter as tk
 
 from utils.theme_manager import ThemeManager
 from views.calculator_view import CalculatorView
 from controllers.calculator_controller import CalculatorController
+from controllers.component_pool import ComponentPool
+from services.session_recorder import SessionRecorder
+from services.handler_timer import HandlerTimer
+from services.memory_profiler import MemoryProfiler
+from services.chrome_tracer import ChromeTracer
+from services.metrics_exporter import MetricsExporter
+from models.numeric_backend import NumericBackend
+from models.compact_history import CompactHistoryManager
+from models.tiered_history import TieredHistoryManager
+from utils.clock import Clock
 
 
-def main():
-    """Punto de entrada: crea la ventana, la vista, el controlador e inicia."""
-    window = tk.Tk()
-
+def create_calculator(window, pool: ComponentPool) -> CalculatorController:
+    """Crea la vista y el controlador de una ventana de calculadora."""
     theme = ThemeManager()
     colors = theme.get_colors()
 
     view = CalculatorView(window, colors)
-    controller = CalculatorController(view)
-    controller.initialize()
+    return CalculatorController(view, pool)
+
+
+def main(windows: int = None):
+    """
+    Punto de entrada: crea las ventanas, vistas y controladores e inicia.
+
+    Todas las ventanas comparten una única raíz Tk y un ComponentPool;
+    cada una conserva su propio estado (memoria, historial, estadísticas).
+    La cantidad se toma de CALC_WINDOWS si no se indica (por defecto 1).
+    """
+    if windows is None:
+        windows = int(os.environ.get("CALC_WINDOWS", "1"))
+
+    # CALC_MEMORY_PROFILE=directorio activa tracemalloc desde antes de crear
+    # las ventanas; CALC_MEMORY_INTERVAL fija los segundos entre snapshots
+    profiler = None
+    profile_dir = os.environ.get("CALC_MEMORY_PROFILE")
+    if profile_dir:
+        profiler = MemoryProfiler(
+            profile_dir,
+            interval_s=float(os.environ.get("CALC_MEMORY_INTERVAL", "60")),
+            histories=lambda: [c.history for c in controllers],
+        )
+        profiler.start()
+
+    # CALC_PRECISE_TIMESTAMPS=1 muestra y exporta fecha y microsegundos
+    # en el historial (por defecto solo "%H:%M:%S")
+    if os.environ.get("CALC_PRECISE_TIMESTAMPS") == "1":
+        Clock.set_shared(Clock(precise=True))
+
+    root = tk.Tk()
+
+    # CALC_CACHE_PATH=ruta habilita el nivel en disco del caché de resultados
+    pool = ComponentPool(cache_path=os.environ.get("CALC_CACHE_PATH"))
+    ComponentPool.set_shared(pool)
+
+    controllers = []
+    for index in range(max(1, windows)):
+        window = root if index == 0 else tk.Toplevel(root)
+        controllers.append(create_calculator(window, pool))
+
+    # CALC_NUMERIC_MODE=decimal:50 (o fraction) cambia el tipo numérico de
+    # todas las ventanas; por defecto float
+    numeric_mode = os.environ.get("CALC_NUMERIC_MODE")
+    if numeric_mode:
+        for controller in controllers:
+            controller.set_numeric_backend(NumericBackend.from_spec(numeric_mode))
+
+    # CALC_HISTORY_MODE=compact guarda el historial en bloques codificados
+    # (símbolos internados, marcas delta) en lugar de un dict por registro;
+    # tiered[:N] deja en memoria los últimos N (10000) y vuelca el resto a
+    # segmentos en disco, dentro de CALC_HISTORY_DIR (o del directorio temporal)
+    history_mode, _, hot_size = os.environ.get("CALC_HISTORY_MODE", "").partition(":")
+    for controller in controllers:
+        if history_mode == "compact":
+            controller.history = CompactHistoryManager()
+        elif history_mode == "tiered":
+            controller.history = TieredHistoryManager(
+                int(hot_size) if hot_size else TieredHistoryManager.HOT_SIZE,
+                os.environ.get("CALC_HISTORY_DIR"),
+            )
+
+    # CALC_RECORD_SESSION=ruta graba la sesión de la primera ventana
+    recorder = None
+    record_path = os.environ.get("CALC_RECORD_SESSION")
+    if record_path:
+        recorder = SessionRecorder(record_path)
+        recorder.attach(controllers[0])
+
+    # CALC_LATENCY_DUMP=ruta.json mide la latencia de cada handler (todas las
+    # ventanas) y la vuelca al salir; CALC_METRICS_PORT también la necesita.
+    # Sin ninguna de las dos variables no hay instrumentación
+    timer = None
+    latency_path = os.environ.get("CALC_LATENCY_DUMP")
+    metrics_port = os.environ.get("CALC_METRICS_PORT")
+    if latency_path or metrics_port:
+        timer = HandlerTimer()
+        for controller in controllers:
+            controller.enable_handler_timing(timer)
+
+    # CALC_TRACE=traza.json registra spans en formato Chrome Trace Event
+    # (abrir en Perfetto); F12 pausa / reanuda la traza en cualquier ventana
+    tracer = None
+    trace_path = os.environ.get("CALC_TRACE")
+    if trace_path:
+        tracer = ChromeTracer(trace_path)
+        for controller in controllers:
+            tracer.attach(controller)
+
+    for controller in controllers:
+        controller.initialize()
+        # Ventanas de ritmo del reporte (1 min / 5 min / 1 h): una muestra por
+        # segundo en el bucle de Tk, fuera de record_operation
+        controller.stats.sample_rates_periodically(controller.view.schedule)
+
+    if tracer is not None:
+        for controller in controllers:
+            controller.view.bind_trace_toggle(tracer.toggle)
+        view = controllers[0].view
+        tracer.watch_event_loop(view.schedule, view.schedule_idle)
+
+    if profiler is not None:
+        profiler.sample()
+        profiler.sample_periodically(controllers[0].view.schedule)
+
+    # CALC_METRICS_PORT=9464 publica /metrics (Prometheus) en localhost
+    exporter = None
+    if metrics_port:
+        exporter = MetricsExporter(controllers, pool.logger, timer,
+                                   port=int(metrics_port))
+        exporter.start()
 
-    window.mainloop()
+    try:
+        root.mainloop()
+    finally:
+        for controller in controllers:
+            controller.executor.shutdown()
+            controller.history.close()
+        pool.close()
+        if recorder is not None:
+            recorder.close()
+        if timer is not None and latency_path:
+            timer.dump(latency_path)
+        if profiler is not None:
+            profiler.stop()
+        if tracer is not None:
+            tracer.close()
+        if exporter is not None:
+            exporter.stop()
 
 
 if __name__ == "__main__":
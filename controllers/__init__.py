@@ -1,8 +1,12 @@
 # Paquete controllers: Orquestación entre Vista y Modelos
 # El controlador coordina el flujo sin contener lógica de negocio ni de UI
 
+from controllers.component_pool import ComponentPool
+from controllers.input_event_queue import InputEventQueue
 from controllers.calculator_controller import CalculatorController
 
 __all__ = [
+    "ComponentPool",
+    "InputEventQueue",
     "CalculatorController",
 ]
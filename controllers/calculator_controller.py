@@ -8,19 +8,28 @@
 # etc.) ni lógica de UI (eso está en CalculatorView). Solo COORDINA.
 # =============================================================================
 
-from tkinter import messagebox, filedialog
+from collections import namedtuple
 
+from controllers.component_pool import ComponentPool
+from controllers.input_event_queue import InputEventQueue
 from utils.theme_manager import ThemeManager
-from utils.number_formatter import NumberFormatter
-from utils.input_validator import InputValidator
-from services.error_logger import ErrorLogger
-from models.math_engine import MathEngine
-from models.scientific_operations import ScientificOperations
 from models.memory_manager import MemoryManager
 from models.history_manager import HistoryManager
-from views.history_view import HistoryView
 from services.file_manager import FileManager
+from services.evaluation_executor import EvaluationExecutor
+from services.handler_timer import HandlerTimer
 from models.statistics_reporter import StatisticsReporter
+from models.undo_manager import UndoManager
+from models.input_accumulator import InputAccumulator
+from models.math_engine import MathEngine
+from models.scientific_operations import ScientificOperations
+from models.numeric_backend import NumericBackend
+
+# Instantánea inmutable del estado deshacible del controlador
+ControllerState = namedtuple(
+    "ControllerState",
+    "input first_number operator waiting_for_second memory history_length",
+)
 
 
 class CalculatorController:
@@ -43,85 +52,216 @@ class CalculatorController:
         - HistoryManager:        historial de operaciones
         - FileManager:           persistencia en archivos
         - StatisticsReporter:    estadísticas de uso
+        - UndoManager:           deshacer/rehacer
+        - EvaluationExecutor:    cálculos costosos fuera del hilo de la UI
+        - ResultCache:           resultados memorizados (compartido)
+        - InputEventQueue:       cola acotada de eventos de entrada
+        - InputAccumulator:      número en edición (valor sin re-parsear)
+        - HandlerTimer:          latencia por handler (opcional)
+        - NumericBackend:        tipo numérico (float, Decimal, Fraction)
+        - OperatorRegistry:      operadores (botones, teclas, símbolos)
     """
 
-    def __init__(self, view):
-        # Inyección de dependencias — cada componente con SU responsabilidad
+    # Handlers públicos que reciben eventos de la vista (botones y teclado).
+    # on_keypress no figura porque solo despacha hacia estos handlers.
+    HANDLER_NAMES = (
+        "on_digit",
+        "on_operator",
+        "on_unary_operator",
+        "on_equals",
+        "on_repeat_last",
+        "on_sqrt",
+        "on_square",
+        "on_percentage",
+        "on_toggle_sign",
+        "on_insert_pi",
+        "on_memory_clear",
+        "on_memory_recall",
+        "on_memory_add",
+        "on_memory_subtract",
+        "on_show_history",
+        "on_save_history",
+        "on_show_statistics",
+        "on_toggle_theme",
+        "on_clear",
+        "on_backspace",
+        "on_undo",
+        "on_redo",
+        "on_cancel",
+    )
+
+    def __init__(self, view, pool: ComponentPool = None):
+        # Inyección de dependencias — cada componente con SU responsabilidad.
+        # Los componentes sin estado vienen de un pool compartido entre
+        # ventanas; los que guardan estado son propios de este controlador.
+        pool = pool or ComponentPool.shared()
         self.view = view
         self.theme = ThemeManager()
-        self.formatter = NumberFormatter()
-        self.validator = InputValidator()
-        self.logger = ErrorLogger()
-        self.math = MathEngine()
-        self.scientific = ScientificOperations()
+        self.formatter = pool.formatter
+        self.validator = pool.validator
+        self.logger = pool.logger
+        self.math = pool.math
+        self.scientific = pool.scientific
+        self.cache = pool.cache
+        self.operators = pool.operators
         self.memory = MemoryManager()
         self.history = HistoryManager()
         self.file_mgr = FileManager()
-        self.stats = StatisticsReporter()
+        self.stats = StatisticsReporter(self.operators)
+        self.undo_stack = UndoManager()
+        self.executor = EvaluationExecutor(self.view.schedule)
+        self.handler_timer = None
+
+        # Modo numérico: float usa los motores del pool y el valor que ya
+        # calcula el InputAccumulator; set_numeric_backend() cambia de modo
+        self.backend = NumericBackend()
+        self._float_engines = (self.math, self.scientific)
+        self._read_input = InputAccumulator.value
+        self._parse_number = self.validator.parse_number
+        self._cache_prefix = ""
 
         # Estado del flujo de entrada (solo datos de coordinación)
-        self.current_input = ""
+        self.input = InputAccumulator()
         self.first_number = None
         self.operator = None
         self.waiting_for_second = False
+        self._display_before_evaluation = "0"
+        # Acciones que esperan el resultado del cálculo en segundo plano
+        self._deferred = []
+        # Última operación repetible con "=": (operador, operando) o ("²", None)
+        self._last_operation = None
 
     # =========================================================================
     #  Inicialización de la interfaz con callbacks
     # =========================================================================
 
+    @property
+    def current_input(self) -> str:
+        """Texto del número en edición (lo que muestra el display)."""
+        return self.input.text
+
+    def wrap_handlers(self, wrapper) -> None:
+        """
+        Reemplaza cada handler público por wrapper(nombre, handler).
+        Debe llamarse antes de initialize() para que los botones y el
+        teclado queden conectados a las versiones envueltas.
+        """
+        for name in self.HANDLER_NAMES:
+            setattr(self, name, wrapper(name, getattr(self, name)))
+
+    def enable_handler_timing(self, timer=None):
+        """
+        Activa los histogramas de latencia por handler (HandlerTimer).
+        Debe llamarse antes de initialize(), que es donde se envuelven;
+        sin timer los handlers quedan sin instrumentar y no cuestan nada.
+        """
+        self.handler_timer = timer or HandlerTimer()
+        return self.handler_timer
+
+    def set_numeric_backend(self, backend: NumericBackend) -> None:
+        """
+        Cambia el modo numérico. Todo lo que depende del tipo (motores,
+        parseo del input y del display, espacio de claves del caché) se
+        resuelve aquí una vez; los handlers no vuelven a consultar el modo.
+        Los números vivos (operando, memoria, última operación) se convierten
+        y los puntos de deshacer se descartan porque guardan el tipo anterior.
+        """
+        self.backend = backend
+        if backend.is_float:
+            self.math, self.scientific = self._float_engines
+            self._read_input = InputAccumulator.value
+            self._parse_number = self.validator.parse_number
+        else:
+            self.math = MathEngine(backend, self.operators)
+            self.scientific = ScientificOperations(backend)
+            parse_number, number_type = self.validator.parse_number, backend.parse
+            self._parse_number = lambda text: parse_number(text, number_type)
+            self._read_input = lambda accumulator: parse_number(
+                accumulator.text, number_type
+            )
+        self._cache_prefix = backend.cache_prefix
+
+        convert = backend.convert
+        if self.first_number is not None:
+            self.first_number = convert(self.first_number)
+            if self.first_number is None:
+                self._reset_operation()
+        if self._last_operation is not None and self._last_operation[1] is not None:
+            operator, operand = self._last_operation
+            operand = convert(operand)
+            self._last_operation = None if operand is None else (operator, operand)
+        memory = convert(self.memory.recall())
+        self.memory.store(0 if memory is None else memory)
+        self.undo_stack.clear()
+
     def initialize(self) -> None:
         """Construye toda la UI conectando callbacks del controlador."""
+        if self.handler_timer is not None:
+            self.wrap_handlers(self.handler_timer.wrap)
+
         colors = self.theme.get_colors()
 
+        # Teclado, botones y atajos pasan por una misma cola acotada que se
+        # vacía en lotes: una acción nunca se adelanta a teclas pendientes
+        self._build_key_maps()
+        self.input_queue = InputEventQueue(
+            self.dispatch_key, self.view.schedule_idle,
+            operator_chars=self.operators.operator_keys(),
+        )
+        queued = self._queued
+
         self.view.setup_window()
-        self.view.build_top_bar(on_toggle_theme=self.on_toggle_theme)
+        self.view.build_top_bar(on_toggle_theme=queued(self.on_toggle_theme))
         self.view.build_display()
 
         self.view.build_memory_buttons([
-            ("MC", self.on_memory_clear),
-            ("MR", self.on_memory_recall),
-            ("M+", self.on_memory_add),
-            ("M-", self.on_memory_subtract),
-            ("📋 Hist", self.on_show_history),
-            ("💾 Guardar", self.on_save_history),
+            ("MC", queued(self.on_memory_clear)),
+            ("MR", queued(self.on_memory_recall)),
+            ("M+", queued(self.on_memory_add)),
+            ("M-", queued(self.on_memory_subtract)),
+            ("📋 Hist", queued(self.on_show_history)),
+            ("💾 Guardar", queued(self.on_save_history)),
         ])
 
         self.view.build_scientific_buttons([
-            ("√", self.on_sqrt),
-            ("x²", self.on_square),
-            ("%", self.on_percentage),
-            ("±", self.on_toggle_sign),
-            ("π", self.on_insert_pi),
+            ("√", queued(self.on_sqrt)),
+            ("x²", queued(self.on_square)),
+            ("%", queued(self.on_percentage)),
+            ("±", queued(self.on_toggle_sign)),
+            ("π", queued(self.on_insert_pi)),
         ])
 
         self.view.build_keypad(
             button_layout=[
-                ("C", 0, 0, colors["bg_clear"], colors["fg_clear"], self.on_clear),
-                ("⌫", 0, 1, colors["bg_clear"], colors["fg_clear"], self.on_backspace),
-                ("(", 0, 2, "#233554", "#a0cfe4", lambda: self.on_digit("(")),
-                ("÷", 0, 3, colors["bg_operator"], "#fff", lambda: self.on_operator("/")),
-                ("7", 1, 0, colors["bg_button"], "#fff", lambda: self.on_digit("7")),
-                ("8", 1, 1, colors["bg_button"], "#fff", lambda: self.on_digit("8")),
-                ("9", 1, 2, colors["bg_button"], "#fff", lambda: self.on_digit("9")),
-                ("×", 1, 3, colors["bg_operator"], "#fff", lambda: self.on_operator("*")),
-                ("4", 2, 0, colors["bg_button"], "#fff", lambda: self.on_digit("4")),
-                ("5", 2, 1, colors["bg_button"], "#fff", lambda: self.on_digit("5")),
-                ("6", 2, 2, colors["bg_button"], "#fff", lambda: self.on_digit("6")),
-                ("−", 2, 3, colors["bg_operator"], "#fff", lambda: self.on_operator("-")),
-                ("1", 3, 0, colors["bg_button"], "#fff", lambda: self.on_digit("1")),
-                ("2", 3, 1, colors["bg_button"], "#fff", lambda: self.on_digit("2")),
-                ("3", 3, 2, colors["bg_button"], "#fff", lambda: self.on_digit("3")),
-                ("+", 3, 3, colors["bg_operator"], "#fff", lambda: self.on_operator("+")),
-                ("0", 4, 0, colors["bg_button"], "#fff", lambda: self.on_digit("0")),
-                ("00", 4, 1, colors["bg_button"], "#fff", lambda: self.on_digit("00")),
-                (".", 4, 2, colors["bg_button"], "#fff", lambda: self.on_digit(".")),
-                ("=", 4, 3, colors["bg_equal"], "#fff", self.on_equals),
+                ("C", 0, 0, colors["bg_clear"], colors["fg_clear"], queued(self.on_clear)),
+                ("⌫", 0, 1, colors["bg_clear"], colors["fg_clear"], queued(self.on_backspace)),
+                ("(", 0, 2, "#233554", "#a0cfe4", queued(lambda: self.on_digit("("))),
+                ("7", 1, 0, colors["bg_button"], "#fff", queued(lambda: self.on_digit("7"))),
+                ("8", 1, 1, colors["bg_button"], "#fff", queued(lambda: self.on_digit("8"))),
+                ("9", 1, 2, colors["bg_button"], "#fff", queued(lambda: self.on_digit("9"))),
+                ("4", 2, 0, colors["bg_button"], "#fff", queued(lambda: self.on_digit("4"))),
+                ("5", 2, 1, colors["bg_button"], "#fff", queued(lambda: self.on_digit("5"))),
+                ("6", 2, 2, colors["bg_button"], "#fff", queued(lambda: self.on_digit("6"))),
+                ("1", 3, 0, colors["bg_button"], "#fff", queued(lambda: self.on_digit("1"))),
+                ("2", 3, 1, colors["bg_button"], "#fff", queued(lambda: self.on_digit("2"))),
+                ("3", 3, 2, colors["bg_button"], "#fff", queued(lambda: self.on_digit("3"))),
+                ("0", 4, 0, colors["bg_button"], "#fff", queued(lambda: self.on_digit("0"))),
+                ("00", 4, 1, colors["bg_button"], "#fff", queued(lambda: self.on_digit("00"))),
+                (".", 4, 2, colors["bg_button"], "#fff", queued(lambda: self.on_digit("."))),
+                ("=", 4, 3, colors["bg_equal"], "#fff", queued(self.on_equals)),
+            ] + [
+                # Operadores del registro, cada uno en su celda declarada
+                (symbol, row, col, colors["bg_operator"], "#fff",
+                 queued(self._operator_action(key)))
+                for key, symbol, row, col in self.operators.buttons()
             ],
             get_hover_color=self.theme.get_hover_color,
         )
 
         self.view.build_stats_bar()
-        self.view.bind_keyboard(self.on_keypress)
+
+        self.view.bind_keyboard(self.input_queue.push)
+        self.view.bind_undo_redo(queued(self.on_undo), queued(self.on_redo))
 
     # =========================================================================
     #  Handlers de entrada numérica
@@ -129,15 +269,17 @@ class CalculatorController:
 
     def on_digit(self, char: str) -> None:
         """Maneja la entrada de un dígito o punto decimal."""
+        if not self._begin_action():
+            return
         if self.waiting_for_second:
-            self.current_input = ""
+            self.input = InputAccumulator()
             self.waiting_for_second = False
 
-        if char == "." and not self.validator.can_add_decimal(self.current_input):
+        if char == "." and not self.input.can_add_decimal():
             return
 
-        self.current_input += char
-        self.view.update_display(self.current_input)
+        self.input = self.input.append(char)
+        self.view.update_display(self.input.text)
 
     # =========================================================================
     #  Handlers de operadores
@@ -145,33 +287,70 @@ class CalculatorController:
 
     def on_operator(self, op: str) -> None:
         """Maneja la selección de un operador aritmético."""
-        if self.current_input == "" and self.first_number is None:
+        if self.input.is_empty() and self.first_number is None:
+            return
+        if not self._begin_action():
             return
 
-        if self.current_input != "":
+        if not self.input.is_empty():
             if self.first_number is not None and self.operator is not None:
                 self.on_equals()
+                if self.executor.is_busy():
+                    # El resultado encadenado aún no llegó: el operador se
+                    # aplica sobre él cuando _apply_equals_result lo deje
+                    self._after_evaluation(lambda: self._select_operator(op))
+                    return
 
-            num = self.validator.parse_number(self.current_input)
+            num = self._read_input(self.input)
             if num is None:
                 self.view.update_display("Error")
                 return
             self.first_number = num
 
+        self._select_operator(op)
+
+    def _select_operator(self, op: str) -> None:
+        """Deja `op` como operación pendiente sobre first_number."""
         self.operator = op
         symbol = self.formatter.get_operator_symbol(op)
         self.view.update_history_text(
             f"{self.formatter.format(self.first_number)} {symbol}"
         )
-        self.current_input = ""
+        self.input = InputAccumulator()
         self.waiting_for_second = False
 
+    def on_unary_operator(self, op: str) -> None:
+        """Aplica al display un operador unario del OperatorRegistry."""
+        if not self._begin_action():
+            return
+        num = self._get_validated_display_number()
+        if num is None:
+            return
+
+        expression = (
+            f"{self.formatter.get_operator_symbol(op)}({self.formatter.format(num)})"
+        )
+        self._evaluate(
+            "calculate_unary",
+            self.math.calculate_unary,
+            (op, num),
+            lambda result: self._apply_scientific_result(result, expression, op),
+        )
+
     def on_equals(self) -> None:
-        """Ejecuta el cálculo con el operador y números actuales."""
+        """
+        Ejecuta el cálculo con el operador y números actuales. Sin operador
+        pendiente, "=" repite la última operación sobre el resultado.
+        """
+        if self.operator is None and self._last_operation is not None:
+            self.on_repeat_last()
+            return
         if self.operator is None or self.first_number is None:
             return
+        if not self._begin_action():
+            return
 
-        second = self.validator.parse_number(self.current_input)
+        second = self._read_input(self.input)
         if second is None:
             self.view.update_display("Error")
             return
@@ -180,14 +359,21 @@ class CalculatorController:
         if self.operator == "/" and self.validator.is_division_by_zero(second):
             self.view.update_display("Error")
             self.view.update_history_text("Error: División por cero")
-            messagebox.showerror("Error", "No se puede dividir entre cero.")
+            self.view.show_error("Error", "No se puede dividir entre cero.")
             self.logger.log("División por cero")
             self._reset_operation()
             return
 
-        # Delegar el cálculo al MathEngine
-        result = self.math.calculate(self.operator, self.first_number, second)
+        # Delegar el cálculo al MathEngine (en segundo plano si es costoso)
+        self._evaluate(
+            "calculate",
+            self.math.calculate,
+            (self.operator, self.first_number, second),
+            lambda result: self._apply_equals_result(second, result),
+        )
 
+    def _apply_equals_result(self, second: float, result: float) -> None:
+        """Aplica el resultado de on_equals a la vista, estadísticas e historial."""
         # Registrar estadística (StatisticsReporter se encarga)
         self.stats.record_operation(self.operator)
 
@@ -210,9 +396,74 @@ class CalculatorController:
             f"{self.first_number} {symbol} {second}", result
         )
 
-        # Preparar para siguiente operación
+        # Preparar para siguiente operación ("=" otra vez la repite)
+        self._last_operation = (self.operator, second)
         self.first_number = result
-        self.current_input = formatted
+        self.input = InputAccumulator.from_text(formatted)
+        self.operator = None
+        self.waiting_for_second = True
+
+    def on_repeat_last(self, times: int = 1) -> None:
+        """
+        Repite `times` veces la última operación sobre el valor actual en
+        forma cerrada (MathEngine.repeat / ScientificOperations.square_repeated):
+        cuesta O(log n) y deja un solo registro resumido en el historial.
+        """
+        if self._last_operation is None or times < 1:
+            return
+        if not self._begin_action():
+            return
+
+        if self.waiting_for_second and self.first_number is not None:
+            value = self.first_number
+        else:
+            value = self._read_input(self.input)
+        if value is None:
+            return
+
+        operator, operand = self._last_operation
+        if operator == "²":
+            self._evaluate(
+                "square_repeated",
+                self.scientific.square_repeated,
+                (value, times),
+                lambda result: self._apply_repeat_result(value, times, result),
+            )
+        else:
+            self._evaluate(
+                "repeat",
+                self.math.repeat,
+                (operator, value, operand, times),
+                lambda result: self._apply_repeat_result(value, times, result),
+            )
+
+    def _apply_repeat_result(self, value: float, times: int, result: float) -> None:
+        """Aplica el resultado de on_repeat_last como un único registro."""
+        operator, operand = self._last_operation
+        repeated = f" (×{times})" if times > 1 else ""
+
+        if operator == "²":
+            expression = f"({self.formatter.format(value)})²{repeated}"
+            self.view.update_history_text(expression)
+            self.stats.record_scientific()
+        else:
+            symbol = self.formatter.get_operator_symbol(operator)
+            expression = f"{value} {symbol} {operand}{repeated}"
+            self.view.update_history_text(
+                f"{self.formatter.format(value)} {symbol} "
+                f"{self.formatter.format(operand)}{repeated} ="
+            )
+            self.stats.record_operation(operator)
+
+        formatted = self.formatter.format(result)
+        self.view.update_display(formatted)
+        self.view.update_stats_text(
+            f"Operaciones realizadas: {self.stats.get_total()}"
+        )
+        self.history.add_record(expression, result)
+
+        self.first_number = result
+        self.input = InputAccumulator.from_text(formatted)
         self.operator = None
         self.waiting_for_second = True
 
@@ -222,45 +473,69 @@ class CalculatorController:
 
     def on_sqrt(self) -> None:
         """Coordina la operación de raíz cuadrada."""
+        if not self._begin_action():
+            return
         num = self._get_validated_display_number()
         if num is None:
             return
 
         if self.validator.is_negative(num):
             self.view.update_display("Error")
-            messagebox.showerror(
+            self.view.show_error(
                 "Error", "No se puede calcular raíz de un número negativo."
             )
             return
 
-        result = self.scientific.square_root(num)
-        self._apply_scientific_result(result, f"√({self.formatter.format(num)})")
+        expression = f"√({self.formatter.format(num)})"
+        self._evaluate(
+            "square_root",
+            self.scientific.square_root,
+            (num,),
+            lambda result: self._apply_scientific_result(result, expression),
+        )
 
     def on_square(self) -> None:
         """Coordina la operación de elevar al cuadrado."""
+        if not self._begin_action():
+            return
         num = self._get_validated_display_number()
         if num is None:
             return
 
-        result = self.scientific.square(num)
-        self._apply_scientific_result(
-            result, f"({self.formatter.format(num)})²"
-        )
+        expression = f"({self.formatter.format(num)})²"
+
+        def apply_square(result: float) -> None:
+            self._last_operation = ("²", None)
+            self._apply_scientific_result(result, expression)
+
+        self._evaluate("square", self.scientific.square, (num,), apply_square)
 
     def on_percentage(self) -> None:
         """Coordina la operación de porcentaje."""
+        if not self._begin_action():
+            return
         num = self._get_validated_display_number()
         if num is None:
             return
 
-        result = self.scientific.percentage(num)
+        self._evaluate(
+            "percentage",
+            self.scientific.percentage,
+            (num,),
+            lambda result: self._apply_percentage_result(num, result),
+        )
+
+    def _apply_percentage_result(self, num: float, result: float) -> None:
+        """Muestra el porcentaje (no se registra en historial ni estadísticas)."""
         formatted = self.formatter.format(result)
         self.view.update_display(formatted)
         self.view.update_history_text(f"{self.formatter.format(num)}%")
-        self.current_input = formatted
+        self.input = InputAccumulator.from_text(formatted)
 
     def on_toggle_sign(self) -> None:
         """Coordina el cambio de signo."""
+        if not self._begin_action():
+            return
         num = self._get_validated_display_number()
         if num is None:
             return
@@ -268,12 +543,14 @@ class CalculatorController:
         result = self.scientific.negate(num)
         formatted = self.formatter.format(result)
         self.view.update_display(formatted)
-        self.current_input = formatted
+        self.input = InputAccumulator.from_text(formatted)
 
     def on_insert_pi(self) -> None:
         """Inserta el valor de PI."""
+        if not self._begin_action():
+            return
         pi = self.scientific.get_pi()
-        self.current_input = str(pi)
+        self.input = InputAccumulator.from_text(str(pi))
         self.view.update_display(self.formatter.format(pi))
 
     # =========================================================================
@@ -281,22 +558,30 @@ class CalculatorController:
     # =========================================================================
 
     def on_memory_clear(self) -> None:
+        if not self._begin_action():
+            return
         self.memory.clear()
-        messagebox.showinfo("Memoria", "Memoria limpiada.")
+        self.view.show_info("Memoria", "Memoria limpiada.")
 
     def on_memory_recall(self) -> None:
+        if not self._begin_action():
+            return
         value = self.memory.recall()
-        self.current_input = self.formatter.format(value)
-        self.view.update_display(self.current_input)
+        self.input = InputAccumulator.from_text(self.formatter.format(value))
+        self.view.update_display(self.input.text)
 
     def on_memory_add(self) -> None:
-        num = self.validator.parse_number(self.view.get_display_value())
+        num = self._parse_number(self.view.get_display_value())
         if num is not None:
+            if not self._begin_action():
+                return
             self.memory.add(num)
 
     def on_memory_subtract(self) -> None:
-        num = self.validator.parse_number(self.view.get_display_value())
+        num = self._parse_number(self.view.get_display_value())
         if num is not None:
+            if not self._begin_action():
+                return
             self.memory.subtract(num)
 
     # =========================================================================
@@ -304,12 +589,10 @@ class CalculatorController:
     # =========================================================================
 
     def on_show_history(self) -> None:
-        """Abre la ventana de historial delegando a HistoryView."""
-        colors = self.theme.get_colors()
-        history_view = HistoryView(self.view.window, colors)
-        history_view.show(
+        """Abre la ventana de historial delegando a la vista."""
+        self.view.open_history(
             records=self.history.get_records_reversed(),
-            format_number=self.formatter.format,
+            format_many=self.formatter.format_many,
             on_clear=self._clear_all_data,
             on_statistics=self.on_show_statistics,
         )
@@ -317,18 +600,10 @@ class CalculatorController:
     def on_save_history(self) -> None:
         """Coordina el guardado del historial en archivo."""
         if self.history.is_empty():
-            messagebox.showinfo("Guardar", "No hay historial para guardar.")
+            self.view.show_info("Guardar", "No hay historial para guardar.")
             return
 
-        filepath = filedialog.asksaveasfilename(
-            defaultextension=".json",
-            filetypes=[
-                ("JSON files", "*.json"),
-                ("Text files", "*.txt"),
-                ("All files", "*.*"),
-            ],
-            title="Guardar historial",
-        )
+        filepath = self.view.ask_save_path()
 
         if not filepath:
             return
@@ -339,16 +614,17 @@ class CalculatorController:
                 self.history.get_all_records(),
                 self.stats.get_stats_dict(),
             )
-            messagebox.showinfo("Guardado", f"Historial guardado en:\n{filepath}")
+            self.view.show_info("Guardado", f"Historial guardado en:\n{filepath}")
         except Exception as e:
-            messagebox.showerror("Error", f"No se pudo guardar el archivo:\n{e}")
+            self.view.show_error("Error", f"No se pudo guardar el archivo:\n{e}")
             self.logger.log(f"Error al guardar archivo: {e}")
 
     def on_show_statistics(self) -> None:
         """Muestra el reporte de estadísticas."""
-        results = self.history.get_all_results() if not self.history.is_empty() else None
-        report = self.stats.generate_report(results)
-        messagebox.showinfo("Estadísticas", report)
+        results = self.history.iter_results()
+        latency = self.handler_timer.get_stats_dict() if self.handler_timer else None
+        report = self.stats.generate_report(results, self.cache.get_stats(), latency)
+        self.view.show_info("Estadísticas", report)
 
     # =========================================================================
     #  Handlers de tema y limpieza
@@ -362,30 +638,99 @@ class CalculatorController:
 
     def on_clear(self) -> None:
         """Limpia el display y el estado de operación actual."""
-        self.current_input = ""
+        self.executor.cancel()
+        self._deferred.clear()
+        self._checkpoint()
+        self.input = InputAccumulator()
         self.first_number = None
         self.operator = None
         self.waiting_for_second = False
+        self._last_operation = None
         self.view.update_display("0")
         self.view.update_history_text("")
 
-    def on_backspace(self) -> None:
-        """Borra el último carácter del input."""
-        self.current_input = self.current_input[:-1]
+    def on_cancel(self) -> None:
+        """
+        Escape: cancela el cálculo en curso conservando los operandos;
+        si no hay ninguno, limpia como la tecla C.
+        """
+        if self.executor.cancel():
+            self._deferred.clear()
+            self.view.update_display(self._display_before_evaluation)
+            return
+        self.on_clear()
+
+    def on_backspace(self, count: int = 1) -> None:
+        """Borra los últimos `count` caracteres del input."""
+        if not self._begin_action():
+            return
+        self.input = self.input.backspace(count)
         self.view.update_display(
-            self.current_input if self.current_input else "0"
+            self.input.text if not self.input.is_empty() else "0"
         )
 
+    # =========================================================================
+    #  Handlers de deshacer / rehacer
+    # =========================================================================
+
+    def on_undo(self) -> None:
+        """Vuelve al estado anterior a la última acción (Ctrl+Z)."""
+        if self.executor.is_busy():
+            return
+        state = self.undo_stack.undo(self._snapshot())
+        if state is not None:
+            self._restore(state)
+
+    def on_redo(self) -> None:
+        """Rehace la última acción deshecha (Ctrl+Y)."""
+        if self.executor.is_busy():
+            return
+        state = self.undo_stack.redo(self._snapshot())
+        if state is not None:
+            self._restore(state)
+
     # =========================================================================
     #  Handler de teclado físico
     # =========================================================================
 
     def on_keypress(self, event) -> None:
         """Mapea teclas del teclado físico a acciones de la calculadora."""
-        key = event.char
-        keysym = event.keysym
+        self.dispatch_key(event.char, event.keysym)
+
+    def dispatch_key(self, char: str, keysym: str, count: int = 1) -> None:
+        """
+        Ejecuta la acción de una tecla. `count` > 1 solo llega desde la
+        InputEventQueue cuando colapsa varios Backspace o "=" seguidos.
+        """
+        if count > 1 and keysym == "BackSpace":
+            self.on_backspace(count)
+            return
+        if count > 1 and (char == "=" or keysym == "Return"):
+            # El primer "=" resuelve la operación pendiente; el resto la repite
+            # (si ese cálculo va al trabajador, las repeticiones esperan su resultado)
+            if self.operator is not None:
+                self.on_equals()
+                count -= 1
+            self._after_evaluation(lambda: self.on_repeat_last(count))
+            return
+
+        action = self._key_actions.get(char) or self._keysym_actions.get(keysym)
+        if action:
+            action()
+
+    def _queued(self, action):
+        """Callback de botón o atajo que encola `action` en la InputEventQueue."""
+        return lambda: self.input_queue.submit(action)
+
+    def _operator_action(self, key: str):
+        """Acción de un botón o tecla de operador según su aridad."""
+        if self.operators.get(key).arity == 1:
+            return lambda: self.on_unary_operator(key)
+        return lambda: self.on_operator(key)
 
-        key_actions = {
+    def _build_key_maps(self) -> None:
+        """Construye una sola vez los mapas tecla → acción."""
+        self._key_actions = {
             "0": lambda: self.on_digit("0"),
             "1": lambda: self.on_digit("1"),
             "2": lambda: self.on_digit("2"),
@@ -397,24 +742,18 @@ class CalculatorController:
             "8": lambda: self.on_digit("8"),
             "9": lambda: self.on_digit("9"),
             ".": lambda: self.on_digit("."),
-            "+": lambda: self.on_operator("+"),
-            "-": lambda: self.on_operator("-"),
-            "*": lambda: self.on_operator("*"),
-            "/": lambda: self.on_operator("/"),
             "=": self.on_equals,
         }
+        for char, key in self.operators.key_bindings().items():
+            self._key_actions.setdefault(char, self._operator_action(key))
 
-        keysym_actions = {
+        self._keysym_actions = {
             "Return": self.on_equals,
             "BackSpace": self.on_backspace,
-            "Escape": self.on_clear,
+            "Escape": self.on_cancel,
             "Delete": self.on_clear,
         }
 
-        action = key_actions.get(key) or keysym_actions.get(keysym)
-        if action:
-            action()
-
     # =========================================================================
     #  Métodos internos de coordinación
     # =========================================================================
@@ -423,39 +762,136 @@ class CalculatorController:
         """Obtiene y valida el número del display. Retorna float o None."""
         display_value = self.view.get_display_value()
         if not self.validator.is_valid_display(display_value):
-            messagebox.showwarning(
+            self.view.show_warning(
                 "Entrada inválida", "Por favor ingrese un número válido."
             )
             return None
 
-        num = self.validator.parse_number(display_value)
+        num = self._parse_number(display_value)
         if num is None:
             self.view.update_display("Error")
             return None
 
         return num
 
-    def _apply_scientific_result(self, result: float, expression: str) -> None:
-        """Aplica el resultado de una operación científica a la vista y al historial."""
+    def _apply_scientific_result(self, result: float, expression: str,
+                                 operator: str = None) -> None:
+        """
+        Aplica el resultado de una operación científica a la vista y al
+        historial. Con `operator` (unario registrado) se cuenta en su categoría.
+        """
         formatted = self.formatter.format(result)
         self.view.update_display(formatted)
         self.view.update_history_text(expression)
         self.history.add_record(expression, result)
-        self.current_input = formatted
-        self.stats.record_scientific()
+        self.input = InputAccumulator.from_text(formatted)
+        if operator is None:
+            self.stats.record_scientific()
+        else:
+            self.stats.record_operation(operator)
         self.view.update_stats_text(
             f"Operaciones realizadas: {self.stats.get_total()}"
         )
 
+    def _snapshot(self) -> ControllerState:
+        """Captura el estado deshacible actual (sin copiar el historial)."""
+        return ControllerState(
+            self.input,
+            self.first_number,
+            self.operator,
+            self.waiting_for_second,
+            self.memory.recall(),
+            self.history.count(),
+        )
+
+    def _begin_action(self) -> bool:
+        """
+        Prepara una acción que modifica el estado: guarda el punto de deshacer.
+        Retorna False (la acción se ignora) si hay un cálculo en curso.
+        """
+        if self.executor.is_busy():
+            return False
+        self._checkpoint()
+        return True
+
+    def _evaluate(self, operation: str, fn, args: tuple, on_result) -> None:
+        """
+        Ejecuta una operación del modelo: primero consulta el ResultCache y,
+        si no está, la delega al EvaluationExecutor. Si va al proceso trabajador,
+        el display muestra "Calculando…" hasta que on_result se invoque en el
+        hilo de la UI.
+        """
+        key = self.cache.make_key(self._cache_prefix + operation, args)
+        found, cached = self.cache.get(key)
+        if found:
+            on_result(cached)
+            return
+
+        def store_and_apply(result) -> None:
+            self.cache.put(key, result)
+            on_result(result)
+            self._run_deferred()
+
+        self._display_before_evaluation = self.view.get_display_value()
+        if self.executor.run(fn, args, store_and_apply, self._on_evaluation_error):
+            self.view.update_display("Calculando…")
+
+    def _after_evaluation(self, action) -> None:
+        """
+        Ejecuta `action` ahora o, si hay un cálculo en segundo plano, justo
+        después de aplicar su resultado (antes de cualquier otra entrada).
+        """
+        if self.executor.is_busy():
+            self._deferred.append(action)
+        else:
+            action()
+
+    def _run_deferred(self) -> None:
+        """Ejecuta en orden las acciones que esperaban el resultado."""
+        while self._deferred and not self.executor.is_busy():
+            self._deferred.pop(0)()
+
+    def _on_evaluation_error(self, error: Exception) -> None:
+        """Muestra y registra un error producido al evaluar una operación."""
+        self._deferred.clear()
+        self.view.update_display("Error")
+        self.view.show_error("Error", f"No se pudo calcular el resultado:\n{error}")
+        self.logger.log(f"Error de cálculo: {error!r}")
+        self._reset_operation()
+
+    def _checkpoint(self) -> None:
+        """Guarda el estado previo a una acción que lo modifica."""
+        self.undo_stack.record(self._snapshot())
+
+    def _restore(self, state: ControllerState) -> None:
+        """Aplica un estado guardado a los modelos y a la vista."""
+        self.input = state.input
+        self.first_number = state.first_number
+        self.operator = state.operator
+        self.waiting_for_second = state.waiting_for_second
+        self.memory.store(state.memory)
+        self.history.rewind(state.history_length)
+
+        self.view.update_display(self.input.text or "0")
+        if self.operator is not None and self.first_number is not None:
+            symbol = self.formatter.get_operator_symbol(self.operator)
+            self.view.update_history_text(
+                f"{self.formatter.format(self.first_number)} {symbol}"
+            )
+        else:
+            self.view.update_history_text("")
+
     def _reset_operation(self) -> None:
         """Reinicia el estado de la operación actual."""
-        self.current_input = ""
+        self.input = InputAccumulator()
         self.operator = None
         self.first_number = None
+        self._last_operation = None
 
     def _clear_all_data(self) -> None:
-        """Limpia historial y estadísticas."""
+        """Limpia historial y estadísticas (no se puede deshacer)."""
         self.history.clear()
+        self.undo_stack.clear()
         self.stats.reset()
         self.view.update_stats_text("Operaciones realizadas: 0")
-        messagebox.showinfo("Historial", "Historial limpiado correctamente.")
+        self.view.show_info("Historial", "Historial limpiado correctamente.")
@@ -0,0 +1,56 @@
+# =============================================================================
+# SRP: ComponentPool - ÚNICA responsabilidad: proveer componentes compartidos
+# Alta Cohesión: todos los atributos son componentes sin estado reutilizables
+# =============================================================================
+
+from utils.number_formatter import NumberFormatter
+from utils.input_validator import InputValidator
+from services.error_logger import ErrorLogger
+from models.math_engine import MathEngine
+from models.scientific_operations import ScientificOperations
+from models.result_cache import ResultCache
+from models.operator_registry import OperatorRegistry
+
+
+class ComponentPool:
+    """
+    Agrupa los componentes sin estado que varias ventanas pueden compartir.
+
+    Responsabilidad única: crear una sola vez los componentes sin estado.
+    Alta cohesión: todos sus atributos son servicios puros y reutilizables.
+
+    Razón para cambiar: solo si cambia qué componentes son compartibles.
+
+    Los componentes con estado por ventana (MemoryManager, HistoryManager,
+    StatisticsReporter, ThemeManager) siguen creándose en cada controlador.
+    El ResultCache también se comparte: un resultado calculado en una
+    ventana sirve a las demás.
+    """
+
+    _shared = None
+
+    def __init__(self, cache_path: str = None, operators: OperatorRegistry = None):
+        # Los operadores se leen aquí una vez: registrar antes de crear el pool
+        self.operators = operators or OperatorRegistry.default()
+        self.formatter = NumberFormatter(self.operators)
+        self.validator = InputValidator()
+        self.logger = ErrorLogger()
+        self.math = MathEngine(operators=self.operators)
+        self.scientific = ScientificOperations()
+        self.cache = ResultCache(disk_path=cache_path)
+
+    @classmethod
+    def shared(cls) -> "ComponentPool":
+        """Retorna el pool común del proceso (se crea en el primer uso)."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @classmethod
+    def set_shared(cls, pool: "ComponentPool") -> None:
+        """Reemplaza el pool común (por ejemplo, uno con caché en disco)."""
+        cls._shared = pool
+
+    def close(self) -> None:
+        """Libera los recursos persistentes (nivel en disco del caché)."""
+        self.cache.close()
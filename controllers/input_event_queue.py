@@ -0,0 +1,136 @@
+# =============================================================================
+# SRP: InputEventQueue - ÚNICA responsabilidad: amortiguar la entrada
+#      (teclado, botones y atajos) entre la vista y el controlador
+# Alta Cohesión: todos los métodos encolan, colapsan o despachan eventos
+# =============================================================================
+
+from collections import deque
+
+# Teclas de operador por defecto (el controlador pasa las del OperatorRegistry)
+_OPERATOR_CHARS = frozenset("+-*/")
+
+
+def _is_equals(char: str, keysym: str) -> bool:
+    return char == "=" or keysym == "Return"
+
+
+class InputEventQueue:
+    """
+    Cola acotada de eventos de entrada que se vacía en lotes.
+
+    Responsabilidad única: aplicar contrapresión a la entrada del usuario.
+    Alta cohesión: todos los métodos operan sobre la cola de eventos.
+
+    Razón para cambiar: solo si cambia la política de encolado o colapso.
+
+    Una tecla trabada o una inyección automática pueden generar eventos más
+    rápido de lo que los handlers terminan. Los eventos se encolan y se
+    despachan en lotes de batch_size por cada tick ocioso de Tk. Los botones
+    y los atajos (Ctrl+Z / Ctrl+Y) entran por submit() a la misma cola, así
+    nunca se adelantan a teclas que aún esperan. Al encolar:
+        - Backspace consecutivos se colapsan en un solo recorte de N.
+        - "=" consecutivos se colapsan en una sola repetición de N.
+        - Operadores consecutivos se colapsan en el último (equivale a
+          presionarlos todos: cada uno reemplaza al anterior).
+        - Con la cola llena no se descarta nada: se despacha en el acto el
+          lote más antiguo (el productor espera, como con una cola
+          bloqueante) y recién entonces se encola el evento.
+    """
+
+    def __init__(self, dispatch, schedule_idle, max_depth: int = 256,
+                 batch_size: int = 32, operator_chars: frozenset = _OPERATOR_CHARS):
+        self._dispatch = dispatch
+        self._schedule_idle = schedule_idle
+        self._max_depth = max_depth
+        self._batch_size = batch_size
+        self._operator_chars = operator_chars
+        self._queue = deque()
+        self._drain_scheduled = False
+
+        self.received = 0
+        self.dispatched = 0
+        self.collapsed = 0
+        self.blocked = 0
+        self.max_depth_seen = 0
+
+    def push(self, event) -> None:
+        """Callback de <Key>: encola (char, keysym) del evento de Tk."""
+        self.enqueue(event.char, event.keysym)
+
+    def submit(self, action) -> None:
+        """Encola una acción sin argumentos (botón o atajo) detrás de las teclas."""
+        self.received += 1
+        self._append([None, None, 1, action])
+
+    def enqueue(self, char: str, keysym: str) -> None:
+        """Encola una tecla, colapsándola con la anterior si corresponde."""
+        self.received += 1
+        queue = self._queue
+
+        if queue:
+            last = queue[-1]
+            if keysym == "BackSpace" and last[1] == "BackSpace":
+                last[2] += 1
+                self.collapsed += 1
+                return
+            if _is_equals(char, keysym) and _is_equals(last[0], last[1]):
+                last[2] += 1
+                self.collapsed += 1
+                return
+            if char in self._operator_chars and last[0] in self._operator_chars:
+                last[0] = char
+                last[1] = keysym
+                self.collapsed += 1
+                return
+
+        self._append([char, keysym, 1, None])
+
+    def _append(self, event: list) -> None:
+        queue = self._queue
+        if len(queue) >= self._max_depth:
+            # Contrapresión: se procesa lo más antiguo antes de aceptar más
+            self.blocked += 1
+            self._dispatch_batch()
+
+        queue.append(event)
+        if len(queue) > self.max_depth_seen:
+            self.max_depth_seen = len(queue)
+
+        if not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._schedule_idle(self.drain)
+
+    def drain(self) -> None:
+        """Despacha hasta batch_size eventos y reprograma si quedan más."""
+        self._drain_scheduled = False
+        self._dispatch_batch()
+        queue = self._queue
+        if queue and not self._drain_scheduled:
+            self._drain_scheduled = True
+            self._schedule_idle(self.drain)
+
+    def _dispatch_batch(self) -> None:
+        """Despacha hasta batch_size eventos, en orden de llegada."""
+        queue = self._queue
+        for _ in range(min(self._batch_size, len(queue))):
+            char, keysym, count, action = queue.popleft()
+            if action is not None:
+                action()
+            else:
+                self._dispatch(char, keysym, count)
+            self.dispatched += 1
+
+    def depth(self) -> int:
+        """Eventos esperando ser despachados."""
+        return len(self._queue)
+
+    def get_stats_dict(self) -> dict:
+        """Contadores de la cola."""
+        return {
+            "depth": len(self._queue),
+            "max_depth_seen": self.max_depth_seen,
+            "received": self.received,
+            "dispatched": self.dispatched,
+            "collapsed": self.collapsed,
+            "blocked": self.blocked,
+        }
@@ -4,13 +4,48 @@
 from models.math_engine import MathEngine
 from models.scientific_operations import ScientificOperations
 from models.memory_manager import MemoryManager
-from models.history_manager import HistoryManager
+from models.history_manager import HistoryManager, HistoryRecord, RecordSequence
 from models.statistics_reporter import StatisticsReporter
+from models.undo_manager import UndoManager
+from models.sharded_statistics import ShardedStatisticsReporter
+from models.atomic_memory import AtomicMemoryManager
+from models.concurrent_history import ConcurrentHistoryManager
+from models.compact_history import CompactHistoryManager
+from models.history_codec import HistoryCodec
+from models.history_segments import HistorySegmentStore
+from models.tiered_history import TieredHistoryManager
+from models.shared_history import SharedHistorySegment
+from models.latency_histogram import LatencyHistogram
+from models.operation_rates import OperationRates
+from models.input_accumulator import InputAccumulator
+from models.function_expression import FunctionExpression
+from models.numeric_backend import NumericBackend, DecimalBackend, FractionBackend
+from models.operator_registry import OperatorRegistry, OperatorSpec
 
 __all__ = [
     "MathEngine",
     "ScientificOperations",
     "MemoryManager",
     "HistoryManager",
+    "HistoryRecord",
+    "RecordSequence",
     "StatisticsReporter",
+    "UndoManager",
+    "ShardedStatisticsReporter",
+    "AtomicMemoryManager",
+    "ConcurrentHistoryManager",
+    "CompactHistoryManager",
+    "HistoryCodec",
+    "HistorySegmentStore",
+    "TieredHistoryManager",
+    "SharedHistorySegment",
+    "LatencyHistogram",
+    "OperationRates",
+    "InputAccumulator",
+    "FunctionExpression",
+    "NumericBackend",
+    "DecimalBackend",
+    "FractionBackend",
+    "OperatorRegistry",
+    "OperatorSpec",
 ]
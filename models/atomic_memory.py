@@ -0,0 +1,44 @@
+# =============================================================================
+# SRP: AtomicMemoryManager - ÚNICA responsabilidad: memoria numérica con
+#      actualizaciones atómicas entre hilos
+# Alta Cohesión: todos los métodos operan sobre el valor protegido por el lock
+# =============================================================================
+
+import threading
+
+from models.memory_manager import MemoryManager
+
+
+class AtomicMemoryManager(MemoryManager):
+    """
+    Variante de MemoryManager cuyas operaciones M+ / M- son atómicas.
+
+    Responsabilidad única: evitar actualizaciones perdidas en la memoria.
+    Alta cohesión: todos los métodos leen o modifican el mismo valor.
+
+    Razón para cambiar: solo si cambia la estrategia de concurrencia.
+
+    `_memory += value` es leer-modificar-escribir: dos hilos pueden leer el
+    mismo valor y una suma se pierde. Las operaciones de memoria son poco
+    frecuentes, así que un lock simple no genera contención apreciable.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory = 0
+
+    def store(self, value: float) -> None:
+        with self._lock:
+            self._memory = value
+
+    def add(self, value: float) -> None:
+        with self._lock:
+            self._memory += value
+
+    def subtract(self, value: float) -> None:
+        with self._lock:
+            self._memory -= value
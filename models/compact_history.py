@@ -0,0 +1,128 @@
+# =============================================================================
+# SRP: CompactHistoryManager - ÚNICA responsabilidad: historial guardado en
+#      bloques compactos (HistoryCodec) en lugar de un dict por registro
+# Alta Cohesión: todos los métodos operan sobre los bloques y la cola abierta
+# =============================================================================
+#
+# Los últimos registros viven en una cola de HistoryRecord como en
+# HistoryManager; al juntarse BLOCK_SIZE se codifican en un bloque de bytes
+# (símbolos internados, marcas delta, varints) y se descartan los dicts. Así
+# agregar sigue siendo O(1) (amortizado: un bloque cada BLOCK_SIZE registros)
+# y las lecturas decodifican los bloques en orden.
+#
+# rewind() (deshacer) que retrocede dentro de un bloque lo vuelve a abrir:
+# cuesta decodificar un bloque, no el historial entero.
+# =============================================================================
+
+import sys
+
+from models.history_codec import HistoryCodec
+from models.history_manager import HistoryManager
+
+
+class CompactHistoryManager(HistoryManager):
+    """
+    HistoryManager con almacenamiento compacto.
+
+    Responsabilidad única: guardar el historial en bloques codificados.
+    Alta cohesión: todos los métodos operan sobre bloques y cola abierta.
+
+    Razón para cambiar: solo si cambia la organización en bloques.
+    """
+
+    BLOCK_SIZE = 256
+
+    def __init__(self, block_size: int = BLOCK_SIZE):
+        super().__init__()
+        self.block_size = block_size
+        # self._records (heredado) es la cola abierta, aún sin codificar
+        self._blocks: list[bytes] = []
+        self._frozen_count = 0
+
+    def add_record(self, expression: str, result: float) -> None:
+        super().add_record(expression, result)
+        if len(self._records) >= self.block_size:
+            self._freeze()
+
+    def get_all_records(self) -> list[dict]:
+        records = []
+        for block in self._blocks:
+            records += HistoryCodec.decode_block(block)
+        records += self._records
+        return records
+
+    def get_records_reversed(self) -> list[dict]:
+        records = self.get_all_records()
+        records.reverse()
+        return records
+
+    def get_range(self, start: int, stop: int) -> list[dict]:
+        size, frozen = self.block_size, self._frozen_count
+        start, stop = self._clamp_range(start, stop)
+        records = []
+        for index in range(start // size, (min(stop, frozen) - 1) // size + 1):
+            block = HistoryCodec.decode_block(self._blocks[index])
+            records += block[max(start - index * size, 0):stop - index * size]
+        if stop > frozen:
+            records += self._records[max(start - frozen, 0):stop - frozen]
+        return records
+
+    def get_all_results(self) -> list[float]:
+        return [r["result"] for r in self.get_all_records()]
+
+    def iter_results(self):
+        """Resultados bloque a bloque: decodifica uno por vez."""
+        for block in self._blocks:
+            for record in HistoryCodec.decode_block(block):
+                yield record["result"]
+        yield from super().iter_results()
+
+    def clear(self) -> None:
+        super().clear()
+        self._blocks.clear()
+        self._frozen_count = 0
+
+    def rewind(self, length: int) -> None:
+        while length < self._frozen_count:
+            self._thaw()
+        super().rewind(length - self._frozen_count)
+        if len(self._records) >= self.block_size:
+            self._freeze()
+
+    def is_empty(self) -> bool:
+        return self.count() == 0
+
+    def count(self) -> int:
+        return self._frozen_count + len(self._records)
+
+    def memory_bytes(self) -> int:
+        total = super().memory_bytes() + sys.getsizeof(self._blocks)
+        return total + sum(sys.getsizeof(block) for block in self._blocks)
+
+    def get_storage_stats(self) -> dict:
+        """Registros y bytes de los bloques codificados y de la cola abierta."""
+        return {
+            "records": self.count(),
+            "blocks": len(self._blocks),
+            "encoded_records": self._frozen_count,
+            "encoded_bytes": sum(len(block) for block in self._blocks),
+            "open_records": len(self._records),
+        }
+
+    # -------------------------------------------------------------------------
+    #  Bloques
+    # -------------------------------------------------------------------------
+
+    def _freeze(self) -> None:
+        """Codifica la cola abierta en bloques de block_size registros."""
+        size = self.block_size
+        while len(self._records) >= size:
+            self._blocks.append(HistoryCodec.encode_block(self._records[:size]))
+            del self._records[:size]
+            self._frozen_count += size
+
+    def _thaw(self) -> None:
+        """Vuelve a abrir el último bloque delante de la cola."""
+        records = HistoryCodec.decode_block(self._blocks.pop())
+        self._frozen_count -= len(records)
+        self._records[:0] = records
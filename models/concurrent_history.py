@@ -0,0 +1,75 @@
+# =============================================================================
+# SRP: ConcurrentHistoryManager - ÚNICA responsabilidad: historial compartido
+#      entre hilos con agregado sin bloqueo
+# Alta Cohesión: todos los métodos operan sobre el registro append-only
+# =============================================================================
+
+import threading
+
+from models.history_manager import HistoryManager, HistoryRecord
+from utils.clock import Clock
+
+
+class ConcurrentHistoryManager(HistoryManager):
+    """
+    Variante de HistoryManager para varios hilos escritores.
+
+    Responsabilidad única: agregar y leer registros de forma concurrente.
+    Alta cohesión: todos los métodos operan sobre la lista append-only.
+
+    Razón para cambiar: solo si cambia la estrategia de concurrencia.
+
+    El historial es append-only: add_record solo hace list.append, que es
+    atómico en CPython (con o sin GIL), por lo que los escritores no toman
+    ningún lock mientras no haya nada para rehacer. Las lecturas trabajan
+    sobre una copia instantánea. Las operaciones estructurales (clear,
+    rewind) y el agregado que descarta la pila de rehacer se serializan con
+    un lock, y clear() reemplaza la lista en vez de vaciarla para que un
+    lector que está iterando no vea la lista mutar debajo suyo.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._structure_lock = threading.Lock()
+        # Registros para rehacer que descartó un agregado posterior
+        self.redo_discarded = 0
+
+    def add_record(self, expression: str, result: float) -> None:
+        """
+        Agrega un registro. Sin registros para rehacer es solo list.append;
+        si los hay, agregar y descartarlos se hace bajo el lock, así un
+        rewind() concurrente no puede mover el registro nuevo a la pila de
+        rehacer justo antes de que este mismo agregado la vacíe.
+        """
+        record = HistoryRecord(expression=expression, result=result, stamp=Clock.stamp())
+        if not self._rewound:
+            # Un rewind() que corre a la vez puede retirar este registro: queda
+            # en la pila de rehacer (no se pierde) y el agregado cuenta como
+            # anterior a él
+            self._records.append(record)
+            return
+        with self._structure_lock:
+            self._records.append(record)
+            self.redo_discarded += len(self._rewound)
+            self._rewound.clear()
+
+    def get_records_reversed(self) -> list[dict]:
+        snapshot = self._records.copy()
+        snapshot.reverse()
+        return snapshot
+
+    def get_all_results(self) -> list[float]:
+        return [r["result"] for r in self._records.copy()]
+
+    def iter_results(self):
+        for record in self._records.copy():
+            yield record["result"]
+
+    def clear(self) -> None:
+        with self._structure_lock:
+            self._records = []
+            self._rewound = []
+
+    def rewind(self, length: int) -> None:
+        with self._structure_lock:
+            super().rewind(length)
@@ -0,0 +1,162 @@
+# =============================================================================
+# SRP: FunctionExpression - ÚNICA responsabilidad: compilar f(x) a partir de
+#      las operaciones del MathEngine y de ScientificOperations
+# Alta Cohesión: todos los métodos analizan, compilan o evalúan la expresión
+# =============================================================================
+#
+# Gramática (subconjunto de Python, validado con ast):
+#
+#   x, números, pi, + - * /, -x, sqrt(e), square(e), percentage(e), negate(e)
+#
+#   FunctionExpression("sqrt(x) * 2 + 1")
+#
+# Se compila una vez a dos funciones: una escalar (primitivas del modelo) y
+# otra vectorizada sobre arreglos de NumPy, si está instalado. En ambas un
+# punto inválido no aborta la tabla: √ de negativo y 0/0 dan NaN, x/0 y los
+# desbordes dan ±inf (la semántica de NumPy).
+# =============================================================================
+
+import ast
+import math
+
+from models.math_engine import MathEngine
+from models.scientific_operations import ScientificOperations
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional: sin él se evalúa punto a punto
+    numpy = None
+
+
+def _safe_divide(a: float, b: float) -> float:
+    try:
+        return MathEngine.divide(a, b)
+    except ZeroDivisionError:
+        if a == 0 or a != a:
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+
+def _safe_square_root(number: float) -> float:
+    return ScientificOperations.square_root(number) if number >= 0 else math.nan
+
+
+def _safe_square(number: float) -> float:
+    try:
+        return ScientificOperations.square(number)
+    except OverflowError:
+        return math.inf
+
+
+_SCALAR_BINARY = {
+    ast.Add: MathEngine.add,
+    ast.Sub: MathEngine.subtract,
+    ast.Mult: MathEngine.multiply,
+    ast.Div: _safe_divide,
+}
+
+_SCALAR_FUNCTIONS = {
+    "sqrt": _safe_square_root,
+    "square": _safe_square,
+    "percentage": ScientificOperations.percentage,
+    "negate": ScientificOperations.negate,
+}
+
+if numpy is not None:
+    _VECTOR_BINARY = {
+        ast.Add: numpy.add,
+        ast.Sub: numpy.subtract,
+        ast.Mult: numpy.multiply,
+        ast.Div: numpy.divide,
+    }
+    _VECTOR_FUNCTIONS = {
+        "sqrt": numpy.sqrt,
+        "square": numpy.square,
+        "percentage": lambda values: values / 100,
+        "negate": numpy.negative,
+    }
+
+
+class FunctionExpression:
+    """
+    Expresión de una variable compilada a partir de las primitivas del modelo.
+
+    Responsabilidad única: convertir texto en f(x) evaluable.
+    Alta cohesión: todos los métodos trabajan sobre el árbol de la expresión.
+
+    Razón para cambiar: solo si cambia la gramática o las primitivas.
+    """
+
+    FUNCTIONS = tuple(_SCALAR_FUNCTIONS)
+
+    def __init__(self, source: str):
+        self.source = source
+        try:
+            tree = ast.parse(source, mode="eval").body
+        except SyntaxError as e:
+            raise ValueError(f"Expresión inválida: {source!r}") from e
+        self._scalar = self._compile(tree, _SCALAR_BINARY, _SCALAR_FUNCTIONS)
+        self._vector = None
+        if numpy is not None:
+            self._vector = self._compile(tree, _VECTOR_BINARY, _VECTOR_FUNCTIONS)
+
+    @property
+    def vectorized(self) -> bool:
+        """True si evaluate_many usa NumPy."""
+        return self._vector is not None
+
+    def __call__(self, x: float) -> float:
+        """Evalúa en un punto."""
+        return self._scalar(x)
+
+    def evaluate_many(self, xs):
+        """
+        Evalúa sobre un arreglo de NumPy (vectorizado) o, sin NumPy, sobre
+        una lista, punto a punto.
+        """
+        if self._vector is not None:
+            with numpy.errstate(all="ignore"):
+                # Una expresión constante devuelve un escalar: expandirlo
+                return numpy.broadcast_to(self._vector(xs), numpy.shape(xs))
+        return [self._scalar(x) for x in xs]
+
+    # -------------------------------------------------------------------------
+    #  Compilación del árbol a closures
+    # -------------------------------------------------------------------------
+
+    def _compile(self, node, binary: dict, functions: dict):
+        if isinstance(node, ast.Name):
+            if node.id == "x":
+                return lambda x: x
+            if node.id == "pi":
+                pi = ScientificOperations.get_pi()
+                return lambda x: pi
+            raise ValueError(f"Nombre desconocido: {node.id}")
+
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            value = float(node.value)
+            return lambda x: value
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+            operand = self._compile(node.operand, binary, functions)
+            if isinstance(node.op, ast.UAdd):
+                return operand
+            negate = functions["negate"]
+            return lambda x: negate(operand(x))
+
+        if isinstance(node, ast.BinOp) and type(node.op) in binary:
+            operation = binary[type(node.op)]
+            left = self._compile(node.left, binary, functions)
+            right = self._compile(node.right, binary, functions)
+            return lambda x: operation(left(x), right(x))
+
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Name) \
+                and node.func.id in functions and len(node.args) == 1 \
+                and not node.keywords:
+            function = functions[node.func.id]
+            argument = self._compile(node.args[0], binary, functions)
+            return lambda x: function(argument(x))
+
+        raise ValueError(f"Construcción no permitida en {self.source!r}: "
+                         f"{ast.dump(node)[:60]}")
@@ -0,0 +1,278 @@
+# =============================================================================
+# SRP: HistoryCodec - ÚNICA responsabilidad: codificar bloques de registros
+#      del historial en bytes compactos y decodificarlos
+# Alta Cohesión: todos los métodos escriben o leen el mismo formato de bloque
+# =============================================================================
+#
+# Cada expresión se parte en plantilla y operandos:
+#
+#   "891.77 + 8864.0"  →  plantilla ("", " + ", "")  operandos "891.77" "8864.0"
+#
+# Plantillas, operandos y resultados se internan en dos tablas de símbolos
+# (plantillas / números) que se arman mientras se lee el bloque, así que un
+# bloque se decodifica solo y en un único recorrido. Todos los enteros son
+# varints LEB128:
+#
+#   bloque    registros  marca_inicial_us (zigzag)  registro*
+#   registro  ref_plantilla  ref_operando*  ref_resultado  delta_us (zigzag)
+#   ref       0 + literal (símbolo nuevo) | distancia al final de la tabla
+#
+# La distancia hace que lo reciente cueste un byte. Los números se internan
+# por su texto (el repr, para los resultados float), así que el resultado de
+# una operación y el mismo número como operando de la siguiente comparten
+# símbolo. Un texto numérico corto se guarda como mantisa y posición del
+# punto ("2472.0" → 24720, 1) y se reconstruye idéntico.
+# =============================================================================
+
+import re
+import struct
+from decimal import Decimal
+from fractions import Fraction
+
+from models.history_manager import HistoryRecord
+
+# Números dentro de una expresión; el resto del texto es la plantilla.
+# re.split con grupo conserva todo el texto: unir las piezas da el original
+_NUMBER = re.compile(r"(\d+(?:\.\d+)?(?:e[+-]?\d+)?)")
+_FLOAT = struct.Struct("<d")
+
+# "-12.50", "7", "0.05": texto que se reconstruye desde mantisa y escala
+_NUMBER_TEXT = re.compile(r"(-?)(0|[1-9]\d*)(?:\.(\d+))?")
+_MAX_DIGITS = 15
+
+_TEXT, _NUMBER_TAG, _FLOAT_TAG, _DECIMAL, _FRACTION, _INT = range(6)
+_TEXT_TYPES = {Decimal: _DECIMAL, Fraction: _FRACTION, int: _INT}
+_TEXT_PARSERS = {_DECIMAL: Decimal, _FRACTION: Fraction, _INT: int}
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _get_varint(data: bytes, pos: int) -> tuple:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _put_text(out: bytearray, text: str) -> None:
+    raw = text.encode("utf-8")
+    _put_varint(out, len(raw))
+    out += raw
+
+
+def _get_text(data: bytes, pos: int) -> tuple:
+    length, pos = _get_varint(data, pos)
+    return data[pos:pos + length].decode("utf-8"), pos + length
+
+
+def _put_number_text(out: bytearray, text: str) -> bool:
+    """
+    Escribe un texto numérico como mantisa (zigzag) y escala + 1 (0 si no
+    tiene punto). Retorna False si no se reconstruiría idéntico ("-0.0",
+    "1e-05", "007", demasiados dígitos).
+    """
+    match = _NUMBER_TEXT.fullmatch(text)
+    if match is None:
+        return False
+    sign, whole, fraction = match.groups()
+    digits = whole + (fraction or "")
+    if len(digits) > _MAX_DIGITS:
+        return False
+    mantissa = int(digits)
+    if sign:
+        if not mantissa:
+            return False
+        mantissa = -mantissa
+    out.append(_NUMBER_TAG)
+    _put_varint(out, (mantissa << 1) ^ (mantissa >> 63))
+    out.append(len(fraction) + 1 if fraction else 0)
+    return True
+
+
+def _get_number_text(data: bytes, pos: int) -> tuple:
+    zigzag, pos = _get_varint(data, pos)
+    mantissa = (zigzag >> 1) ^ -(zigzag & 1)
+    dot = data[pos]
+    text = str(abs(mantissa))
+    if dot:
+        scale = dot - 1
+        text = text.rjust(scale + 1, "0")
+        text = f"{text[:-scale]}.{text[-scale:]}"
+    return ("-" + text if mantissa < 0 else text), pos + 1
+
+
+class HistoryCodec:
+    """
+    Formato binario de bloques de registros del historial.
+
+    Responsabilidad única: convertir registros en bytes y de vuelta.
+    Alta cohesión: todos los métodos trabajan sobre el formato de bloque.
+
+    Razón para cambiar: solo si cambia el formato binario.
+    """
+
+    @staticmethod
+    def encode_block(records: list) -> bytes:
+        """
+        Codifica registros {"expression", "result", "stamp"} (stamp en ns
+        de Clock.stamp()). Lanza TypeError si un resultado no es float,
+        int, Decimal ni Fraction.
+        """
+        templates: dict = {}
+        numbers: dict = {}
+        out = bytearray()
+        split = _NUMBER.split
+
+        first_us = records[0]["stamp"] // 1000 if records else 0
+        _put_varint(out, len(records))
+        _put_varint(out, (first_us << 1) ^ (first_us >> 63))
+        last_us = first_us
+        for record in records:
+            pieces = split(record["expression"])
+            template = tuple(pieces[0::2])
+            index = templates.get(template)
+            if index is None:
+                templates[template] = len(templates)
+                out.append(0)
+                _put_varint(out, len(template))
+                for piece in template:
+                    _put_text(out, piece)
+            else:
+                _put_varint(out, len(templates) - index)
+
+            for text in pieces[1::2]:
+                index = numbers.get(text)
+                if index is None:
+                    numbers[text] = len(numbers)
+                    out.append(0)
+                    if not _put_number_text(out, text):
+                        out.append(_TEXT)
+                        _put_text(out, text)
+                else:
+                    _put_varint(out, len(numbers) - index)
+
+            result = record["result"]
+            # Un float se interna por su repr: el mismo texto que tendrá como
+            # operando. El resto, por tipo y repr (Decimal 1.0 ≠ 1.00)
+            is_float = type(result) is float
+            key = repr(result) if is_float else (type(result), repr(result))
+            index = numbers.get(key)
+            if index is None:
+                numbers[key] = len(numbers)
+                out.append(0)
+                if not (is_float and _put_number_text(out, key)):
+                    HistoryCodec._write_value(out, result)
+            else:
+                _put_varint(out, len(numbers) - index)
+
+            stamp_us = record["stamp"] // 1000
+            delta = stamp_us - last_us
+            _put_varint(out, (delta << 1) ^ (delta >> 63))
+            last_us = stamp_us
+        return bytes(out)
+
+    @staticmethod
+    def decode_block(data: bytes) -> list:
+        """Retorna los HistoryRecord del bloque, en orden."""
+        count, pos = _get_varint(data, 0)
+        zigzag, pos = _get_varint(data, pos)
+        last_us = (zigzag >> 1) ^ -(zigzag & 1)
+        templates = []
+        numbers = []
+        records = []
+        for _ in range(count):
+            # Las referencias casi siempre caben en un byte: leerlo en línea
+            distance = data[pos]
+            pos += 1
+            if distance >= 0x80:
+                distance, pos = _get_varint(data, pos - 1)
+            if distance:
+                template = templates[-distance]
+            else:
+                size, pos = _get_varint(data, pos)
+                pieces = []
+                for _ in range(size):
+                    piece, pos = _get_text(data, pos)
+                    pieces.append(piece)
+                template = tuple(pieces)
+                templates.append(template)
+
+            parts = [template[0]]
+            for piece in template[1:]:
+                distance = data[pos]
+                pos += 1
+                if distance >= 0x80:
+                    distance, pos = _get_varint(data, pos - 1)
+                if distance:
+                    operand = numbers[-distance]
+                else:
+                    operand, pos = HistoryCodec._read_value(data, pos)
+                    numbers.append(operand)
+                parts.append(operand if type(operand) is str else repr(operand))
+                parts.append(piece)
+
+            distance = data[pos]
+            pos += 1
+            if distance >= 0x80:
+                distance, pos = _get_varint(data, pos - 1)
+            if distance:
+                result = numbers[-distance]
+            else:
+                result, pos = HistoryCodec._read_value(data, pos)
+                numbers.append(result)
+            if type(result) is str:
+                # Símbolo de texto referido como resultado: es el repr de un float
+                result = float(result)
+
+            zigzag, pos = _get_varint(data, pos)
+            last_us += (zigzag >> 1) ^ -(zigzag & 1)
+            records.append(HistoryRecord(
+                expression="".join(parts),
+                result=result,
+                stamp=last_us * 1000,
+            ))
+        return records
+
+    @staticmethod
+    def block_length(data: bytes) -> int:
+        """Cantidad de registros de un bloque (sin decodificarlo)."""
+        return _get_varint(data, 0)[0]
+
+    # -------------------------------------------------------------------------
+    #  Literales
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _write_value(out: bytearray, value) -> None:
+        if type(value) is float:
+            out.append(_FLOAT_TAG)
+            out += _FLOAT.pack(value)
+            return
+        tag = _TEXT_TYPES.get(type(value))
+        if tag is None:
+            raise TypeError(f"{type(value).__name__} no se puede guardar en el historial compacto")
+        out.append(tag)
+        _put_text(out, str(value))
+
+    @staticmethod
+    def _read_value(data: bytes, pos: int) -> tuple:
+        """Lee un literal: texto (str), float de 8 bytes u otro tipo numérico."""
+        tag = data[pos]
+        pos += 1
+        if tag == _NUMBER_TAG:
+            return _get_number_text(data, pos)
+        if tag == _FLOAT_TAG:
+            return _FLOAT.unpack_from(data, pos)[0], pos + _FLOAT.size
+        text, pos = _get_text(data, pos)
+        if tag == _TEXT:
+            return text, pos
+        return _TEXT_PARSERS[tag](text), pos
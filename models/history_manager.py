@@ -3,7 +3,80 @@
 # Alta Cohesión: todos los métodos operan sobre la lista de registros
 # =============================================================================
 
-from datetime import datetime
+import sys
+
+from utils.clock import Clock
+
+
+class HistoryRecord(dict):
+    """
+    Registro del historial: {"expression", "result", "stamp"}.
+
+    "stamp" es la marca cruda de Clock.stamp(); record["timestamp"] se
+    formatea con el reloj común recién al leerlo (vista, exportación).
+    """
+
+    __slots__ = ()
+
+    def __missing__(self, key):
+        if key == "timestamp":
+            return Clock.shared().format(self["stamp"])
+        raise KeyError(key)
+
+
+def export_record(record: dict) -> dict:
+    """Copia serializable del registro, con "timestamp" ya formateado."""
+    return {
+        "expression": record["expression"],
+        "result": record["result"],
+        "timestamp": record["timestamp"],
+    }
+
+
+class RecordSequence:
+    """
+    Vista de solo lectura de un historial que trae los registros por páginas
+    con get_range(), en orden cronológico o inverso. len() no lee nada y
+    recorrerla mantiene en memoria una sola página.
+    """
+
+    def __init__(self, history: "HistoryManager", reverse: bool = False,
+                 page_size: int = 256):
+        self._history = history
+        self._reverse = reverse
+        self._page_size = page_size
+
+    def __len__(self) -> int:
+        return self._history.count()
+
+    def __getitem__(self, index):
+        count = self._history.count()
+        if isinstance(index, slice):
+            start, stop, step = index.indices(count)
+            if step != 1 or start >= stop:
+                return [self[i] for i in range(start, stop, step)]
+            if not self._reverse:
+                return self._history.get_range(start, stop)
+            records = self._history.get_range(count - stop, count - start)
+            records.reverse()
+            return records
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("registro fuera del historial")
+        if self._reverse:
+            index = count - 1 - index
+        return self._history.get_range(index, index + 1)[0]
+
+    def __iter__(self):
+        count, size = self._history.count(), self._page_size
+        if not self._reverse:
+            for start in range(0, count, size):
+                yield from self._history.get_range(start, min(start + size, count))
+            return
+        # Páginas alineadas a page_size: cada una es un bloque completo
+        for start in range((count - 1) // size * size, -1, -size):
+            yield from reversed(self._history.get_range(start, min(start + size, count)))
 
 
 class HistoryManager:
@@ -18,15 +91,15 @@ class HistoryManager:
 
     def __init__(self):
         self._records: list[dict] = []
+        # Registros retirados por rewind(), en orden inverso, para rehacer
+        self._rewound: list[dict] = []
 
     def add_record(self, expression: str, result: float) -> None:
         """Agrega un nuevo registro al historial con timestamp automático."""
-        record = {
-            "expression": expression,
-            "result": result,
-            "timestamp": datetime.now().strftime("%H:%M:%S"),
-        }
-        self._records.append(record)
+        self._records.append(
+            HistoryRecord(expression=expression, result=result, stamp=Clock.stamp())
+        )
+        self._rewound.clear()
 
     def get_all_records(self) -> list[dict]:
         """Retorna todos los registros del historial."""
@@ -36,14 +109,48 @@ class HistoryManager:
         """Retorna los registros en orden inverso (más recientes primero)."""
         return list(reversed(self._records))
 
+    def get_range(self, start: int, stop: int) -> list[dict]:
+        """
+        Registros de las posiciones [start, stop), en orden cronológico.
+        Los límites se recortan a [0, count()]: un índice negativo no cuenta
+        desde el final como en un slice, en ninguna variante del historial.
+        """
+        start, stop = self._clamp_range(start, stop)
+        return self._records[start:stop]
+
+    def _clamp_range(self, start: int, stop: int) -> tuple[int, int]:
+        """Recorta [start, stop) al historial; vacío si stop <= start."""
+        start = max(start, 0)
+        return start, max(min(stop, self.count()), start)
+
     def clear(self) -> None:
         """Limpia todo el historial."""
         self._records.clear()
+        self._rewound.clear()
+
+    def rewind(self, length: int) -> None:
+        """
+        Lleva el historial a `length` registros (para deshacer/rehacer).
+        Los registros retirados se conservan y vuelven si se avanza de nuevo;
+        agregar un registro nuevo los descarta.
+        """
+        while len(self._records) > length:
+            self._rewound.append(self._records.pop())
+        while len(self._records) < length and self._rewound:
+            self._records.append(self._rewound.pop())
 
     def get_all_results(self) -> list[float]:
         """Retorna solo los resultados numéricos de todos los registros."""
         return [r["result"] for r in self._records]
 
+    def iter_results(self):
+        """
+        Genera los resultados en orden cronológico sin armar una lista
+        (para el reporte de estadísticas sobre historiales grandes).
+        """
+        for record in self._records:
+            yield record["result"]
+
     def is_empty(self) -> bool:
         """Indica si el historial está vacío."""
         return len(self._records) == 0
@@ -51,3 +158,22 @@ class HistoryManager:
     def count(self) -> int:
         """Retorna la cantidad de registros en el historial."""
         return len(self._records)
+
+    def memory_bytes(self) -> int:
+        """
+        Bytes en memoria que retiene el historial: sus listas, los registros
+        y los valores que guardan (expresión, resultado, marca), sin importar
+        qué módulo los creó.
+        """
+        return self._records_bytes(self._records) + self._records_bytes(self._rewound)
+
+    @staticmethod
+    def _records_bytes(records: list) -> int:
+        total = sys.getsizeof(records)
+        for record in records:
+            total += sys.getsizeof(record)
+            total += sum(sys.getsizeof(value) for value in record.values())
+        return total
+
+    def close(self) -> None:
+        """Libera los recursos persistentes (el historial en memoria no tiene)."""
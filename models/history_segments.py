@@ -0,0 +1,143 @@
+# =============================================================================
+# SRP: HistorySegmentStore - ÚNICA responsabilidad: guardar bloques del
+#      historial en archivos de segmento append-only y encontrarlos por número
+# Alta Cohesión: todos los métodos escriben, leen o recortan los segmentos
+# =============================================================================
+#
+# Cada bloque (HistoryCodec) se agrega al segmento actual precedido por su
+# largo (uint32), igual que en el cuerpo de un .chist. Al pasar de
+# segment_bytes se abre el segmento siguiente. El índice en memoria guarda,
+# por bloque, (segmento, offset, largo): 16 bytes cada BLOCK_SIZE registros.
+#
+# Los segmentos viven en un directorio temporal propio (dentro de
+# `directory` si se indica) que close() elimina: son el nivel frío de la
+# sesión, no un archivo de intercambio.
+# =============================================================================
+
+import os
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+
+_BLOCK_LENGTH = struct.Struct("<I")
+
+
+class HistorySegmentStore:
+    """
+    Nivel en disco del historial: bloques en segmentos append-only.
+
+    Responsabilidad única: persistir y recuperar bloques por número.
+    Alta cohesión: todos los métodos operan sobre los segmentos y su índice.
+
+    Razón para cambiar: solo si cambia la organización de los segmentos.
+    """
+
+    SEGMENT_BYTES = 8 * 2**20
+
+    def __init__(self, directory: str = None, segment_bytes: int = SEGMENT_BYTES):
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix="calc-history-", dir=directory)
+        self.segment_bytes = segment_bytes
+        # Índice: bloque → segmento, offset del contenido y largo
+        self._segments = array("I")
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._writer = None
+        self._segment = -1
+        self._segment_size = 0
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def append(self, block: bytes) -> None:
+        """Agrega un bloque al final del segmento actual (o de uno nuevo)."""
+        if self._writer is None or (
+            self._segment_size and self._segment_size + len(block) > self.segment_bytes
+        ):
+            self._open_segment(self._segment + 1)
+        self._writer.write(_BLOCK_LENGTH.pack(len(block)))
+        self._writer.write(block)
+        # Visible para read() sin cerrar el archivo
+        self._writer.flush()
+        self._segments.append(self._segment)
+        self._offsets.append(self._segment_size + _BLOCK_LENGTH.size)
+        self._lengths.append(len(block))
+        self._segment_size += _BLOCK_LENGTH.size + len(block)
+
+    def read(self, index: int) -> bytes:
+        """Bytes del bloque número index."""
+        with open(self._path(self._segments[index]), "rb") as f:
+            f.seek(self._offsets[index])
+            return f.read(self._lengths[index])
+
+    def pop(self) -> bytes:
+        """Quita el último bloque (recortando su segmento) y lo retorna."""
+        block = self.read(len(self) - 1)
+        segment = self._segments.pop()
+        start = self._offsets.pop() - _BLOCK_LENGTH.size
+        self._lengths.pop()
+
+        if start:
+            self._writer.truncate(start)
+            self._segment_size = start
+        else:
+            # El segmento quedó vacío: se borra y se sigue en el anterior
+            self._writer.close()
+            os.remove(self._path(segment))
+            self._writer = None
+            if segment:
+                self._open_segment(segment - 1)
+            else:
+                self._segment = -1
+                self._segment_size = 0
+        return block
+
+    def clear(self) -> None:
+        """Borra todos los segmentos."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for segment in range(self._segment + 1):
+            try:
+                os.remove(self._path(segment))
+            except FileNotFoundError:
+                pass
+        del self._segments[:], self._offsets[:], self._lengths[:]
+        self._segment = -1
+        self._segment_size = 0
+
+    def close(self) -> None:
+        """Borra los segmentos y su directorio."""
+        self.clear()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def index_bytes(self) -> int:
+        """Bytes en memoria del índice bloque → (segmento, offset, largo)."""
+        return sum(sys.getsizeof(column)
+                   for column in (self._segments, self._offsets, self._lengths))
+
+    def get_stats(self) -> dict:
+        return {
+            "blocks": len(self),
+            "segments": self._segment + 1,
+            "bytes": sum(self._lengths) + len(self) * _BLOCK_LENGTH.size,
+        }
+
+    # -------------------------------------------------------------------------
+    #  Archivos
+    # -------------------------------------------------------------------------
+
+    def _path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment-{segment:06d}.seg")
+
+    def _open_segment(self, segment: int) -> None:
+        """Abre (para agregar) el segmento indicado y lo deja como actual."""
+        if self._writer is not None:
+            self._writer.close()
+        path = self._path(segment)
+        self._writer = open(path, "ab")
+        self._segment = segment
+        self._segment_size = os.path.getsize(path)
@@ -0,0 +1,222 @@
+# =============================================================================
+# SRP: InputAccumulator - ÚNICA responsabilidad: acumular el número que el
+#      usuario está tecleando y conocer su valor sin volver a parsearlo
+# Alta Cohesión: todos los métodos agregan caracteres o consultan el número
+# =============================================================================
+
+import re
+from array import array
+
+_PLAIN_DECIMAL = re.compile(r"-?[0-9]*\.?[0-9]*")
+
+
+class InputAccumulator:
+    """
+    Estado inmutable del número en edición (texto, punto decimal y valor).
+
+    Responsabilidad única: mantener el input numérico al teclear.
+    Alta cohesión: todos los métodos producen o consultan el mismo estado.
+
+    Razón para cambiar: solo si cambian las reglas de entrada numérica.
+
+    Cada tecla produce un nuevo acumulador en O(1) amortizado:
+        - Los caracteres van a un bytearray compartido por todas las
+          versiones de la misma línea de edición; cada versión guarda solo
+          su longitud, así que los estados de deshacer no copian el texto.
+        - Se registra si ya hay punto decimal (sin recorrer el texto).
+        - Se guardan como máximo MAX_DIGITS dígitos significativos más un
+          dígito "pegajoso" que indica si los descartados eran distintos de
+          cero. Eso basta para que value() dé exactamente el mismo float que
+          float(text): toda frontera de redondeo de un double tiene menos de
+          770 dígitos significativos, así que el truncado nunca cruza una.
+        - Las posiciones de los dígitos descartados distintos de cero van a
+          un array compartido como el texto, así Backspace también es O(1):
+          recorta la longitud y ajusta escala, punto, cabeza y descartados
+          sin volver a leer el texto.
+
+    Los textos que no son decimales simples (p. ej. "1e-05" o "inf" de un
+    resultado formateado) quedan en modo opaco y se parsean al pedir value().
+    """
+
+    MAX_DIGITS = 800
+
+    __slots__ = ("_buf", "_length", "_opaque_text", "has_decimal", "_negative",
+                 "_has_digits", "_head", "_dropped", "_scale", "_nonzero",
+                 "_nonzero_count")
+
+    def __init__(self, buf: bytearray = None, length: int = 0,
+                 has_decimal: bool = False, negative: bool = False,
+                 has_digits: bool = False, head: str = "", dropped: int = 0,
+                 scale: int = 0, nonzero: array = None, nonzero_count: int = 0,
+                 opaque_text: str = None):
+        self._buf = buf if buf is not None else bytearray()
+        self._length = length
+        self._opaque_text = opaque_text
+        self.has_decimal = has_decimal
+        self._negative = negative
+        self._has_digits = has_digits
+        self._head = head
+        self._dropped = dropped
+        self._scale = scale
+        # Posiciones en _buf de los dígitos descartados distintos de cero;
+        # las primeras _nonzero_count son de esta versión
+        self._nonzero = nonzero if nonzero is not None else array("l")
+        self._nonzero_count = nonzero_count
+
+    @classmethod
+    def from_text(cls, text: str) -> "InputAccumulator":
+        """Construye el acumulador de un texto completo (resultados, restauración)."""
+        if not text:
+            return cls()
+        if not _PLAIN_DECIMAL.fullmatch(text):
+            return cls(has_decimal="." in text, opaque_text=text)
+
+        negative = text.startswith("-")
+        integer, _, fraction = text[negative:].partition(".")
+        digits = (integer + fraction).lstrip("0")
+        head = digits[:cls.MAX_DIGITS]
+        nonzero = array("l")
+        if len(digits) > cls.MAX_DIGITS:
+            # Los descartados son los últimos dígitos del texto
+            skip = len(digits) - cls.MAX_DIGITS
+            for position in range(len(text) - 1, -1, -1):
+                if text[position] == ".":
+                    continue
+                if not skip:
+                    break
+                skip -= 1
+                if text[position] != "0":
+                    nonzero.append(position)
+            nonzero.reverse()
+        return cls(
+            bytearray(text, "ascii"),
+            len(text),
+            has_decimal="." in text,
+            negative=negative,
+            has_digits=bool(integer or fraction),
+            head=head,
+            dropped=len(digits) - len(head),
+            scale=len(fraction),
+            nonzero=nonzero,
+            nonzero_count=len(nonzero),
+        )
+
+    @property
+    def text(self) -> str:
+        """Texto tal como se muestra en el display."""
+        if self._opaque_text is not None:
+            return self._opaque_text
+        return self._buf[:self._length].decode("ascii")
+
+    def append(self, chars: str) -> "InputAccumulator":
+        """Nuevo acumulador con `chars` (dígitos o ".") agregados al final."""
+        if self._opaque_text is not None:
+            return InputAccumulator.from_text(self._opaque_text + chars)
+
+        has_decimal = self.has_decimal
+        has_digits = self._has_digits
+        head, dropped, scale = self._head, self._dropped, self._scale
+        nonzero, nonzero_count = self._nonzero, self._nonzero_count
+        for position, char in enumerate(chars, self._length):
+            if char == ".":
+                if has_decimal:
+                    return InputAccumulator.from_text(self.text + chars)
+                has_decimal = True
+                continue
+            if not "0" <= char <= "9":
+                return InputAccumulator.from_text(self.text + chars)
+            has_digits = True
+            if has_decimal:
+                scale += 1
+            if not head and char == "0":
+                continue
+            if len(head) < self.MAX_DIGITS:
+                head += char
+            else:
+                dropped += 1
+                if char != "0":
+                    if len(nonzero) != nonzero_count:
+                        nonzero = nonzero[:nonzero_count]
+                    nonzero.append(position)
+                    nonzero_count += 1
+
+        # Extender el buffer compartido si esta versión es la más reciente;
+        # si no (después de borrar o deshacer) se bifurca con una copia
+        buf = self._buf
+        if len(buf) != self._length:
+            buf = buf[:self._length]
+        buf += chars.encode("ascii")
+        return InputAccumulator(buf, len(buf), has_decimal, self._negative,
+                                has_digits, head, dropped, scale,
+                                nonzero, nonzero_count)
+
+    def backspace(self, count: int = 1) -> "InputAccumulator":
+        """
+        Nuevo acumulador sin los últimos `count` caracteres, en O(count):
+        comparte el buffer con una longitud menor y deshace sobre el estado
+        el efecto de cada carácter quitado.
+        """
+        if self._opaque_text is not None:
+            return InputAccumulator.from_text(self._opaque_text[:-count])
+        length = self._length - count
+        if length <= 0:
+            return InputAccumulator()
+
+        buf = self._buf
+        has_decimal, dropped, scale = self.has_decimal, self._dropped, self._scale
+        nonzero, nonzero_count = self._nonzero, self._nonzero_count
+        head_cut = 0
+        for position in range(self._length - 1, length - 1, -1):
+            if buf[position] == 0x2E:  # "."
+                has_decimal = False
+                continue
+            if has_decimal:
+                scale -= 1
+            if dropped:
+                dropped -= 1
+                if nonzero_count and nonzero[nonzero_count - 1] == position:
+                    nonzero_count -= 1
+            elif head_cut < len(self._head):
+                head_cut += 1
+            # Si no, era un cero a la izquierda (no está en la cabeza)
+
+        digits_left = length - self._negative - has_decimal
+        return InputAccumulator(buf, length, has_decimal, self._negative,
+                                digits_left > 0, self._head[:len(self._head) - head_cut],
+                                dropped, scale, nonzero, nonzero_count)
+
+    def can_add_decimal(self) -> bool:
+        """Verifica si se puede agregar un punto decimal (sin recorrer el texto)."""
+        return not self.has_decimal
+
+    def is_empty(self) -> bool:
+        if self._opaque_text is not None:
+            return not self._opaque_text
+        return not self._length
+
+    def value(self):
+        """El float del texto (igual que float(text)); None si no es un número."""
+        if self._opaque_text is not None:
+            try:
+                return float(self._opaque_text)
+            except ValueError:
+                return None
+        if not self._has_digits:
+            return None
+        sign = "-" if self._negative else ""
+        sticky = "1" if self._nonzero_count else ""
+        exponent = self._dropped - self._scale - len(sticky)
+        return float(f"{sign}{self._head or '0'}{sticky}e{exponent}")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, InputAccumulator):
+            return NotImplemented
+        if self._buf is other._buf and self._opaque_text is other._opaque_text:
+            return self._length == other._length
+        return self.text == other.text
+
+    def __hash__(self) -> int:
+        return hash(self.text)
+
+    def __repr__(self) -> str:
+        return f"InputAccumulator({self.text!r})"
@@ -0,0 +1,107 @@
+# =============================================================================
+# SRP: LatencyHistogram - ÚNICA responsabilidad: acumular latencias en
+#      cubetas logarítmicas y responder percentiles
+# Alta Cohesión: todos los métodos registran o consultan la distribución
+# =============================================================================
+#
+# Cubetas al estilo HDR: cada potencia de dos se divide en 16 sub-cubetas,
+# de modo que el error relativo de cualquier percentil es menor a ~3 % sin
+# importar la magnitud (de nanosegundos a minutos) y la memoria es fija.
+# =============================================================================
+
+_SUB_BITS = 5
+_SUB_COUNT = 1 << _SUB_BITS          # valores < 32 ns tienen cubeta exacta
+_HALF = _SUB_COUNT >> 1              # sub-cubetas por potencia de dos
+_BUCKETS = (64 - _SUB_BITS + 2) * _HALF
+
+
+class LatencyHistogram:
+    """
+    Histograma de latencias en nanosegundos con memoria constante.
+
+    Responsabilidad única: registrar duraciones y calcular percentiles.
+    Alta cohesión: todos los métodos operan sobre los conteos por cubeta.
+
+    Razón para cambiar: solo si cambia la resolución de las cubetas.
+
+    record() es O(1) (un bit_length y un desplazamiento); los percentiles
+    se calculan recorriendo las ~1000 cubetas solo al consultar.
+    """
+
+    def __init__(self):
+        self._counts = [0] * _BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @staticmethod
+    def _index(value: int) -> int:
+        if value < _SUB_COUNT:
+            return value
+        shift = value.bit_length() - _SUB_BITS
+        return shift * _HALF + (value >> shift)
+
+    @staticmethod
+    def _value_at(index: int) -> int:
+        """Valor representativo (punto medio) de la cubeta."""
+        if index < _SUB_COUNT:
+            return index
+        shift = index // _HALF - 1
+        low = (index - shift * _HALF) << shift
+        return low + ((1 << shift) >> 1)
+
+    def record(self, duration_ns: int) -> None:
+        """Registra una duración en nanosegundos."""
+        if duration_ns < 0:
+            duration_ns = 0
+        self._counts[self._index(duration_ns)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+
+    def percentile(self, percent: float) -> int:
+        """Latencia (ns) bajo la cual queda `percent` % de las muestras."""
+        if not self.count:
+            return 0
+        target = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, bucket in enumerate(self._counts):
+            seen += bucket
+            if seen >= target:
+                return min(self._value_at(index), self.max_ns)
+        return self.max_ns
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Suma las muestras de otro histograma a éste."""
+        for index, bucket in enumerate(other._counts):
+            if bucket:
+                self._counts[index] += bucket
+        self.count += other.count
+        self.total_ns += other.total_ns
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+    def get_stats_dict(self) -> dict:
+        """Resumen en microsegundos: muestras, media, p50, p90, p99 y máximo."""
+        return {
+            "count": self.count,
+            "mean_us": self.total_ns / self.count / 1000 if self.count else 0.0,
+            "p50_us": self.percentile(50) / 1000,
+            "p90_us": self.percentile(90) / 1000,
+            "p99_us": self.percentile(99) / 1000,
+            "max_us": self.max_ns / 1000,
+        }
+
+    def get_buckets(self) -> dict:
+        """Conteos no vacíos {valor representativo ns: muestras}."""
+        return {
+            self._value_at(index): bucket
+            for index, bucket in enumerate(self._counts) if bucket
+        }
+
+    def reset(self) -> None:
+        """Descarta todas las muestras."""
+        self._counts = [0] * _BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
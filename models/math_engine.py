@@ -3,6 +3,10 @@
 # Alta Cohesión: todos los métodos ejecutan cálculos matemáticos básicos
 # =============================================================================
 
+from functools import reduce
+
+from models.operator_registry import OperatorRegistry, numpy
+
 
 class MathEngine:
     """
@@ -12,8 +16,25 @@ class MathEngine:
     Alta cohesión: todos los métodos son cálculos aritméticos puros.
 
     Razón para cambiar: solo si se agregan o modifican operaciones básicas.
+
+    Con un NumericBackend (Decimal, Fraction) las operaciones se reemplazan
+    una sola vez al construir el motor; sin él quedan las de float. Las
+    tablas de calculate() y reduce() se compilan del OperatorRegistry.
     """
 
+    def __init__(self, backend=None, operators: OperatorRegistry = None):
+        if backend is not None:
+            for name, operation in backend.math_operations().items():
+                setattr(self, name, operation)
+        operators = operators or OperatorRegistry.default()
+        self._operations = operators.functions(self, arity=2)
+        self._unary_operations = operators.functions(self, arity=1)
+        # fsum / prod / ufuncs trabajan en float: otros backends pliegan
+        # con sus propias operaciones
+        is_float = backend is None or backend.is_float
+        self._reducers = operators.reducers() if is_float else {}
+        self._kernels = operators.kernels() if is_float else {}
+
     @staticmethod
     def add(a: float, b: float) -> float:
         """Suma dos números."""
@@ -39,15 +60,81 @@ class MathEngine:
         Ejecuta la operación indicada por el operador.
         Retorna el resultado numérico o None si el operador no es válido.
         """
-        operations = {
-            "+": self.add,
-            "-": self.subtract,
-            "*": self.multiply,
-            "/": self.divide,
-        }
-
-        operation = operations.get(operator)
+        operation = self._operations.get(operator)
         if operation is None:
             return None
 
         return operation(a, b)
+
+    def calculate_unary(self, operator: str, a: float):
+        """Aplica un operador unario registrado; None si no existe."""
+        operation = self._unary_operations.get(operator)
+        if operation is None:
+            return None
+        return operation(a)
+
+    def reduce(self, operator: str, values):
+        """
+        Aplica el operador a toda la secuencia de izquierda a derecha
+        (a op b op c …) en una sola pasada: con un arreglo de NumPy usa el
+        kernel del operador (ufunc.reduce); con floats, su reducción
+        declarada (math.fsum, math.prod); si no, pliega con la función.
+        Retorna None si el operador no es válido. Lanza ValueError si
+        `values` está vacío.
+        """
+        operation = self._operations.get(operator)
+        if operation is None:
+            return None
+
+        kernel = self._kernels.get(operator)
+        if kernel is not None and isinstance(values, numpy.ndarray):
+            if not values.size:
+                raise ValueError("Se necesita al menos un valor")
+            return kernel.reduce(values, axis=None).item()
+
+        values = values if isinstance(values, list) else list(values)
+        if not values:
+            raise ValueError("Se necesita al menos un valor")
+        reducer = self._reducers.get(operator)
+        if reducer is not None:
+            return reducer(values)
+        return reduce(operation, values)
+
+    @staticmethod
+    def power(base: float, exponent: int) -> float:
+        """Eleva base a un exponente entero >= 0 por cuadrados sucesivos, O(log n)."""
+        result = None
+        while exponent:
+            if exponent & 1:
+                result = base if result is None else result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        return 1 if result is None else result
+
+    def repeat(self, operator: str, a: float, b: float, times: int):
+        """
+        Aplica `times` veces la operación (a op b op b ...) en forma cerrada:
+        a + n·b, a − n·b, a·bⁿ y a / bⁿ. Un operador registrado sin forma
+        cerrada se aplica `times` veces. Retorna None si el operador no es
+        válido. El llamador debe validar que b != 0 para la división.
+        """
+        if operator == "+":
+            return self.add(a, self.multiply(times, b))
+        if operator == "-":
+            return self.subtract(a, self.multiply(times, b))
+        if operator == "*":
+            return self.multiply(a, self.power(b, times))
+        if operator == "/":
+            divisor = self.power(b, times)
+            if divisor == 0:
+                # bⁿ se anuló (underflow): multiplicar por (1/b)ⁿ en su lugar
+                return self.multiply(a, self.power(self.divide(1, b), times))
+            return self.divide(a, divisor)
+
+        operation = self._operations.get(operator)
+        if operation is None:
+            return None
+        for _ in range(times):
+            a = operation(a, b)
+        return a
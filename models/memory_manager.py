@@ -25,6 +25,10 @@ class MemoryManager:
         """Retorna el valor almacenado en memoria (MR)."""
         return self._memory
 
+    def store(self, value: float) -> None:
+        """Reemplaza el valor almacenado (usado al restaurar estados)."""
+        self._memory = value
+
     def add(self, value: float) -> None:
         """Suma un valor a la memoria (M+)."""
         self._memory += value
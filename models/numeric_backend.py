@@ -0,0 +1,219 @@
+# =============================================================================
+# SRP: NumericBackend - ÚNICA responsabilidad: definir el tipo numérico con
+#      el que calculan MathEngine y ScientificOperations
+# Alta Cohesión: todos los métodos crean, convierten u operan ese tipo
+# =============================================================================
+#
+# Modos disponibles:
+#
+#   float      el de siempre (por defecto): rápido, 0.1 + 0.2 = 0.30000000000000004
+#   decimal:N  decimal.Decimal con N dígitos significativos (28 por defecto)
+#   fraction   fractions.Fraction: exacto en + − × ÷; √ y π se aproximan con
+#              denominador de a lo sumo MAX_DENOMINATOR
+#
+# El backend no se consulta en cada operación: MathEngine(backend) y
+# ScientificOperations(backend) reemplazan una sola vez sus métodos por los
+# de math_operations() / scientific_operations() (en Decimal, métodos ligados
+# de un decimal.Context propio, que no depende del contexto del hilo
+# trabajador). El backend float no reemplaza nada, así que el camino float es
+# exactamente el de antes.
+# =============================================================================
+
+import math
+from decimal import Context, Decimal
+from fractions import Fraction
+
+
+class NumericBackend:
+    """
+    Backend float (por defecto) y base de los demás modos numéricos.
+
+    Responsabilidad única: describir cómo se parsea, convierte y opera un tipo.
+    Alta cohesión: todos los métodos trabajan sobre el mismo tipo numérico.
+
+    Razón para cambiar: solo si cambia el tipo numérico o sus operaciones.
+    """
+
+    name = "float"
+    is_float = True
+    # Texto → número; lanza ValueError / ArithmeticError si no es válido
+    parse = float
+
+    @staticmethod
+    def from_spec(spec: str) -> "NumericBackend":
+        """Crea el backend de "float", "fraction" o "decimal[:precisión]"."""
+        mode, _, precision = (spec or "float").strip().lower().partition(":")
+        if mode == "float":
+            return NumericBackend()
+        if mode == "decimal":
+            return DecimalBackend(int(precision) if precision else 28)
+        if mode == "fraction":
+            return FractionBackend()
+        raise ValueError(f"Modo numérico desconocido: {spec!r}")
+
+    @property
+    def label(self) -> str:
+        """Nombre del modo para mostrar ("float", "decimal:50", "fraction")."""
+        return self.name
+
+    @property
+    def cache_prefix(self) -> str:
+        """Prefijo de las claves del ResultCache ("" mantiene las de float)."""
+        return "" if self.is_float else f"{self.label}:"
+
+    def convert(self, value):
+        """Lleva un número de otro modo a este tipo; None si no es representable."""
+        try:
+            return self._convert(value)
+        except (ValueError, TypeError, ArithmeticError):
+            return None
+
+    def _convert(self, value):
+        return float(value)
+
+    def math_operations(self) -> dict:
+        """Reemplazos para MathEngine (nombre de método → función)."""
+        return {}
+
+    def scientific_operations(self) -> dict:
+        """Reemplazos para ScientificOperations (nombre de método → función)."""
+        return {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.label!r})"
+
+
+class DecimalBackend(NumericBackend):
+    """decimal.Decimal con precisión configurable (dígitos significativos)."""
+
+    name = "decimal"
+    is_float = False
+    # El texto tecleado se toma exacto; el redondeo ocurre al operar
+    parse = Decimal
+
+    def __init__(self, precision: int = 28):
+        if precision < 1:
+            raise ValueError("La precisión debe ser al menos 1 dígito")
+        self.precision = precision
+        self.context = Context(prec=precision)
+        self._pi = None
+
+    @property
+    def label(self) -> str:
+        return f"decimal:{self.precision}"
+
+    def _convert(self, value):
+        if isinstance(value, float):
+            # repr da el decimal más corto: 0.1 → Decimal("0.1"), no su binario
+            return self.context.create_decimal(repr(value))
+        if isinstance(value, Fraction):
+            return self.context.divide(Decimal(value.numerator),
+                                       Decimal(value.denominator))
+        return self.context.create_decimal(value)
+
+    def pi(self) -> Decimal:
+        """π con la precisión del contexto (serie de la documentación de decimal)."""
+        if self._pi is None:
+            work = Context(prec=self.precision + 3)
+            three = Decimal(3)
+            lasts, t, s, n, na, d, da = 0, three, 3, 1, 0, 0, 24
+            while s != lasts:
+                lasts = s
+                n, na = n + na, na + 8
+                d, da = d + da, da + 32
+                t = work.divide(work.multiply(t, n), d)
+                s = work.add(s, t)
+            self._pi = self.context.plus(s)
+        return self._pi
+
+    def square(self, number: Decimal) -> Decimal:
+        return self.context.multiply(number, number)
+
+    def percentage(self, number: Decimal) -> Decimal:
+        return self.context.divide(number, 100)
+
+    def square_repeated(self, number: Decimal, times: int) -> Decimal:
+        # x^(2^n) en una potencia; lanza decimal.Overflow si excede Emax
+        return self.context.power(number, 2 ** times)
+
+    def math_operations(self) -> dict:
+        context = self.context
+        return {
+            "add": context.add,
+            "subtract": context.subtract,
+            "multiply": context.multiply,
+            "divide": context.divide,
+            "power": context.power,
+        }
+
+    def scientific_operations(self) -> dict:
+        context = self.context
+        return {
+            "square_root": context.sqrt,
+            "square": self.square,
+            "square_repeated": self.square_repeated,
+            "percentage": self.percentage,
+            "negate": context.minus,
+            "get_pi": self.pi,
+        }
+
+
+class FractionBackend(NumericBackend):
+    """
+    fractions.Fraction: + − × ÷ son exactos con los operadores de Python.
+    √ (si no es exacta) y π se redondean a la fracción más cercana con
+    denominador <= MAX_DENOMINATOR. Las potencias (x², repetir "=") crecen sin
+    límite en modo exacto: pasado MAX_BITS se lanza OverflowError en lugar de
+    dejar al proceso trabajador calculando indefinidamente.
+    """
+
+    name = "fraction"
+    is_float = False
+    parse = Fraction
+
+    MAX_DENOMINATOR = 10**12
+    MAX_BITS = 1 << 20
+
+    def __init__(self):
+        # Dígitos intermedios para aproximar √ y π antes de limitar el denominador
+        self._decimal = DecimalBackend(34)
+
+    def _convert(self, value):
+        if isinstance(value, float):
+            return Fraction(repr(value))
+        return Fraction(value)
+
+    def power(self, base: Fraction, exponent: int) -> Fraction:
+        bits = base.numerator.bit_length() + base.denominator.bit_length()
+        # 0 y ±1 no crecen con ningún exponente
+        if bits > 2 and bits * exponent > self.MAX_BITS:
+            raise OverflowError("Resultado demasiado grande para el modo fracción")
+        return base ** exponent
+
+    def square(self, number: Fraction) -> Fraction:
+        return self.power(number, 2)
+
+    def square_repeated(self, number: Fraction, times: int) -> Fraction:
+        return self.power(number, 2 ** times)
+
+    def square_root(self, number: Fraction) -> Fraction:
+        numerator, denominator = number.numerator, number.denominator
+        root_n, root_d = math.isqrt(numerator), math.isqrt(denominator)
+        if root_n * root_n == numerator and root_d * root_d == denominator:
+            return Fraction(root_n, root_d)
+        approximation = self._decimal.context.sqrt(self._decimal.convert(number))
+        return Fraction(approximation).limit_denominator(self.MAX_DENOMINATOR)
+
+    def pi(self) -> Fraction:
+        return Fraction(self._decimal.pi()).limit_denominator(self.MAX_DENOMINATOR)
+
+    def math_operations(self) -> dict:
+        return {"power": self.power}
+
+    def scientific_operations(self) -> dict:
+        return {
+            "square": self.square,
+            "square_repeated": self.square_repeated,
+            "square_root": self.square_root,
+            "get_pi": self.pi,
+        }
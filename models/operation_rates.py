@@ -0,0 +1,134 @@
+# =============================================================================
+# SRP: OperationRates - ÚNICA responsabilidad: contar operaciones por
+#      categoría en ventanas deslizantes (último minuto, 5 minutos, hora)
+# Alta Cohesión: todos los métodos escriben o leen los anillos por segundo
+# =============================================================================
+#
+# Cada categoría tiene un anillo de HORIZON cubetas de un segundo (array de
+# uint32): la cubeta del segundo s es s % HORIZON. Al muestrear un segundo
+# posterior al último escrito se ponen a cero las cubetas de los segundos
+# saltados (asignación de slice, a lo sumo una vuelta), así que el anillo
+# siempre contiene exactamente los HORIZON segundos que terminan en el último
+# escrito: cada ventana es uno o dos slices contiguos y la memoria no crece
+# con el tiempo. Se mantiene además la suma de cada anillo, así que la
+# ventana de una hora se lee como esa suma menos los segundos que quedan
+# fuera (casi siempre ninguno) en lugar de sumar 3600 cubetas.
+#
+# El camino caliente (StatisticsReporter.record_operation) no toca este
+# objeto ni lee el reloj: sample() recibe los totales acumulados y vuelca la
+# diferencia con la muestra anterior en la cubeta del segundo actual. Se
+# llama periódicamente (sample_rates_periodically) y antes de cada lectura;
+# lo ocurrido entre dos muestras se atribuye al segundo de la segunda.
+# =============================================================================
+
+import time
+from array import array
+
+# Ventanas del reporte: segundos → etiqueta
+WINDOWS = {60: "1 min", 300: "5 min", 3600: "1 h"}
+
+
+class OperationRates:
+    """
+    Ventanas deslizantes de operaciones por categoría.
+
+    Responsabilidad única: repartir los totales en cubetas por segundo.
+    Alta cohesión: todos los métodos operan sobre los mismos anillos.
+
+    Razón para cambiar: solo si cambian las ventanas o su resolución.
+    """
+
+    HORIZON = 3600
+
+    def __init__(self, categories: tuple, horizon: int = HORIZON, clock=time.monotonic):
+        self.categories = categories
+        self.horizon = horizon
+        self._clock = clock
+        self.reset()
+
+    def reset(self) -> None:
+        """Vacía las ventanas y vuelve a contar desde totales en cero."""
+        # Los anillos se crean con la primera operación: un reporter sin uso
+        # (p. ej. una sesión libre del pool) no reserva las cubetas
+        self._counts: dict[str, array] = {}
+        self._sums: dict[str, int] = {}
+        self._baseline = dict.fromkeys(self.categories, 0)
+        self._started = int(self._clock())
+        self._last = self._started
+
+    def sample(self, totals: dict, now: float = None) -> None:
+        """Suma a la cubeta del segundo actual lo contado desde la muestra anterior."""
+        second = int(self._clock() if now is None else now)
+        baseline = self._baseline
+        deltas = {key: totals[key] - baseline[key] for key in self.categories}
+        self._baseline = {key: totals[key] for key in self.categories}
+        if not any(delta > 0 for delta in deltas.values()):
+            return
+
+        if second > self._last:
+            # Segundos sin muestras desde la última escritura: cubetas a cero
+            for key, ring in self._counts.items():
+                self._sums[key] -= self._zero(ring, self._last + 1, second)
+            self._last = second
+        index = second % self.horizon
+        for key, delta in deltas.items():
+            if delta > 0:
+                ring = self._counts.get(key)
+                if ring is None:
+                    ring = self._counts[key] = array("I", bytes(4 * self.horizon))
+                    self._sums[key] = 0
+                ring[index] += delta
+                self._sums[key] += delta
+
+    def window_counts(self, totals: dict, now: float = None) -> dict:
+        """
+        {ventana_s: {categoría: operaciones}} para cada ventana de WINDOWS,
+        incluyendo lo aún no muestreado (se muestrea primero).
+        """
+        second = int(self._clock() if now is None else now)
+        self.sample(totals, second)
+        windows = {}
+        for window in WINDOWS:
+            # Segundos (second - window, second] que el anillo aún conserva
+            oldest = self._last - self.horizon + 1
+            first = max(second - window + 1, oldest)
+            windows[window] = counts = dict.fromkeys(self.categories, 0)
+            if first > self._last:
+                continue
+            for key, ring in self._counts.items():
+                if self._last - first < first - oldest:
+                    counts[key] = self._sum(ring, first, self._last)
+                else:
+                    # Más corto restar lo que queda fuera de la ventana
+                    counts[key] = self._sums[key] - self._sum(ring, oldest, first - 1)
+        return windows
+
+    def covered_seconds(self, window: int, now: float = None) -> int:
+        """Segundos de la ventana transcurridos desde la creación o el reset."""
+        second = int(self._clock() if now is None else now)
+        return max(1, min(window, second - self._started + 1))
+
+    # -------------------------------------------------------------------------
+    #  Anillo
+    # -------------------------------------------------------------------------
+
+    def _spans(self, first: int, last: int) -> list:
+        """Slices [a, b) del anillo que cubren los segundos first..last."""
+        start, stop = first % self.horizon, last % self.horizon + 1
+        if stop > start:
+            return [(start, stop)]
+        return [(start, self.horizon), (0, stop)]
+
+    def _sum(self, ring: array, first: int, last: int) -> int:
+        """Operaciones de los segundos first..last (0 si el rango es vacío)."""
+        if first > last:
+            return 0
+        return sum(sum(ring[a:b]) for a, b in self._spans(first, last))
+
+    def _zero(self, ring: array, first: int, last: int) -> int:
+        """Pone a cero las cubetas de los segundos first..last; retorna lo quitado."""
+        first = max(first, last - self.horizon + 1)
+        removed = self._sum(ring, first, last)
+        for a, b in self._spans(first, last):
+            ring[a:b] = array("I", bytes(4 * (b - a)))
+        return removed
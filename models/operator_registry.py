@@ -0,0 +1,168 @@
+# =============================================================================
+# SRP: OperatorRegistry - ÚNICA responsabilidad: declarar los operadores de
+#      la calculadora en un solo lugar
+# Alta Cohesión: todos los métodos registran operadores o compilan sus tablas
+# =============================================================================
+#
+# Cada operador declara función, aridad, símbolo, teclas, categoría de
+# estadísticas, posición en el teclado y, opcionalmente, una reducción n-aria
+# y un kernel vectorizado (ufunc de NumPy). Los consumidores compilan sus
+# tablas de despacho una sola vez al construirse:
+#
+#   MathEngine          funciones y reducciones      (calculate, reduce)
+#   StatisticsReporter  operador → categoría         (record_operation)
+#   NumberFormatter     operador → símbolo           (get_operator_symbol)
+#   Controller          botones del teclado y mapa tecla → acción
+#   InputEventQueue     teclas de operador que se colapsan
+#
+# Un operador nuevo se registra antes de crear el ComponentPool:
+#
+#   OperatorRegistry.default().register(
+#       "^", math.pow, symbol="^", category="pow", button=(5, 0),
+#   )
+#
+# `function` es el nombre de un método de MathEngine (así un NumericBackend
+# puede reemplazarlo) o cualquier callable.
+# =============================================================================
+
+import math
+from collections import namedtuple
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional: sin él no hay kernels vectorizados
+    numpy = None
+
+OperatorSpec = namedtuple(
+    "OperatorSpec",
+    "key function arity symbol keys category button reducer kernel",
+)
+
+
+def _reduce_subtract(values: list) -> float:
+    """a − b − c − … = a − (b + c + …) con una sola suma exacta (fsum)."""
+    return values[0] - math.fsum(values[1:])
+
+
+def _reduce_divide(values: list) -> float:
+    """a ÷ b ÷ c ÷ … = a ÷ (b · c · …)."""
+    return values[0] / math.prod(values[1:])
+
+
+class OperatorRegistry:
+    """
+    Catálogo ordenado de operadores y fuente de todas sus tablas de despacho.
+
+    Responsabilidad única: describir cada operador una sola vez.
+    Alta cohesión: todos los métodos registran o compilan operadores.
+
+    Razón para cambiar: solo si cambia qué se declara de un operador.
+    """
+
+    _default = None
+
+    def __init__(self):
+        self._operators: dict[str, OperatorSpec] = {}
+
+    @classmethod
+    def default(cls) -> "OperatorRegistry":
+        """Registro del proceso con + − × ÷ (se crea en el primer uso)."""
+        if cls._default is None:
+            registry = cls()
+            registry.register_builtins()
+            cls._default = registry
+        return cls._default
+
+    def register_builtins(self) -> None:
+        """Registra las cuatro operaciones básicas."""
+        kernels = (
+            (numpy.add, numpy.subtract, numpy.multiply, numpy.divide)
+            if numpy is not None else (None,) * 4
+        )
+        self.register("+", "add", symbol="+", category="sum", button=(3, 3),
+                      reducer=math.fsum, kernel=kernels[0])
+        self.register("-", "subtract", symbol="−", category="sub", button=(2, 3),
+                      reducer=_reduce_subtract, kernel=kernels[1])
+        self.register("*", "multiply", symbol="×", category="mul", button=(1, 3),
+                      reducer=math.prod, kernel=kernels[2])
+        self.register("/", "divide", symbol="÷", category="div", button=(0, 3),
+                      reducer=_reduce_divide, kernel=kernels[3])
+
+    def register(self, key: str, function, arity: int = 2, symbol: str = None,
+                 keys: tuple = None, category: str = None, button: tuple = None,
+                 reducer=None, kernel=None) -> OperatorSpec:
+        """
+        Declara un operador. `keys` son los caracteres de teclado que lo
+        activan (por defecto la propia clave); `button` es (fila, columna)
+        en el teclado o None; `reducer` recibe una lista de floats.
+        Lanza ValueError si la clave ya existe o la aridad no es 1 ni 2.
+        """
+        if key in self._operators:
+            raise ValueError(f"Operador ya registrado: {key!r}")
+        if arity not in (1, 2):
+            raise ValueError(f"Aridad no soportada para {key!r}: {arity}")
+        if arity == 1 and (reducer is not None or kernel is not None):
+            raise ValueError(f"Un operador unario no tiene reducción: {key!r}")
+        spec = OperatorSpec(
+            key, function, arity, symbol or key,
+            tuple(keys) if keys is not None else (key,),
+            category or ("sci" if arity == 1 else key),
+            button, reducer, kernel,
+        )
+        self._operators[key] = spec
+        return spec
+
+    def get(self, key: str):
+        """Retorna el OperatorSpec de la clave o None."""
+        return self._operators.get(key)
+
+    def __iter__(self):
+        return iter(self._operators.values())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._operators
+
+    # -------------------------------------------------------------------------
+    #  Tablas compiladas (cada consumidor las pide una vez al construirse)
+    # -------------------------------------------------------------------------
+
+    def functions(self, engine=None, arity: int = 2) -> dict:
+        """
+        Operador → función de la aridad indicada. Las funciones dadas por
+        nombre se resuelven sobre `engine` (un MathEngine, con su backend).
+        """
+        table = {}
+        for spec in self:
+            if spec.arity != arity:
+                continue
+            function = spec.function
+            if isinstance(function, str):
+                function = getattr(engine, function)
+            table[spec.key] = function
+        return table
+
+    def reducers(self) -> dict:
+        """Operador binario → reducción n-aria sobre floats (si la declara)."""
+        return {spec.key: spec.reducer for spec in self if spec.reducer is not None}
+
+    def kernels(self) -> dict:
+        """Operador binario → ufunc de NumPy (si la declara y NumPy existe)."""
+        return {spec.key: spec.kernel for spec in self if spec.kernel is not None}
+
+    def symbols(self) -> dict:
+        return {spec.key: spec.symbol for spec in self}
+
+    def categories(self) -> dict:
+        return {spec.key: spec.category for spec in self}
+
+    def key_bindings(self) -> dict:
+        """Carácter de teclado → operador."""
+        return {char: spec.key for spec in self for char in spec.keys}
+
+    def operator_keys(self) -> frozenset:
+        """Caracteres de teclado de los operadores binarios."""
+        return frozenset(char for spec in self if spec.arity == 2 for char in spec.keys)
+
+    def buttons(self) -> list:
+        """(operador, símbolo, fila, columna) de los que tienen botón."""
+        return [(spec.key, spec.symbol, *spec.button) for spec in self if spec.button]
@@ -0,0 +1,130 @@
+# =============================================================================
+# SRP: ResultCache - ÚNICA responsabilidad: memorizar resultados de operaciones
+# Alta Cohesión: todos los métodos consultan, guardan o expulsan resultados
+# =============================================================================
+
+import math
+import shelve
+import sys
+from collections import OrderedDict
+from decimal import Decimal
+
+
+class ResultCache:
+    """
+    Caché de resultados en dos niveles: LRU en memoria y disco opcional.
+
+    Responsabilidad única: evitar recalcular operaciones ya resueltas.
+    Alta cohesión: todos los métodos operan sobre las entradas del caché.
+
+    Razón para cambiar: solo si cambia la política de memorización.
+
+    Las claves son (operación, operandos normalizados). El nivel en memoria
+    expulsa las entradas menos usadas cuando su tamaño estimado supera
+    max_bytes; el nivel en disco (shelve) persiste entre ejecuciones.
+    """
+
+    # Costo fijo aproximado de una entrada (nodo del OrderedDict + tupla clave)
+    _ENTRY_OVERHEAD = 160
+
+    def __init__(self, max_bytes: int = 4 * 2**20, disk_path: str = None):
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._disk = shelve.open(disk_path) if disk_path else None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(operation: str, operands: tuple):
+        """
+        Normaliza la clave: -0.0 se trata como 0.0 y se distingue el tipo
+        (2 y 2.0 producen resultados de tipos distintos). En un Decimal se
+        distingue además el exponente: Decimal("2.0") == Decimal("2.00"),
+        pero sus resultados no se escriben igual. Retorna None si un
+        operando no se puede memorizar (NaN nunca es igual a sí mismo).
+        """
+        key = [operation]
+        for value in operands:
+            if isinstance(value, float):
+                if math.isnan(value):
+                    return None
+                value += 0.0
+                key.append("float")
+            elif isinstance(value, Decimal):
+                if value.is_nan():
+                    return None
+                key.append(("Decimal", value.as_tuple().exponent))
+            else:
+                key.append(type(value).__name__)
+            key.append(value)
+        return tuple(key)
+
+    def get(self, key):
+        """Retorna (encontrado, resultado) consultando memoria y luego disco."""
+        if key is None:
+            self.misses += 1
+            return False, None
+
+        entries = self._entries
+        if key in entries:
+            entries.move_to_end(key)
+            self.hits += 1
+            return True, entries[key]
+
+        if self._disk is not None:
+            disk_key = repr(key)
+            if disk_key in self._disk:
+                value = self._disk[disk_key]
+                self._store_memory(key, value)
+                self.hits += 1
+                self.disk_hits += 1
+                return True, value
+
+        self.misses += 1
+        return False, None
+
+    def put(self, key, value) -> None:
+        """Guarda un resultado en ambos niveles."""
+        if key is None or value is None:
+            return
+        self._store_memory(key, value)
+        if self._disk is not None:
+            self._disk[repr(key)] = value
+
+    def get_stats(self) -> dict:
+        """Contadores del caché para el reporte de estadísticas."""
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def clear(self) -> None:
+        """Vacía el nivel en memoria (el disco se conserva)."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def close(self) -> None:
+        """Cierra el nivel en disco, si existe."""
+        if self._disk is not None:
+            self._disk.close()
+            self._disk = None
+
+    def _store_memory(self, key, value) -> None:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return
+        self._entries[key] = value
+        self._bytes += self._entry_size(key, value)
+        while self._bytes > self._max_bytes and len(self._entries) > 1:
+            old_key, old_value = self._entries.popitem(last=False)
+            self._bytes -= self._entry_size(old_key, old_value)
+
+    def _entry_size(self, key, value) -> int:
+        return (self._ENTRY_OVERHEAD
+                + sum(sys.getsizeof(part) for part in key[2::2])
+                + sys.getsizeof(value))
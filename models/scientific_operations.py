@@ -14,8 +14,16 @@ class ScientificOperations:
     Alta cohesión: todos los métodos son operaciones matemáticas avanzadas.
 
     Razón para cambiar: solo si se agregan o modifican operaciones científicas.
+
+    Con un NumericBackend (Decimal, Fraction) los métodos se reemplazan una
+    sola vez al construir la instancia; sin él quedan los de float.
     """
 
+    def __init__(self, backend=None):
+        if backend is not None:
+            for name, operation in backend.scientific_operations().items():
+                setattr(self, name, operation)
+
     @staticmethod
     def square_root(number: float) -> float:
         """Calcula la raíz cuadrada. El llamador debe validar que number >= 0."""
@@ -26,6 +34,21 @@ class ScientificOperations:
         """Eleva un número al cuadrado."""
         return number ** 2
 
+    # Mayor n con 2^n representable como float. Basta de sobra: desde n ≈ 64
+    # todo float distinto de 0 y ±1 ya es 0 o inf
+    MAX_FLOAT_SQUARINGS = 1023
+
+    def square_repeated(self, number: float, times: int) -> float:
+        """
+        Eleva al cuadrado `times` veces en forma cerrada: x^(2^n) con una
+        sola potencia. Si el resultado no cabe en un float retorna inf
+        (x^(2^n) nunca es negativo).
+        """
+        try:
+            return number ** float(2 ** min(times, self.MAX_FLOAT_SQUARINGS))
+        except OverflowError:
+            return math.inf
+
     @staticmethod
     def percentage(number: float) -> float:
         """Convierte un número a su valor porcentual (divide entre 100)."""
@@ -0,0 +1,89 @@
+# =============================================================================
+# SRP: ShardedStatisticsReporter - ÚNICA responsabilidad: contar operaciones
+#      desde varios hilos sin perder incrementos
+# Alta Cohesión: todos los métodos escriben o combinan los contadores por hilo
+# =============================================================================
+
+import threading
+
+from models.statistics_reporter import StatisticsReporter
+
+
+class ShardedStatisticsReporter(StatisticsReporter):
+    """
+    Variante de StatisticsReporter segura para uso multihilo.
+
+    Responsabilidad única: contar operaciones concurrentes sin contención.
+    Alta cohesión: todos los métodos operan sobre los contadores por hilo.
+
+    Razón para cambiar: solo si cambia la estrategia de concurrencia.
+
+    Cada hilo incrementa su propio diccionario (shard), así que `+= 1` nunca
+    compite con otro hilo y no hace falta un lock en el camino caliente.
+    get_stats_dict() y get_total() suman los shards al leer. El lock solo se
+    toma cuando un hilo registra su shard por primera vez y en reset(), que
+    no toca los shards (ver reset).
+    """
+
+    def __init__(self, operators=None):
+        super().__init__(operators)
+        self._local = threading.local()
+        self._shards: list[dict] = []
+        self._shards_lock = threading.Lock()
+        # Totales al último reset(); las lecturas los restan
+        self._baseline = dict.fromkeys(self._categories, 0)
+
+    def record_operation(self, operator: str) -> None:
+        """Registra una operación en el shard del hilo actual."""
+        key = self._operator_categories.get(operator)
+        if key:
+            self._shard()[key] += 1
+
+    def record_scientific(self) -> None:
+        """Registra una operación científica en el shard del hilo actual."""
+        self._shard()["sci"] += 1
+
+    def get_total(self) -> int:
+        """Total combinado de todos los hilos."""
+        return sum(self.get_stats_dict().values())
+
+    def get_stats_dict(self) -> dict:
+        """
+        Suma los shards de todos los hilos menos la línea base del último
+        reset() (lectura sin bloquear escritores).
+        """
+        baseline = self._baseline
+        merged = self._merge_shards()
+        for key, value in baseline.items():
+            merged[key] -= value
+        return merged
+
+    def reset(self) -> None:
+        """
+        Pone las estadísticas a cero sin escribir en los shards ajenos: cada
+        shard solo lo modifica su hilo, así que reset() guarda como línea
+        base la suma actual y las lecturas la restan. Un incremento
+        concurrente con el reset queda contado antes o después de él, nunca
+        se pierde ni se pisa.
+        """
+        with self._shards_lock:
+            self._baseline = self._merge_shards()
+        self._rates.reset()
+
+    def _merge_shards(self) -> dict:
+        merged = dict.fromkeys(self._categories, 0)
+        for shard in tuple(self._shards):
+            for key, value in tuple(shard.items()):
+                merged[key] += value
+        return merged
+
+    def _shard(self) -> dict:
+        """Retorna (creándolo la primera vez) el shard del hilo actual."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = dict.fromkeys(self._categories, 0)
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
@@ -0,0 +1,238 @@
+# =============================================================================
+# SRP: SharedHistorySegment - ÚNICA responsabilidad: historial en memoria
+#      compartida entre procesos
+# Alta Cohesión: todos los métodos leen o escriben registros del segmento
+# =============================================================================
+#
+# Distribución del segmento:
+#
+#   cabecera (32 bytes): magic "CALCHST1" | capacidad int64 | cursor int64 | -
+#   registro (40 bytes): resultado float64 | timestamp_ns int64 |
+#                        código de operador uint8 + 7 de relleno |
+#                        operando a float64 | operando b float64 (NaN si unario)
+#
+# El cursor se reserva bajo un multiprocessing.Lock; el registro se escribe
+# fuera del lock y su código de operador se escribe al final, de modo que un
+# lector nunca ve un registro a medio escribir (código 0 = no confirmado).
+# =============================================================================
+
+import math
+import struct
+import sys
+import time
+from multiprocessing import Lock, shared_memory
+
+from models.operator_registry import OperatorRegistry
+from utils.clock import Clock
+
+_HEADER = struct.Struct("<8sqq8x")
+_RECORD = struct.Struct("<dqB7xdd")
+_CODE = struct.Struct("<B")
+_CURSOR_OFFSET = 16
+_CODE_OFFSET = 16
+_MAGIC = b"CALCHST1"
+
+# Códigos fijos de las operaciones científicas (no pasan por el registro)
+_SCIENTIFIC_CODES = {"√": 5, "²": 6, "%": 7, "±": 8}
+_MAX_CODE = 255
+
+
+def _operator_codes(operators: OperatorRegistry) -> dict:
+    """
+    Operador → código de un byte. Los operadores del registro se numeran
+    en orden de registro desde 1 saltando los códigos científicos, así
+    + − × ÷ conservan 1-4 y los agregados siguen desde 9. Todos los
+    procesos que comparten un segmento deben usar registros equivalentes.
+    """
+    codes = dict(_SCIENTIFIC_CODES)
+    reserved = set(codes.values())
+    code = 1
+    for spec in operators:
+        if spec.key in codes:
+            continue
+        while code in reserved:
+            code += 1
+        if code > _MAX_CODE:
+            raise ValueError("Demasiados operadores para el código de un byte")
+        codes[spec.key] = code
+        code += 1
+    return codes
+
+
+class SharedHistorySegment:
+    """
+    Historial de registros de ancho fijo en un segmento de memoria compartida.
+
+    Responsabilidad única: agregar y leer registros compartidos entre procesos.
+    Alta cohesión: todos los métodos operan sobre el mismo buffer compartido.
+
+    Razón para cambiar: solo si cambia el formato binario de los registros.
+
+    Varios procesos pueden agregar (todos con el mismo lock, heredado al
+    crear los procesos) y cualquiera puede leer o agregar resultados sin
+    serializar ni copiar registros.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, lock, owner: bool,
+                 operators: OperatorRegistry = None):
+        operators = operators or OperatorRegistry.default()
+        # Tablas compiladas una vez del registro (código ↔ operador, símbolo)
+        self._codes = _operator_codes(operators)
+        self._code_to_operator = {code: op for op, code in self._codes.items()}
+        self._specs = {spec.key: spec for spec in operators}
+        self._shm = shm
+        self._buf = shm.buf
+        self._lock = lock
+        self._owner = owner
+        magic, self.capacity, _ = _HEADER.unpack_from(self._buf, 0)
+        if magic != _MAGIC:
+            raise ValueError(f"El segmento {shm.name} no es un historial compartido")
+
+    @classmethod
+    def create(cls, capacity: int, name: str = None, lock=None,
+               operators: OperatorRegistry = None) -> "SharedHistorySegment":
+        """Crea un segmento nuevo para `capacity` registros."""
+        size = _HEADER.size + capacity * _RECORD.size
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, capacity, 0)
+        return cls(shm, lock if lock is not None else Lock(), owner=True,
+                   operators=operators)
+
+    @classmethod
+    def attach(cls, name: str, lock=None,
+               operators: OperatorRegistry = None) -> "SharedHistorySegment":
+        """
+        Se conecta a un segmento existente. Sin el lock del creador el
+        segmento es de solo lectura.
+        """
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+        return cls(shm, lock, owner=False, operators=operators)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def lock(self):
+        """Lock a pasar a los procesos hijos para que puedan agregar."""
+        return self._lock
+
+    # -------------------------------------------------------------------------
+    #  Escritura
+    # -------------------------------------------------------------------------
+
+    def append(self, operator: str, a: float, b: float, result: float,
+               timestamp_ns: int = None) -> int:
+        """
+        Agrega un registro y retorna su índice. Para operaciones unarias
+        (√, ², %, ± y los unarios del registro) b puede ser None. Lanza
+        OverflowError si está lleno y ValueError si el operador no existe.
+        """
+        if self._lock is None:
+            raise PermissionError("Segmento conectado sin lock: solo lectura")
+        code = self._codes.get(operator)
+        if code is None:
+            raise ValueError(f"Operador desconocido: {operator!r}")
+
+        with self._lock:
+            _, _, cursor = _HEADER.unpack_from(self._buf, 0)
+            if cursor >= self.capacity:
+                raise OverflowError("El historial compartido está lleno")
+            struct.pack_into("<q", self._buf, _CURSOR_OFFSET, cursor + 1)
+
+        offset = _HEADER.size + cursor * _RECORD.size
+        _RECORD.pack_into(
+            self._buf, offset,
+            result,
+            time.time_ns() if timestamp_ns is None else timestamp_ns,
+            0,
+            a,
+            math.nan if b is None else b,
+        )
+        # Confirmar: el código se escribe al final
+        _CODE.pack_into(self._buf, offset + _CODE_OFFSET, code)
+        return cursor
+
+    # -------------------------------------------------------------------------
+    #  Lectura (sin copiar el segmento)
+    # -------------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        """Cantidad de registros reservados (algunos pueden no estar confirmados)."""
+        return min(_HEADER.unpack_from(self._buf, 0)[2], self.capacity)
+
+    def iter_records(self, start: int = 0):
+        """
+        Genera (resultado, timestamp_ns, operador, a, b) de los registros
+        confirmados a partir de `start`; omite los que aún se escriben.
+        """
+        end = len(self)
+        if start >= end:
+            return
+        view = self._buf[_HEADER.size + start * _RECORD.size:
+                         _HEADER.size + end * _RECORD.size]
+        code_to_operator = self._code_to_operator
+        try:
+            for result, ts, code, a, b in _RECORD.iter_unpack(view):
+                if code:
+                    yield result, ts, code_to_operator[code], a, b
+        finally:
+            view.release()
+
+    def aggregate(self) -> dict:
+        """Conteo, suma, mínimo y máximo de los resultados, recorriendo in situ."""
+        count, total = 0, 0.0
+        low, high = math.inf, -math.inf
+        for result, _, _, _, _ in self.iter_records():
+            count += 1
+            total += result
+            low = min(low, result)
+            high = max(high, result)
+        return {
+            "count": count,
+            "sum": total,
+            "min": low if count else None,
+            "max": high if count else None,
+        }
+
+    def to_history_records(self, start: int = 0) -> list[dict]:
+        """Convierte los registros al formato de HistoryManager (para mostrar)."""
+        clock = Clock.shared()
+        records = []
+        for result, ts, op, a, b in self.iter_records(start):
+            spec = self._specs.get(op)
+            if spec is not None and spec.arity == 2:
+                expression = f"{a} {spec.symbol} {b}"
+            elif spec is not None:
+                expression = f"{spec.symbol}({a})"
+            elif op == "√":
+                expression = f"√({a})"
+            elif op == "²":
+                expression = f"({a})²"
+            elif op == "%":
+                expression = f"{a}%"
+            else:
+                expression = f"±({a})"
+            records.append({
+                "expression": expression,
+                "result": result,
+                "timestamp": clock.format_epoch(ts),
+            })
+        return records
+
+    # -------------------------------------------------------------------------
+    #  Ciclo de vida
+    # -------------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Libera la vista local del segmento."""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Elimina el segmento del sistema (solo el creador)."""
+        if self._owner:
+            self._shm.unlink()
@@ -3,6 +3,13 @@
 # Alta Cohesión: todos los métodos se relacionan con cálculo y reporte de stats
 # =============================================================================
 
+import math
+from fractions import Fraction
+from itertools import islice
+
+from models.operation_rates import WINDOWS, OperationRates
+from models.operator_registry import OperatorRegistry
+
 
 class StatisticsReporter:
     """
@@ -14,18 +21,23 @@ class StatisticsReporter:
     Razón para cambiar: solo si cambian las métricas o el formato del reporte.
     """
 
-    def __init__(self):
-        self._stats = {"sum": 0, "sub": 0, "mul": 0, "div": 0, "sci": 0}
+    CATEGORIES = ("sum", "sub", "mul", "div", "sci")
+
+    def __init__(self, operators: OperatorRegistry = None):
+        # Tabla operador → categoría compilada una vez del registro; las
+        # categorías de operadores agregados se suman a las básicas
+        self._operator_categories = (operators or OperatorRegistry.default()).categories()
+        self._categories = tuple(dict.fromkeys(
+            self.CATEGORIES + tuple(self._operator_categories.values())
+        ))
+        self._stats = dict.fromkeys(self._categories, 0)
+        # Ventanas por segundo: se alimentan de los totales en sample_rates(),
+        # fuera del camino caliente de record_operation
+        self._rates = OperationRates(self._categories)
 
     def record_operation(self, operator: str) -> None:
         """Registra que se realizó una operación según el operador."""
-        operator_map = {
-            "+": "sum",
-            "-": "sub",
-            "*": "mul",
-            "/": "div",
-        }
-        key = operator_map.get(operator)
+        key = self._operator_categories.get(operator)
         if key:
             self._stats[key] += 1
 
@@ -41,32 +53,159 @@ class StatisticsReporter:
         """Retorna una copia del diccionario de estadísticas."""
         return self._stats.copy()
 
-    def generate_report(self, results: list[float] = None) -> str:
-        """Genera un reporte de estadísticas en texto formateado."""
-        total = self.get_total()
+    def sample_rates(self) -> None:
+        """Vuelca en la cubeta del segundo actual las operaciones nuevas."""
+        self._rates.sample(self.get_stats_dict())
+
+    def sample_rates_periodically(self, schedule, interval_ms: int = 1000) -> None:
+        """Muestrea cada interval_ms con `schedule` (view.schedule)."""
+        def tick():
+            self.sample_rates()
+            schedule(interval_ms, tick)
+
+        schedule(interval_ms, tick)
+
+    def get_rates(self, now: float = None) -> dict:
+        """
+        Operaciones por minuto en cada ventana de WINDOWS:
+        {etiqueta: {categoría: ops/min, ..., "total": ops/min}}.
+        """
+        counts = self._rates.window_counts(self.get_stats_dict(), now)
+        rates = {}
+        for window, label in WINDOWS.items():
+            minutes = self._rates.covered_seconds(window, now) / 60
+            per_minute = {key: value / minutes for key, value in counts[window].items()}
+            per_minute["total"] = sum(counts[window].values()) / minutes
+            rates[label] = per_minute
+        return rates
+
+    def generate_report(
+        self, results=None, cache_stats: dict = None,
+        latency_stats: dict = None,
+    ) -> str:
+        """
+        Genera un reporte de estadísticas en texto formateado. `results`
+        puede ser cualquier iterable (p. ej. history.iter_results()): se
+        recorre una vez sin copiarlo.
+        """
+        stats = self.get_stats_dict()
+        total = sum(stats.values())
         msg = (
             f"📊 Estadísticas de Uso\n"
             f"{'─' * 30}\n"
-            f"  Sumas:                {self._stats['sum']}\n"
-            f"  Restas:               {self._stats['sub']}\n"
-            f"  Multiplicaciones:  {self._stats['mul']}\n"
-            f"  Divisiones:           {self._stats['div']}\n"
-            f"  Científicas:          {self._stats['sci']}\n"
+            f"  Sumas:                {stats['sum']}\n"
+            f"  Restas:               {stats['sub']}\n"
+            f"  Multiplicaciones:  {stats['mul']}\n"
+            f"  Divisiones:           {stats['div']}\n"
+            f"  Científicas:          {stats['sci']}\n"
+        )
+        for category in self._categories[len(self.CATEGORIES):]:
+            msg += f"  {category + ':':<22}{stats[category]}\n"
+        msg += (
             f"{'─' * 30}\n"
             f"  TOTAL:                {total}\n"
         )
 
-        if results:
+        msg += self._rates_section()
+
+        summary = self._summarize(results) if results is not None else None
+        if summary:
+            high, low, mean = summary
             msg += (
                 f"\n📈 Análisis de Resultados\n"
                 f"{'─' * 30}\n"
-                f"  Máximo:  {max(results)}\n"
-                f"  Mínimo:   {min(results)}\n"
-                f"  Promedio: {sum(results) / len(results):.4f}\n"
+                f"  Máximo:  {high}\n"
+                f"  Mínimo:   {low}\n"
+                f"  Promedio: {mean:.4f}\n"
+            )
+
+        if cache_stats:
+            lookups = cache_stats["hits"] + cache_stats["misses"]
+            rate = cache_stats["hits"] / lookups * 100 if lookups else 0.0
+            msg += (
+                f"\n⚡ Caché de Resultados\n"
+                f"{'─' * 30}\n"
+                f"  Aciertos:   {cache_stats['hits']}"
+                f" ({cache_stats['disk_hits']} de disco)\n"
+                f"  Fallos:     {cache_stats['misses']}\n"
+                f"  Tasa:       {rate:.1f}%\n"
+                f"  Entradas:   {cache_stats['entries']}\n"
             )
 
+        if latency_stats:
+            msg += (
+                f"\n⏱ Latencia por Handler (µs)\n"
+                f"{'─' * 30}\n"
+                f"  {'handler':<18}{'p50':>8}{'p90':>8}{'p99':>8}{'máx':>9}\n"
+            )
+            for name, handler in latency_stats.items():
+                msg += (
+                    f"  {name.removeprefix('on_'):<18}"
+                    f"{handler['p50_us']:>8.0f}{handler['p90_us']:>8.0f}"
+                    f"{handler['p99_us']:>8.0f}{handler['max_us']:>9.0f}\n"
+                )
+
+        return msg
+
+    def _rates_section(self) -> str:
+        """Ritmo por ventana y tendencia del último minuto frente a 5 minutos."""
+        rates = self.get_rates()
+        if not rates["1 h"]["total"]:
+            return ""
+        labels = list(rates)
+        msg = (
+            f"\n🕒 Ritmo (operaciones/min)\n"
+            f"{'─' * 30}\n"
+            f"  {'':<14}" + "".join(f"{label:>8}" for label in labels) + "\n"
+        )
+        for category in self._categories + ("total",):
+            if rates["1 h"][category]:
+                msg += f"  {category + ':':<14}" + "".join(
+                    f"{rates[label][category]:>8.1f}" for label in labels
+                ) + "\n"
+
+        recent, baseline = rates["1 min"]["total"], rates["5 min"]["total"]
+        change = (recent / baseline - 1) * 100 if baseline else 0.0
+        trend = "↑ subiendo" if change > 10 else "↓ bajando" if change < -10 else "→ estable"
+        msg += f"  Tendencia:    {trend} ({change:+.0f}% vs 5 min)\n"
         return msg
 
+    # Resultados que _summarize toma por vez (max/min/sum en C por tramo)
+    SUMMARY_CHUNK = 4096
+
+    @classmethod
+    def _summarize(cls, results) -> tuple:
+        """
+        (máximo, mínimo, promedio) recorriendo cualquier iterable por tramos
+        de SUMMARY_CHUNK, sin guardarlo entero; None si no hay resultados.
+        El promedio queda en el tipo de los resultados (exacto en Decimal y
+        Fraction); si el historial mezcla modos numéricos se sigue en float.
+        """
+        iterator = iter(results)
+        high = low = total = None
+        count = 0
+        while chunk := list(islice(iterator, cls.SUMMARY_CHUNK)):
+            chunk_high, chunk_low = max(chunk), min(chunk)
+            try:
+                chunk_total = sum(chunk)
+            except TypeError:
+                chunk_total = math.fsum(map(float, chunk))
+            if count:
+                high, low = max(high, chunk_high), min(low, chunk_low)
+                try:
+                    total += chunk_total
+                except TypeError:
+                    total = float(total) + float(chunk_total)
+            else:
+                high, low, total = chunk_high, chunk_low, chunk_total
+            count += len(chunk)
+        if not count:
+            return None
+        mean = total / count
+        # Fraction no admite el formato ".4f" en todas las versiones
+        return high, low, float(mean) if isinstance(mean, Fraction) else mean
+
     def reset(self) -> None:
         """Reinicia todas las estadísticas a cero."""
-        self._stats = {"sum": 0, "sub": 0, "mul": 0, "div": 0, "sci": 0}
+        self._stats = dict.fromkeys(self._categories, 0)
+        self._rates.reset()
@@ -0,0 +1,124 @@
+# =============================================================================
+# SRP: TieredHistoryManager - ÚNICA responsabilidad: historial de dos niveles,
+#      cola caliente en memoria y registros fríos en segmentos en disco
+# Alta Cohesión: todos los métodos operan sobre la cola y los bloques volcados
+# =============================================================================
+#
+# Los últimos hot_size registros (hasta hot_size + block_size) viven como en
+# HistoryManager. Al pasar ese límite, los block_size más antiguos se
+# codifican con HistoryCodec y se agregan a un HistorySegmentStore. Como
+# todos los bloques tienen block_size registros, el registro n está en el
+# bloque n // block_size: el índice del store da (segmento, offset).
+#
+# count() no lee el disco; get_range() lee solo los bloques que toca, y
+# get_all_records() / get_records_reversed() devuelven RecordSequence, que
+# recorre el historial página a página: la vista y las exportaciones llegan
+# a todo el historial con memoria acotada. iter_results() hace lo mismo
+# para el reporte de estadísticas.
+# =============================================================================
+
+from models.compact_history import CompactHistoryManager
+from models.history_codec import HistoryCodec
+from models.history_manager import HistoryManager, RecordSequence
+from models.history_segments import HistorySegmentStore
+
+
+class TieredHistoryManager(HistoryManager):
+    """
+    HistoryManager con nivel caliente en memoria y nivel frío en disco.
+
+    Responsabilidad única: repartir el historial entre memoria y segmentos.
+    Alta cohesión: todos los métodos operan sobre los dos niveles.
+
+    Razón para cambiar: solo si cambia la política de volcado a disco.
+    """
+
+    HOT_SIZE = 10_000
+
+    def __init__(self, hot_size: int = HOT_SIZE, directory: str = None,
+                 block_size: int = CompactHistoryManager.BLOCK_SIZE,
+                 segment_bytes: int = HistorySegmentStore.SEGMENT_BYTES):
+        super().__init__()
+        self.hot_size = hot_size
+        self.block_size = block_size
+        # self._records (heredado) es el nivel caliente
+        self._store = HistorySegmentStore(directory, segment_bytes)
+
+    @property
+    def spilled_count(self) -> int:
+        """Registros que están en disco (siempre los más antiguos)."""
+        return len(self._store) * self.block_size
+
+    def add_record(self, expression: str, result: float) -> None:
+        super().add_record(expression, result)
+        if len(self._records) >= self.hot_size + self.block_size:
+            self._spill()
+
+    def get_all_records(self) -> RecordSequence:
+        return RecordSequence(self, page_size=self.block_size)
+
+    def get_records_reversed(self) -> RecordSequence:
+        return RecordSequence(self, reverse=True, page_size=self.block_size)
+
+    def get_range(self, start: int, stop: int) -> list[dict]:
+        size, spilled = self.block_size, self.spilled_count
+        start, stop = self._clamp_range(start, stop)
+        records = []
+        for index in range(start // size, (min(stop, spilled) - 1) // size + 1):
+            block = HistoryCodec.decode_block(self._store.read(index))
+            records += block[max(start - index * size, 0):stop - index * size]
+        if stop > spilled:
+            records += self._records[max(start - spilled, 0):stop - spilled]
+        return records
+
+    def get_all_results(self) -> list[float]:
+        return [r["result"] for r in self.get_all_records()]
+
+    def iter_results(self):
+        """Resultados bloque a bloque: lee del disco un bloque por vez."""
+        for index in range(len(self._store)):
+            for record in HistoryCodec.decode_block(self._store.read(index)):
+                yield record["result"]
+        yield from super().iter_results()
+
+    def clear(self) -> None:
+        super().clear()
+        self._store.clear()
+
+    def rewind(self, length: int) -> None:
+        while length < self.spilled_count:
+            # Retroceder hasta el nivel frío trae su último bloque a memoria
+            self._records[:0] = HistoryCodec.decode_block(self._store.pop())
+        super().rewind(length - self.spilled_count)
+
+    def is_empty(self) -> bool:
+        return self.count() == 0
+
+    def count(self) -> int:
+        return self.spilled_count + len(self._records)
+
+    def close(self) -> None:
+        """Borra los segmentos del nivel frío."""
+        self._store.close()
+
+    def memory_bytes(self) -> int:
+        """Nivel caliente más el índice del store (los bloques están en disco)."""
+        return super().memory_bytes() + self._store.index_bytes()
+
+    def get_storage_stats(self) -> dict:
+        """Registros por nivel y tamaño de los segmentos."""
+        stats = self._store.get_stats()
+        return {
+            "records": self.count(),
+            "hot_records": len(self._records),
+            "spilled_records": self.spilled_count,
+            "segments": stats["segments"],
+            "disk_bytes": stats["bytes"],
+        }
+
+    def _spill(self) -> None:
+        """Vuelca al disco los bloques más antiguos del nivel caliente."""
+        size = self.block_size
+        while len(self._records) >= self.hot_size + size:
+            self._store.append(HistoryCodec.encode_block(self._records[:size]))
+            del self._records[:size]
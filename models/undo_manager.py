@@ -0,0 +1,82 @@
+# =============================================================================
+# SRP: UndoManager - ÚNICA responsabilidad: gestionar pilas de deshacer/rehacer
+# Alta Cohesión: todos los métodos operan sobre las dos pilas de estados
+# =============================================================================
+
+
+class UndoManager:
+    """
+    Pilas de deshacer/rehacer sobre estados inmutables.
+
+    Responsabilidad única: recordar estados anteriores y posteriores.
+    Alta cohesión: todos los métodos operan sobre las pilas de estados.
+
+    Razón para cambiar: solo si cambia la política de deshacer/rehacer.
+
+    Las pilas son listas enlazadas persistentes de tuplas (estado, resto):
+    apilar y desapilar son O(1) y nunca se copia una pila. Los estados son
+    tuplas inmutables que comparten sus valores (strings, números) con el
+    estado vivo, así que cada paso cuesta solo lo que cambió.
+    """
+
+    def __init__(self):
+        self._undo = None
+        self._redo = None
+        self._undo_depth = 0
+        self._redo_depth = 0
+
+    def record(self, state) -> None:
+        """Apila un estado previo a una acción e invalida los rehacer."""
+        if self._undo is not None and self._undo[0] == state:
+            return
+        self._undo = (state, self._undo)
+        self._undo_depth += 1
+        self._redo = None
+        self._redo_depth = 0
+
+    def undo(self, current):
+        """
+        Retorna el estado anterior distinto de current (o None si no hay)
+        y guarda current para poder rehacerlo.
+        """
+        while self._undo is not None and self._undo[0] == current:
+            self._undo = self._undo[1]
+            self._undo_depth -= 1
+        if self._undo is None:
+            return None
+
+        state, self._undo = self._undo
+        self._undo_depth -= 1
+        self._redo = (current, self._redo)
+        self._redo_depth += 1
+        return state
+
+    def redo(self, current):
+        """Retorna el último estado deshecho (o None) y apila current para deshacer."""
+        if self._redo is None:
+            return None
+
+        state, self._redo = self._redo
+        self._redo_depth -= 1
+        self._undo = (current, self._undo)
+        self._undo_depth += 1
+        return state
+
+    def can_undo(self) -> bool:
+        """Indica si hay estados para deshacer."""
+        return self._undo is not None
+
+    def can_redo(self) -> bool:
+        """Indica si hay estados para rehacer."""
+        return self._redo is not None
+
+    def depth(self) -> tuple[int, int]:
+        """Retorna la cantidad de pasos (deshacer, rehacer) disponibles."""
+        return self._undo_depth, self._redo_depth
+
+    def clear(self) -> None:
+        """Descarta ambas pilas."""
+        self._undo = None
+        self._redo = None
+        self._undo_depth = 0
+        self._redo_depth = 0
@@ -3,8 +3,26 @@
 
 from services.file_manager import FileManager
 from services.error_logger import ErrorLogger
+from services.session_recorder import SessionRecorder
+from services.session_pool import SessionPool
+from services.handler_timer import HandlerTimer
+from services.memory_profiler import MemoryProfiler
+from services.chrome_tracer import ChromeTracer
+from services.metrics_exporter import MetricsExporter
+from services.tabulator import Tabulator
+
+# SessionReplayer y CalculationServer no se reexportan aquí: dependen de
+# controllers, que a su vez importa este paquete. Importarlos desde
+# services.session_replayer y services.rpc_server.
 
 __all__ = [
     "FileManager",
     "ErrorLogger",
+    "SessionRecorder",
+    "SessionPool",
+    "HandlerTimer",
+    "MemoryProfiler",
+    "ChromeTracer",
+    "MetricsExporter",
+    "Tabulator",
 ]
@@ -0,0 +1,216 @@
+# =============================================================================
+# SRP: ChromeTracer - ÚNICA responsabilidad: registrar spans de ejecución en
+#      formato Chrome Trace Event (Perfetto / chrome://tracing)
+# Alta Cohesión: todos los métodos instrumentan, registran o escriben eventos
+# =============================================================================
+#
+# Modo opcional (CALC_TRACE=archivo.json en calculator_main; F12 lo pausa o
+# reanuda). Se registran:
+#   - handler   cada handler del controlador
+#   - view      cada CalculatorView.update_* y la construcción de HistoryView
+#   - io        FileManager.save
+#   - tk        huecos del event loop (un latido que llega tarde) y la espera
+#               hasta que Tk queda ocioso
+#
+# El hilo de Tk solo toma dos timestamps y encola una tupla; un hilo escritor
+# serializa a JSON y escribe en bloques. Estando pausado, cada punto
+# instrumentado cuesta una consulta a `enabled`.
+# =============================================================================
+
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+
+_STOP = object()
+
+
+class ChromeTracer:
+    """
+    Genera un archivo JSON de Trace Events con un escritor en segundo plano.
+
+    Responsabilidad única: medir spans y volcarlos al formato de Chrome.
+    Alta cohesión: todos los métodos producen o persisten eventos de traza.
+
+    Razón para cambiar: solo si cambia qué se traza o el formato de salida.
+    """
+
+    def __init__(self, filepath: str, enabled: bool = True, batch_size: int = 256):
+        self.enabled = enabled
+        self.events_written = 0
+        self._filepath = filepath
+        self._batch_size = batch_size
+        self._pid = os.getpid()
+        self._queue = queue.SimpleQueue()
+        self._writer = threading.Thread(
+            target=self._write_loop, name="chrome-tracer", daemon=True
+        )
+        self._writer.start()
+        self._name_thread(threading.get_ident(), "Tk")
+
+    # -------------------------------------------------------------------------
+    #  Control en tiempo de ejecución
+    # -------------------------------------------------------------------------
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def toggle(self) -> bool:
+        """Pausa o reanuda la traza; retorna el nuevo estado."""
+        self.enabled = not self.enabled
+        self.instant("tracer.enabled" if self.enabled else "tracer.disabled", force=True)
+        return self.enabled
+
+    # -------------------------------------------------------------------------
+    #  Registro de eventos
+    # -------------------------------------------------------------------------
+
+    def complete(self, name: str, category: str, start_ns: int, end_ns: int,
+                 args: dict = None) -> None:
+        """Encola un evento "X" (span con duración)."""
+        self._queue.put((
+            "X", name, category, start_ns, end_ns - start_ns,
+            threading.get_ident(), args,
+        ))
+
+    def instant(self, name: str, category: str = "tracer", force: bool = False) -> None:
+        """Encola un evento "i" (marca puntual)."""
+        if self.enabled or force:
+            self._queue.put((
+                "i", name, category, time.perf_counter_ns(), 0,
+                threading.get_ident(), None,
+            ))
+
+    @contextmanager
+    def span(self, name: str, category: str):
+        """Bloque `with` medido como un span."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.complete(name, category, start, time.perf_counter_ns())
+
+    def wrap(self, name: str, fn, category: str = "handler"):
+        """Envuelve fn para medirla cuando la traza está activa."""
+        clock = time.perf_counter_ns
+        complete = self.complete
+
+        @wraps(fn)
+        def traced(*args, **kwargs):
+            if not self.enabled:
+                return fn(*args, **kwargs)
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                complete(name, category, start, clock())
+
+        return traced
+
+    # -------------------------------------------------------------------------
+    #  Instrumentación de la calculadora
+    # -------------------------------------------------------------------------
+
+    def attach(self, controller) -> None:
+        """
+        Instrumenta handlers, vista y FileManager de un controlador.
+        Debe llamarse antes de controller.initialize().
+        """
+        controller.wrap_handlers(self.wrap)
+
+        view = controller.view
+        for name in dir(type(view)):
+            if name.startswith("update_"):
+                setattr(view, name, self.wrap(f"view.{name}", getattr(view, name), "view"))
+        view.open_history = self.wrap("HistoryView", view.open_history, "view")
+
+        file_mgr = controller.file_mgr
+        file_mgr.save = self.wrap("FileManager.save", file_mgr.save, "io")
+
+    def watch_event_loop(self, schedule, schedule_idle, interval_ms: int = 50,
+                         min_gap_ms: float = 5.0) -> None:
+        """
+        Programa un latido cada interval_ms. Si llega más de min_gap_ms tarde,
+        el retraso se registra como span "tk.loop_gap"; tras cada latido se
+        mide cuánto tarda Tk en quedar ocioso ("tk.idle_wait").
+        """
+        interval_ns = interval_ms * 1_000_000
+        min_gap_ns = int(min_gap_ms * 1_000_000)
+        clock = time.perf_counter_ns
+
+        def arm() -> None:
+            expected_ns = clock() + interval_ns
+            schedule(interval_ms, lambda: beat(expected_ns))
+
+        def beat(expected_ns: int) -> None:
+            now = clock()
+            if self.enabled:
+                if now - expected_ns > min_gap_ns:
+                    self.complete("tk.loop_gap", "tk", expected_ns, now)
+                schedule_idle(lambda: self.complete("tk.idle_wait", "tk", now, clock()))
+            arm()
+
+        arm()
+
+    def close(self) -> None:
+        """Vacía la cola, cierra el arreglo JSON y detiene el escritor."""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+
+    # -------------------------------------------------------------------------
+    #  Escritor en segundo plano
+    # -------------------------------------------------------------------------
+
+    def _name_thread(self, tid: int, name: str) -> None:
+        self._queue.put(("M", "thread_name", "", 0, 0, tid, {"name": name}))
+
+    def _format(self, event) -> str:
+        phase, name, category, start_ns, dur_ns, tid, args = event
+        record = {
+            "ph": phase, "name": name, "cat": category,
+            "pid": self._pid, "tid": tid, "ts": start_ns / 1000,
+        }
+        if phase == "X":
+            record["dur"] = dur_ns / 1000
+        elif phase == "i":
+            record["s"] = "t"
+        if args:
+            record["args"] = args
+        return json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+
+    def _write_loop(self) -> None:
+        get = self._queue.get
+        with open(self._filepath, "w", encoding="utf-8") as f:
+            f.write("[\n")
+            first = True
+            stopping = False
+            while not stopping:
+                batch = [get()]
+                # Juntar lo que ya esté encolado sin bloquear
+                while len(batch) < self._batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                lines = []
+                for event in batch:
+                    if event is _STOP:
+                        stopping = True
+                        continue
+                    lines.append(self._format(event))
+                if lines:
+                    f.write(("" if first else ",\n") + ",\n".join(lines))
+                    first = False
+                    self.events_written += len(lines)
+                    f.flush()
+            f.write("\n]\n")
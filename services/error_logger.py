@@ -4,7 +4,8 @@
 # =============================================================================
 
 import os
-from datetime import datetime
+
+from utils.clock import Clock
 
 
 class ErrorLogger:
@@ -20,13 +21,14 @@ class ErrorLogger:
     def __init__(self, log_filename: str = "calculator_errors.log"):
         log_dir = os.path.dirname(os.path.abspath(__file__))
         self._log_path = os.path.join(log_dir, log_filename)
+        self.error_count = 0
 
     def log(self, error_msg: str) -> None:
         """Registra un mensaje de error con timestamp en el archivo de log."""
+        self.error_count += 1
         try:
             with open(self._log_path, "a", encoding="utf-8") as f:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                f.write(f"[{timestamp}] {error_msg}\n")
+                f.write(f"[{Clock.shared().now()}] {error_msg}\n")
         except Exception:
             pass
 
@@ -0,0 +1,135 @@
+# =============================================================================
+# SRP: EvaluationExecutor - ÚNICA responsabilidad: ejecutar cálculos costosos
+#      fuera del hilo de Tk y entregar sus resultados de vuelta a la UI
+# Alta Cohesión: todos los métodos deciden, lanzan, sondean o cancelan cálculos
+# =============================================================================
+
+import multiprocessing
+from decimal import Decimal
+from fractions import Fraction
+
+
+class EvaluationExecutor:
+    """
+    Ejecuta operaciones en línea o en un proceso trabajador según su costo.
+
+    Responsabilidad única: evaluar cálculos sin congelar la interfaz.
+    Alta cohesión: todos los métodos gestionan el ciclo de vida de un cálculo.
+
+    Razón para cambiar: solo si cambia la estrategia de ejecución en segundo plano.
+
+    El trabajador es un proceso (multiprocessing, modo spawn): un cálculo
+    de C que tarda minutos (Decimal enorme, x² repetido) no se puede
+    interrumpir desde otro hilo, pero un proceso sí se termina. Cancelar
+    mata el trabajador y el siguiente cálculo arranca uno nuevo; al ser
+    daemon tampoco retiene la salida del intérprete. fn y sus argumentos
+    deben poder serializarse con pickle (los motores del modelo lo hacen) y
+    el script principal debe arrancar bajo `if __name__ == "__main__":`.
+
+    Los resultados nunca se entregan desde el trabajador: se sondean con
+    `schedule(ms, callback)` (window.after en la vista Tk), de modo que
+    on_result y on_error siempre corren en el hilo de la interfaz.
+    """
+
+    def __init__(self, schedule, cost_threshold: int = 2_000, poll_ms: int = 15):
+        self._schedule = schedule
+        self._cost_threshold = cost_threshold
+        self._poll_ms = poll_ms
+        self._pool = None
+        self._pending = None
+        self._generation = 0
+
+    @staticmethod
+    def estimate_cost(*operands) -> int:
+        """
+        Estima el costo de operar con los operandos (≈ cantidad de dígitos).
+        Los float cuestan 1: nunca superan el umbral.
+        """
+        cost = 0
+        for value in operands:
+            if isinstance(value, float):
+                cost += 1
+            elif isinstance(value, int):
+                cost += value.bit_length() // 3 + 1
+            elif isinstance(value, Decimal):
+                cost += len(value.as_tuple().digits) + abs(value.adjusted())
+            elif isinstance(value, Fraction):
+                cost += (value.numerator.bit_length()
+                         + value.denominator.bit_length()) // 3 + 1
+            else:
+                cost += 1
+        return cost
+
+    def should_offload(self, *operands) -> bool:
+        """Indica si una operación con estos operandos debe ir al trabajador."""
+        return self.estimate_cost(*operands) >= self._cost_threshold
+
+    def is_busy(self) -> bool:
+        """Indica si hay un cálculo en segundo plano pendiente."""
+        return self._pending is not None
+
+    def run(self, fn, args: tuple, on_result, on_error) -> bool:
+        """
+        Evalúa fn(*args). Retorna False si se resolvió en línea (callbacks ya
+        invocados) o True si quedó en segundo plano.
+        """
+        if not self.should_offload(*args):
+            try:
+                result = fn(*args)
+            except Exception as e:
+                on_error(e)
+            else:
+                on_result(result)
+            return False
+
+        if self._pool is None:
+            self._pool = multiprocessing.get_context("spawn").Pool(1)
+        self._generation += 1
+        self._pending = self._pool.apply_async(fn, args)
+        self._schedule_poll(self._generation, on_result, on_error)
+        return True
+
+    def cancel(self) -> bool:
+        """
+        Cancela el cálculo pendiente terminando el proceso trabajador, así el
+        próximo cálculo no espera detrás de él. Retorna si había uno.
+        """
+        if self._pending is None:
+            return False
+        self._pending = None
+        self._generation += 1
+        self._terminate()
+        return True
+
+    def shutdown(self) -> None:
+        """Descarta lo pendiente y termina el proceso trabajador."""
+        self.cancel()
+        self._terminate()
+
+    def _terminate(self) -> None:
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+    def _schedule_poll(self, generation: int, on_result, on_error) -> None:
+        self._schedule(
+            self._poll_ms, lambda: self._poll(generation, on_result, on_error)
+        )
+
+    def _poll(self, generation: int, on_result, on_error) -> None:
+        """Corre en el hilo de la UI: entrega el resultado si ya está listo."""
+        if generation != self._generation:
+            return  # cancelado o reemplazado
+
+        pending = self._pending
+        if not pending.ready():
+            self._schedule_poll(generation, on_result, on_error)
+            return
+
+        self._pending = None
+        try:
+            result = pending.get()
+        except Exception as e:
+            on_error(e)
+        else:
+            on_result(result)
@@ -4,7 +4,31 @@
 # =============================================================================
 
 import json
-from datetime import datetime
+import math
+import struct
+import time
+from decimal import Decimal
+from itertools import islice
+from fractions import Fraction
+
+from models.compact_history import CompactHistoryManager
+from models.history_codec import HistoryCodec
+from models.history_manager import export_record
+from utils.clock import Clock
+
+# Historial compacto (.chist): firma y largo de las estadísticas en JSON;
+# luego bloques de HistoryCodec, cada uno precedido por su largo. Las
+# marcas de los bloques ya son de pared (Clock.stamp())
+_COMPACT_MAGIC = b"CHIST1\n"
+_COMPACT_HEADER = struct.Struct("<I")
+_BLOCK_LENGTH = struct.Struct("<I")
+
+
+def _json_number(value):
+    """Decimal y Fraction van a JSON como texto exacto ("0.3", "1/3")."""
+    if isinstance(value, (Decimal, Fraction)):
+        return str(value)
+    raise TypeError(f"{type(value).__name__} no es serializable a JSON")
 
 
 class FileManager:
@@ -17,24 +41,41 @@ class FileManager:
     Razón para cambiar: solo si cambia el formato o destino de persistencia.
     """
 
+    def __init__(self):
+        # Contadores de guardado (los lee MetricsExporter desde otro hilo)
+        self.save_count = 0
+        self.save_seconds_total = 0.0
+
     @staticmethod
     def save_as_json(filepath: str, history: list[dict], stats: dict) -> None:
-        """Guarda historial y estadísticas en formato JSON."""
-        data = {
-            "calculator_history": history,
+        """
+        Guarda historial y estadísticas en formato JSON. Los registros se
+        escriben de a uno (el historial puede venir del disco por páginas);
+        el resultado es el mismo que json.dump con indent=4.
+        """
+        options = {"indent": 4, "ensure_ascii": False, "default": _json_number}
+        rest = json.dumps({
             "statistics": stats,
-            "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "saved_at": Clock.shared().now(),
             "total_operations": sum(stats.values()),
-        }
+        }, **options)
         with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+            f.write('{\n    "calculator_history": [')
+            separator = "\n        "
+            for record in history:
+                text = json.dumps(export_record(record), **options)
+                f.write(separator + text.replace("\n", "\n        "))
+                separator = ",\n        "
+            f.write("],\n" if separator == "\n        " else "\n    ],\n")
+            # Las demás claves, sin la llave de apertura
+            f.write(rest[2:])
 
     @staticmethod
     def save_as_text(filepath: str, history: list[dict], stats: dict) -> None:
         """Guarda historial en formato de texto plano."""
         with open(filepath, "w", encoding="utf-8") as f:
             f.write("=== HISTORIAL DE LA CALCULADORA ===\n")
-            f.write(f"Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+            f.write(f"Fecha: {Clock.shared().now()}\n")
             f.write("=" * 40 + "\n\n")
             for record in history:
                 f.write(
@@ -43,12 +84,103 @@ class FileManager:
                 )
             f.write(f"\nTotal de operaciones: {sum(stats.values())}\n")
 
+    @staticmethod
+    def save_as_compact(filepath: str, history: list[dict], stats: dict) -> None:
+        """
+        Guarda historial y estadísticas en el formato binario compacto
+        (símbolos internados, marcas delta en varints).
+        """
+        raw_stats = json.dumps(stats).encode("utf-8")
+        records = iter(history)
+        size = CompactHistoryManager.BLOCK_SIZE
+        with open(filepath, "wb") as f:
+            f.write(_COMPACT_MAGIC)
+            f.write(_COMPACT_HEADER.pack(len(raw_stats)))
+            f.write(raw_stats)
+            while True:
+                batch = [
+                    {
+                        "expression": r["expression"],
+                        "result": r["result"],
+                        "stamp": r.get("stamp", 0),
+                    }
+                    for r in islice(records, size)
+                ]
+                if not batch:
+                    break
+                block = HistoryCodec.encode_block(batch)
+                f.write(_BLOCK_LENGTH.pack(len(block)))
+                f.write(block)
+
+    @staticmethod
+    def load_compact(filepath: str) -> tuple[list[dict], dict]:
+        """
+        Lee un archivo .chist: retorna (registros, estadísticas). Lanza
+        ValueError si el archivo no tiene el formato compacto.
+        """
+        with open(filepath, "rb") as f:
+            data = f.read()
+        if not data.startswith(_COMPACT_MAGIC):
+            raise ValueError(f"No es un historial compacto: {filepath}")
+        pos = len(_COMPACT_MAGIC)
+        (stats_length,) = _COMPACT_HEADER.unpack_from(data, pos)
+        pos += _COMPACT_HEADER.size
+        stats = json.loads(data[pos:pos + stats_length].decode("utf-8"))
+        pos += stats_length
+
+        records = []
+        while pos < len(data):
+            (length,) = _BLOCK_LENGTH.unpack_from(data, pos)
+            pos += _BLOCK_LENGTH.size
+            records += HistoryCodec.decode_block(data[pos:pos + length])
+            pos += length
+        return records, stats
+
+    @staticmethod
+    def save_table(filepath: str, columns: tuple, chunks) -> int:
+        """
+        Escribe una tabla que llega en bloques (listas de columnas) sin
+        reunirla en memoria: JSON si la extensión es .json, si no CSV.
+        Los valores no finitos quedan como null en JSON. Retorna las filas.
+        """
+        rows = 0
+        with open(filepath, "w", encoding="utf-8", newline="") as f:
+            if filepath.endswith(".json"):
+                f.write('{"columns": ' + json.dumps(list(columns), ensure_ascii=False)
+                        + ', "rows": [\n')
+                for block in chunks:
+                    lines = ",\n".join(
+                        "[" + ", ".join(
+                            repr(v) if math.isfinite(v) else "null" for v in row
+                        ) + "]"
+                        for row in zip(*block)
+                    )
+                    if lines:
+                        f.write((",\n" if rows else "") + lines)
+                        rows += len(block[0])
+                f.write("\n]}\n")
+            else:
+                f.write(",".join(columns) + "\n")
+                for block in chunks:
+                    f.writelines(
+                        ",".join(map(repr, row)) + "\n" for row in zip(*block)
+                    )
+                    rows += len(block[0])
+        return rows
+
     def save(self, filepath: str, history: list[dict], stats: dict) -> None:
         """
         Guarda el historial en el formato adecuado según la extensión del archivo.
         Lanza excepción si hay error de I/O (el llamador la maneja).
         """
-        if filepath.endswith(".json"):
-            self.save_as_json(filepath, history, stats)
-        else:
-            self.save_as_text(filepath, history, stats)
+        start = time.perf_counter()
+        try:
+            if filepath.endswith(".json"):
+                self.save_as_json(filepath, history, stats)
+            elif filepath.endswith(".chist"):
+                self.save_as_compact(filepath, history, stats)
+            else:
+                self.save_as_text(filepath, history, stats)
+        finally:
+            self.save_seconds_total += time.perf_counter() - start
+            self.save_count += 1
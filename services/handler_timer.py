@@ -0,0 +1,82 @@
+# =============================================================================
+# SRP: HandlerTimer - ÚNICA responsabilidad: medir la latencia de cada
+#      handler del controlador
+# Alta Cohesión: todos los métodos envuelven handlers o exportan sus tiempos
+# =============================================================================
+#
+# Se conecta con CalculatorController.enable_handler_timing(); los handlers
+# se envuelven en initialize(), así que sin timer el costo es cero (los
+# botones quedan conectados a los métodos originales).
+#
+# La latencia medida es la parte síncrona del handler, es decir, lo que
+# bloquea el hilo de Tk. Las evaluaciones desviadas al EvaluationExecutor
+# cuentan solo el tiempo de despacharlas.
+# =============================================================================
+
+import json
+import time
+from functools import wraps
+
+from models.latency_histogram import LatencyHistogram
+
+
+class HandlerTimer:
+    """
+    Registra la duración de cada handler en un LatencyHistogram propio.
+
+    Responsabilidad única: instrumentar handlers y exponer sus percentiles.
+    Alta cohesión: todos los métodos operan sobre los histogramas por handler.
+
+    Razón para cambiar: solo si cambia qué o cómo se mide.
+    """
+
+    def __init__(self):
+        self.histograms = {}
+
+    def wrap(self, name: str, handler):
+        """Wrapper compatible con CalculatorController.wrap_handlers()."""
+        histogram = self.histograms.setdefault(name, LatencyHistogram())
+        record = histogram.record
+        clock = time.perf_counter_ns
+
+        @wraps(handler)
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                record(clock() - start)
+
+        return timed
+
+    def get_stats_dict(self) -> dict:
+        """{handler: resumen del histograma} de los handlers con muestras."""
+        return {
+            name: histogram.get_stats_dict()
+            for name, histogram in sorted(self.histograms.items())
+            if histogram.count
+        }
+
+    def dump(self, filepath: str) -> None:
+        """Escribe resúmenes y cubetas en JSON para análisis externo."""
+        data = {
+            "bucket_unit": "ns",
+            "handlers": {
+                name: {
+                    "summary": histogram.get_stats_dict(),
+                    "buckets": {
+                        str(value): count
+                        for value, count in histogram.get_buckets().items()
+                    },
+                }
+                for name, histogram in sorted(self.histograms.items())
+                if histogram.count
+            },
+        }
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def reset(self) -> None:
+        """Descarta las muestras de todos los handlers."""
+        for histogram in self.histograms.values():
+            histogram.reset()
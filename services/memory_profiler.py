@@ -0,0 +1,211 @@
+# =============================================================================
+# SRP: MemoryProfiler - ÚNICA responsabilidad: atribuir la memoria viva a los
+#      componentes de la calculadora a lo largo del tiempo
+# Alta Cohesión: todos los métodos toman, agregan o persisten snapshots
+# =============================================================================
+#
+# Modo opcional (CALC_MEMORY_PROFILE=directorio en calculator_main). Usa
+# tracemalloc: cada asignación viva se atribuye al componente cuyo módulo
+# aparece más cerca de la asignación en su traceback; el resto va a "otros".
+#
+# Esa atribución es por sitio de asignación: el texto de una expresión o el
+# resultado de un cálculo los crean el controlador y MathEngine aunque los
+# guarde el historial. Por eso el tamaño del historial (y los bytes por
+# registro) se mide aparte, por propiedad: HistoryManager.memory_bytes()
+# recorre lo que cada historial retiene.
+#
+# Los widgets de Tk guardan casi todo en memoria de Tcl (fuera de Python),
+# así que HistoryView / CalculatorView cuentan solo los objetos Python que
+# los envuelven y los datos que la vista les pasa.
+#
+# Los snapshots se guardan con Snapshot.dump() para compararlos después:
+#
+#   python -m services.memory_profiler diff perfil/snapshot-0001.tracemalloc \
+#                                           perfil/snapshot-0010.tracemalloc
+# =============================================================================
+
+import os
+import time
+import tracemalloc
+
+# Componente → módulo o módulos (relativos a la raíz del proyecto)
+COMPONENTS = {
+    "HistoryManager": (os.path.join("models", "history_manager.py"),
+                       os.path.join("models", "compact_history.py"),
+                       os.path.join("models", "tiered_history.py")),
+    "StatisticsReporter": (os.path.join("models", "statistics_reporter.py"),
+                           os.path.join("models", "operation_rates.py")),
+    "UndoManager": os.path.join("models", "undo_manager.py"),
+    "ResultCache": os.path.join("models", "result_cache.py"),
+    "HistoryView": os.path.join("views", "history_view.py"),
+    "CalculatorView": os.path.join("views", "calculator_view.py"),
+    "CalculatorController": os.path.join("controllers", "calculator_controller.py"),
+}
+OTHER = "otros"
+
+
+class MemoryProfiler:
+    """
+    Muestrea periódicamente la memoria viva y la reparte por componente.
+
+    Responsabilidad única: medir cuánta memoria usa cada componente.
+    Alta cohesión: todos los métodos operan sobre snapshots de tracemalloc.
+
+    Razón para cambiar: solo si cambia cómo se atribuye o guarda la memoria.
+    """
+
+    def __init__(self, output_dir: str = None, interval_s: float = 60.0,
+                 histories=None, nframes: int = 16):
+        self._output_dir = output_dir
+        self._interval_ms = int(interval_s * 1000)
+        # Callable que retorna los HistoryManager a medir
+        self._histories = histories or (lambda: ())
+        self._nframes = nframes
+        self._schedule = None
+        self._root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        self._paths = {
+            os.path.join(self._root, path): name
+            for name, paths in COMPONENTS.items()
+            for path in (paths if isinstance(paths, tuple) else (paths,))
+        }
+        self.samples = []
+
+    # -------------------------------------------------------------------------
+    #  Ciclo de vida
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Activa tracemalloc; las muestras se toman con sample()."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self._nframes)
+        if self._output_dir:
+            os.makedirs(self._output_dir, exist_ok=True)
+
+    def sample_periodically(self, schedule) -> None:
+        """Toma una muestra cada interval_s con `schedule` (view.schedule)."""
+        self._schedule = schedule
+        schedule(self._interval_ms, self._tick)
+
+    def stop(self) -> None:
+        """Toma una última muestra, escribe el reporte y detiene tracemalloc."""
+        if not tracemalloc.is_tracing():
+            return
+        self._schedule = None
+        self.sample()
+        if self._output_dir:
+            path = os.path.join(self._output_dir, "report.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.report())
+        tracemalloc.stop()
+
+    def _tick(self) -> None:
+        if self._schedule is None:
+            return
+        self.sample()
+        self._schedule(self._interval_ms, self._tick)
+
+    # -------------------------------------------------------------------------
+    #  Muestreo
+    # -------------------------------------------------------------------------
+
+    def sample(self) -> dict:
+        """Toma un snapshot, lo atribuye por componente y lo guarda en disco."""
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        sample = {
+            "elapsed_s": 0.0,
+            "timestamp": time.time(),
+            "history_records": 0,
+            "history_bytes": 0,
+            "components": self.attribute(snapshot),
+        }
+        for history in self._histories():
+            sample["history_records"] += history.count()
+            sample["history_bytes"] += history.memory_bytes()
+        if self.samples:
+            sample["elapsed_s"] = sample["timestamp"] - self.samples[0]["timestamp"]
+        self.samples.append(sample)
+
+        if self._output_dir:
+            name = f"snapshot-{len(self.samples):04d}.tracemalloc"
+            snapshot.dump(os.path.join(self._output_dir, name))
+        return sample
+
+    def attribute(self, snapshot: tracemalloc.Snapshot) -> dict:
+        """{componente: bytes vivos}, buscando desde el frame más reciente."""
+        totals = dict.fromkeys(COMPONENTS, 0)
+        totals[OTHER] = 0
+        paths = self._paths
+        for trace in snapshot.traces:
+            owner = OTHER
+            # Los frames vienen del más antiguo al más reciente
+            for frame in reversed(trace.traceback):
+                component = paths.get(frame.filename)
+                if component is not None:
+                    owner = component
+                    break
+            totals[owner] += trace.size
+        return totals
+
+    # -------------------------------------------------------------------------
+    #  Reporte
+    # -------------------------------------------------------------------------
+
+    def report(self) -> str:
+        """Bytes por componente, bytes por registro de historial y crecimiento."""
+        if not self.samples:
+            return "Sin muestras de memoria.\n"
+
+        first, last = self.samples[0], self.samples[-1]
+        components = last["components"]
+        total = sum(components.values())
+        lines = [
+            "🧠 Memoria por Componente (sitio de asignación)",
+            "─" * 44,
+        ]
+        for name, size in sorted(components.items(), key=lambda item: -item[1]):
+            lines.append(f"  {name:<22}{size / 1024:>12,.1f} KiB"
+                         f"{size / total * 100 if total else 0:>7.1f}%")
+        lines.append(f"  {'TOTAL':<22}{total / 1024:>12,.1f} KiB")
+
+        records = last["history_records"]
+        if records:
+            retained = last["history_bytes"]
+            lines.append(f"\n  Historial retenido: {retained / 1024:,.1f} KiB"
+                         f" ({retained / total * 100 if total else 0:.1f}% del total)")
+            lines.append(f"  Registros de historial: {records:,}"
+                         f" ({retained / records:,.0f} bytes/registro)")
+
+        elapsed = last["elapsed_s"]
+        if elapsed > 0:
+            growth = total - sum(first["components"].values())
+            lines.append(f"  Crecimiento: {growth / 1024:+,.1f} KiB en "
+                         f"{elapsed:,.0f} s ({growth / elapsed * 60 / 1024:+,.1f}"
+                         f" KiB/min, {len(self.samples)} muestras)")
+        return "\n".join(lines) + "\n"
+
+
+def diff_snapshots(old_path: str, new_path: str, limit: int = 15) -> str:
+    """Las `limit` líneas de código cuya memoria más cambió entre dos snapshots."""
+    old = tracemalloc.Snapshot.load(old_path)
+    new = tracemalloc.Snapshot.load(new_path)
+    stats = new.compare_to(old, "lineno")
+    return "\n".join(str(stat) for stat in stats[:limit]) + "\n"
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Compara dos snapshots de memoria de la calculadora."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    diff = commands.add_parser("diff", help="diferencias por línea de código")
+    diff.add_argument("old")
+    diff.add_argument("new")
+    diff.add_argument("--limit", type=int, default=15)
+    options = parser.parse_args()
+
+    print(diff_snapshots(options.old, options.new, options.limit), end="")
@@ -0,0 +1,143 @@
+# =============================================================================
+# SRP: MetricsExporter - ÚNICA responsabilidad: publicar métricas en formato
+#      de exposición de Prometheus por HTTP local
+# Alta Cohesión: todos los métodos recolectan, formatean o sirven métricas
+# =============================================================================
+#
+# Modo opcional (CALC_METRICS_PORT=9464 en calculator_main):
+#
+#   curl http://127.0.0.1:9464/metrics
+#
+# El servidor corre en un hilo daemon y lee los contadores sin tomar locks:
+# son enteros y diccionarios que el hilo de Tk actualiza con operaciones
+# atómicas bajo el GIL (dict.copy, len, += en un slot de lista). Una lectura
+# puede quedar una operación atrás, nunca corrupta.
+# =============================================================================
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+QUANTILES = (("0.5", 50), ("0.9", 90), ("0.99", 99))
+
+
+class MetricsExporter:
+    """
+    Expone /metrics con contadores de todas las ventanas de la calculadora.
+
+    Responsabilidad única: traducir el estado interno al formato de texto.
+    Alta cohesión: todos los métodos producen o sirven la exposición.
+
+    Razón para cambiar: solo si cambian las métricas o el formato.
+    """
+
+    def __init__(self, controllers: list, logger=None, timer=None,
+                 host: str = "127.0.0.1", port: int = 9464):
+        self._controllers = controllers
+        self._logger = logger
+        self._timer = timer
+        self._address = (host, port)
+        self._server = None
+        self._thread = None
+
+    # -------------------------------------------------------------------------
+    #  Ciclo de vida
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Empieza a servir en un hilo daemon."""
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(self._address, Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    # -------------------------------------------------------------------------
+    #  Exposición
+    # -------------------------------------------------------------------------
+
+    def render(self) -> str:
+        """Texto de exposición con todas las métricas actuales."""
+        lines = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        family("calculator_operations_total", "counter",
+               "Operaciones realizadas por categoría.")
+        for window, controller in enumerate(self._controllers):
+            for category, count in controller.stats.get_stats_dict().items():
+                lines.append(
+                    f'calculator_operations_total{{window="{window}",'
+                    f'category="{category}"}} {count}'
+                )
+
+        family("calculator_history_records", "gauge",
+               "Registros en el historial.")
+        for window, controller in enumerate(self._controllers):
+            lines.append(
+                f'calculator_history_records{{window="{window}"}} '
+                f"{controller.history.count()}"
+            )
+
+        family("calculator_save_duration_seconds", "summary",
+               "Duración de los guardados del historial.")
+        for window, controller in enumerate(self._controllers):
+            file_mgr = controller.file_mgr
+            labels = f'{{window="{window}"}}'
+            lines.append(f"calculator_save_duration_seconds_count{labels} "
+                         f"{file_mgr.save_count}")
+            lines.append(f"calculator_save_duration_seconds_sum{labels} "
+                         f"{file_mgr.save_seconds_total:.6f}")
+
+        if self._logger is not None:
+            family("calculator_errors_total", "counter",
+                   "Errores registrados por ErrorLogger.")
+            lines.append(f"calculator_errors_total {self._logger.error_count}")
+
+        if self._timer is not None:
+            family("calculator_handler_latency_seconds", "summary",
+                   "Latencia síncrona de cada handler del controlador.")
+            for name, histogram in sorted(self._timer.histograms.items()):
+                for quantile, percent in QUANTILES:
+                    lines.append(
+                        f'calculator_handler_latency_seconds{{handler="{name}",'
+                        f'quantile="{quantile}"}} '
+                        f"{histogram.percentile(percent) / 1e9:.9f}"
+                    )
+                labels = f'{{handler="{name}"}}'
+                lines.append(f"calculator_handler_latency_seconds_count{labels} "
+                             f"{histogram.count}")
+                lines.append(f"calculator_handler_latency_seconds_sum{labels} "
+                             f"{histogram.total_ns / 1e9:.9f}")
+
+        return "\n".join(lines) + "\n"
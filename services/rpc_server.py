@@ -0,0 +1,392 @@
+# =============================================================================
+# SRP: CalculationServer - ÚNICA responsabilidad: exponer el motor de cálculo
+#      por JSON-RPC 2.0 a otras herramientas locales
+# Alta Cohesión: todos los métodos reciben, despachan o responden peticiones
+# =============================================================================
+#
+# Protocolo: JSON-RPC 2.0, un mensaje JSON por línea (TCP o socket Unix).
+#
+#   → {"jsonrpc": "2.0", "id": 1, "method": "calculate", "params": ["+", 2, 3]}
+#   ← {"jsonrpc": "2.0", "id": 1, "result": 5}
+#   → {"jsonrpc": "2.0", "id": 2, "method": "reduce", "params": ["+", [1, 2, 3]]}
+#   ← {"jsonrpc": "2.0", "id": 2, "result": 6.0}
+#
+# Métodos: calculate, reduce, sqrt, square, percentage, negate, pi,
+#          memory.add, memory.subtract, memory.recall, memory.clear,
+#          history.list, history.count, history.clear, stats
+#
+#   python -m services.rpc_server --port 8765
+#   python -m services.rpc_server --unix /tmp/calc.sock
+# =============================================================================
+
+import asyncio
+import json
+import math
+
+from controllers.component_pool import ComponentPool
+from models.history_manager import export_record
+from services.session_pool import SessionPool
+
+# Códigos de error JSON-RPC (estándar y propios de la calculadora)
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+DIVISION_BY_ZERO = -32000
+NEGATIVE_ROOT = -32001
+
+
+class RpcError(Exception):
+    """Error que se devuelve al cliente como objeto `error` de JSON-RPC."""
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class CalculationServer:
+    """
+    Servidor asyncio que atiende muchas conexiones en un solo hilo.
+
+    Responsabilidad única: traducir peticiones JSON-RPC a llamadas al modelo.
+    Alta cohesión: todos los métodos atienden el protocolo o las conexiones.
+
+    Razón para cambiar: solo si cambia el protocolo o los métodos expuestos.
+
+    Los componentes sin estado (MathEngine, ScientificOperations, ...) se
+    comparten; cada conexión recibe su propia sesión del SessionPool, y las
+    conexiones inactivas por más de idle_timeout se cierran.
+    """
+
+    def __init__(self, pool: SessionPool = None, components: ComponentPool = None):
+        self.pool = pool or SessionPool()
+        components = components or ComponentPool.shared()
+        self._math = components.math
+        self._scientific = components.scientific
+        self._validator = components.validator
+        self._formatter = components.formatter
+        self._server = None
+        self._sweeper = None
+        self._writers = {}
+        self._handlers = set()
+        self.requests_served = 0
+
+        # Tabla de despacho compilada una sola vez
+        self._methods = {
+            "calculate": self._rpc_calculate,
+            "reduce": self._rpc_reduce,
+            "sqrt": self._rpc_sqrt,
+            "square": self._rpc_square,
+            "percentage": self._rpc_percentage,
+            "negate": self._rpc_negate,
+            "pi": self._rpc_pi,
+            "memory.add": self._rpc_memory_add,
+            "memory.subtract": self._rpc_memory_subtract,
+            "memory.recall": self._rpc_memory_recall,
+            "memory.clear": self._rpc_memory_clear,
+            "history.list": self._rpc_history_list,
+            "history.count": self._rpc_history_count,
+            "history.clear": self._rpc_history_clear,
+            "stats": self._rpc_stats,
+        }
+
+    # -------------------------------------------------------------------------
+    #  Ciclo de vida del servidor
+    # -------------------------------------------------------------------------
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765,
+                    unix_path: str = None) -> None:
+        """Empieza a aceptar conexiones por TCP o, si se indica, socket Unix."""
+        if unix_path:
+            self._server = await asyncio.start_unix_server(
+                self._handle_client, path=unix_path
+            )
+        else:
+            self._server = await asyncio.start_server(
+                self._handle_client, host, port, backlog=4096
+            )
+        self._sweeper = asyncio.create_task(self._sweep_idle())
+
+    def addresses(self) -> list:
+        """Direcciones en las que escucha el servidor."""
+        return [sock.getsockname() for sock in self._server.sockets]
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Deja de aceptar conexiones y cierra las existentes."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+        self._server.close()
+        for writer in list(self._writers.values()):
+            writer.close()
+        # Esperar a que cada conexión termine sola (readline retorna b"")
+        if self._handlers:
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+
+    # -------------------------------------------------------------------------
+    #  Conexiones
+    # -------------------------------------------------------------------------
+
+    async def _handle_client(self, reader: asyncio.StreamReader,
+                             writer: asyncio.StreamWriter) -> None:
+        session = self.pool.acquire()
+        self._writers[session.session_id] = writer
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                session.touch()
+                response = self.handle_message(session, line)
+                if response is not None:
+                    writer.write(response)
+                    await writer.drain()
+        except (ConnectionError, ValueError):
+            # ValueError: línea más larga que el límite del StreamReader
+            pass
+        finally:
+            self._handlers.discard(task)
+            self._writers.pop(session.session_id, None)
+            self.pool.release(session)
+            writer.close()
+
+    async def _sweep_idle(self) -> None:
+        """Cierra periódicamente las conexiones de sesiones inactivas."""
+        interval = max(self.pool.idle_timeout / 4, 0.05)
+        while True:
+            await asyncio.sleep(interval)
+            for session in self.pool.idle_sessions():
+                writer = self._writers.pop(session.session_id, None)
+                self.pool.evict(session)
+                if writer is not None:
+                    writer.close()
+
+    # -------------------------------------------------------------------------
+    #  Protocolo JSON-RPC
+    # -------------------------------------------------------------------------
+
+    def handle_message(self, session, raw: bytes):
+        """Procesa una línea recibida. Retorna la respuesta en bytes o None."""
+        try:
+            message = json.loads(raw)
+        except ValueError:
+            return self._encode(self._error(None, PARSE_ERROR, "Parse error"))
+
+        if isinstance(message, list):
+            if not message:
+                return self._encode(
+                    self._error(None, INVALID_REQUEST, "Invalid Request")
+                )
+            replies = [self._dispatch(session, m) for m in message]
+            replies = [r for r in replies if r is not None]
+            return self._encode(replies) if replies else None
+
+        reply = self._dispatch(session, message)
+        return None if reply is None else self._encode(reply)
+
+    def _dispatch(self, session, message):
+        """Ejecuta una petición individual; None para notificaciones."""
+        if not isinstance(message, dict) or message.get("jsonrpc") != "2.0":
+            return self._error(None, INVALID_REQUEST, "Invalid Request")
+
+        request_id = message.get("id")
+        is_notification = "id" not in message
+        method = self._methods.get(message.get("method"))
+        params = message.get("params", [])
+        self.requests_served += 1
+
+        try:
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, "Method not found")
+            if isinstance(params, list):
+                result = method(session, *params)
+            elif isinstance(params, dict):
+                result = method(session, **params)
+            else:
+                raise RpcError(INVALID_PARAMS, "Invalid params")
+        except RpcError as e:
+            reply = self._error(request_id, e.code, e.message)
+        except TypeError:
+            reply = self._error(request_id, INVALID_PARAMS, "Invalid params")
+        except (ArithmeticError, ValueError) as e:
+            reply = self._error(request_id, INVALID_PARAMS, str(e))
+        else:
+            reply = {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+        return None if is_notification else reply
+
+    @staticmethod
+    def _error(request_id, code: int, message: str) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "error": {"code": code, "message": message},
+        }
+
+    @classmethod
+    def _encode(cls, payload) -> bytes:
+        """
+        Serializa la respuesta. JSON estándar no admite Infinity ni NaN: si
+        aparecen (p. ej. un desbordamiento) se envían como los strings
+        "Infinity", "-Infinity" y "NaN".
+        """
+        try:
+            text = json.dumps(payload, separators=(",", ":"), allow_nan=False)
+        except ValueError:
+            text = json.dumps(cls._finite_json(payload), separators=(",", ":"))
+        return (text + "\n").encode()
+
+    @classmethod
+    def _finite_json(cls, value):
+        """Copia de `value` con los float no finitos reemplazados por strings."""
+        if isinstance(value, float):
+            if math.isnan(value):
+                return "NaN"
+            if math.isinf(value):
+                return "Infinity" if value > 0 else "-Infinity"
+            return value
+        if isinstance(value, dict):
+            return {key: cls._finite_json(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [cls._finite_json(item) for item in value]
+        return value
+
+    @staticmethod
+    def _number(value) -> float:
+        """Valida que un parámetro sea numérico (bool no cuenta)."""
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise RpcError(INVALID_PARAMS, "Se esperaba un número")
+        return value
+
+    # -------------------------------------------------------------------------
+    #  Métodos expuestos (reciben la sesión del cliente)
+    # -------------------------------------------------------------------------
+
+    def _rpc_calculate(self, session, operator: str, a, b):
+        a, b = self._number(a), self._number(b)
+        if operator == "/" and self._validator.is_division_by_zero(b):
+            raise RpcError(DIVISION_BY_ZERO, "No se puede dividir entre cero.")
+
+        result = self._math.calculate(operator, a, b)
+        if result is None:
+            raise RpcError(INVALID_PARAMS, f"Operador desconocido: {operator}")
+
+        symbol = self._formatter.get_operator_symbol(operator)
+        session.stats.record_operation(operator)
+        session.history.add_record(f"{a} {symbol} {b}", result)
+        return result
+
+    def _rpc_reduce(self, session, operator: str, values):
+        """a op b op c … sobre una lista en una sola llamada (MathEngine.reduce)."""
+        if not isinstance(values, list) or not values:
+            raise RpcError(INVALID_PARAMS, "Se esperaba una lista de números no vacía")
+        values = [self._number(value) for value in values]
+        if operator == "/" and any(
+            self._validator.is_division_by_zero(value) for value in values[1:]
+        ):
+            raise RpcError(DIVISION_BY_ZERO, "No se puede dividir entre cero.")
+
+        result = self._math.reduce(operator, values)
+        if result is None:
+            raise RpcError(INVALID_PARAMS, f"Operador desconocido: {operator}")
+
+        symbol = self._formatter.get_operator_symbol(operator)
+        session.stats.record_operation(operator)
+        session.history.add_record(f"{symbol} ({len(values)} valores)", result)
+        return result
+
+    def _rpc_sqrt(self, session, x):
+        x = self._number(x)
+        if self._validator.is_negative(x):
+            raise RpcError(
+                NEGATIVE_ROOT, "No se puede calcular raíz de un número negativo."
+            )
+        return self._record_scientific(
+            session, f"√({self._formatter.format(x)})", self._scientific.square_root(x)
+        )
+
+    def _rpc_square(self, session, x):
+        x = self._number(x)
+        return self._record_scientific(
+            session, f"({self._formatter.format(x)})²", self._scientific.square(x)
+        )
+
+    def _rpc_percentage(self, session, x):
+        return self._scientific.percentage(self._number(x))
+
+    def _rpc_negate(self, session, x):
+        return self._scientific.negate(self._number(x))
+
+    def _rpc_pi(self, session):
+        return self._scientific.get_pi()
+
+    def _rpc_memory_add(self, session, x):
+        session.memory.add(self._number(x))
+        return session.memory.recall()
+
+    def _rpc_memory_subtract(self, session, x):
+        session.memory.subtract(self._number(x))
+        return session.memory.recall()
+
+    def _rpc_memory_recall(self, session):
+        return session.memory.recall()
+
+    def _rpc_memory_clear(self, session):
+        session.memory.clear()
+        return 0
+
+    def _rpc_history_list(self, session, limit: int = 100):
+        # Solo los últimos `limit` registros: no copia el historial entero
+        count = session.history.count()
+        records = session.history.get_range(count - limit, count)
+        records.reverse()
+        return [export_record(r) for r in records]
+
+    def _rpc_history_count(self, session):
+        return session.history.count()
+
+    def _rpc_history_clear(self, session):
+        session.history.clear()
+        session.stats.reset()
+        return 0
+
+    def _rpc_stats(self, session):
+        return {
+            "session": session.stats.get_stats_dict(),
+            "pool": self.pool.get_stats_dict(),
+        }
+
+    @staticmethod
+    def _record_scientific(session, expression: str, result):
+        session.history.add_record(expression, result)
+        session.stats.record_scientific()
+        return result
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor JSON-RPC de la calculadora.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="ruta de socket Unix (en lugar de TCP)")
+    parser.add_argument("--idle-timeout", type=float, default=300.0,
+                        help="segundos sin actividad antes de cerrar una sesión")
+    options = parser.parse_args()
+
+    async def run():
+        server = CalculationServer(SessionPool(idle_timeout=options.idle_timeout))
+        await server.start(options.host, options.port, options.unix)
+        print(f"Escuchando en {server.addresses()}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,114 @@
+# =============================================================================
+# SRP: SessionPool - ÚNICA responsabilidad: reciclar sesiones de cliente
+# Alta Cohesión: todos los métodos entregan, devuelven o expulsan sesiones
+# =============================================================================
+
+import itertools
+import time
+
+from models.memory_manager import MemoryManager
+from models.history_manager import HistoryManager
+from models.statistics_reporter import StatisticsReporter
+
+
+class CalculatorSession:
+    """
+    Estado propio de un cliente remoto: memoria, historial y estadísticas.
+
+    Responsabilidad única: agrupar el estado aislado de una sesión.
+    Alta cohesión: todos los atributos pertenecen al mismo cliente.
+
+    Razón para cambiar: solo si cambia qué estado es propio de cada cliente.
+    """
+
+    def __init__(self, session_id: int):
+        self.session_id = session_id
+        self.memory = MemoryManager()
+        self.history = HistoryManager()
+        self.stats = StatisticsReporter()
+        self.last_active = time.monotonic()
+
+    def touch(self) -> None:
+        """Marca la sesión como activa ahora."""
+        self.last_active = time.monotonic()
+
+    def reset(self) -> None:
+        """Deja la sesión como nueva para reutilizarla con otro cliente."""
+        self.memory.clear()
+        self.history.clear()
+        self.stats.reset()
+        self.touch()
+
+
+class SessionPool:
+    """
+    Entrega sesiones a los clientes y las recicla al desconectarse.
+
+    Responsabilidad única: administrar el ciclo de vida de las sesiones.
+    Alta cohesión: todos los métodos operan sobre sesiones activas y libres.
+
+    Razón para cambiar: solo si cambia la política de reutilización o expulsión.
+
+    Las sesiones liberadas se limpian y se guardan (hasta max_free) para no
+    volver a construir sus componentes con cada conexión.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0, max_free: int = 1024):
+        self.idle_timeout = idle_timeout
+        self._max_free = max_free
+        self._active: dict[int, CalculatorSession] = {}
+        self._free: list[CalculatorSession] = []
+        self._ids = itertools.count(1)
+        self.created = 0
+        self.reused = 0
+        self.evicted = 0
+
+    def acquire(self) -> CalculatorSession:
+        """Entrega una sesión limpia (reutilizada si hay alguna libre)."""
+        if self._free:
+            session = self._free.pop()
+            session.session_id = next(self._ids)
+            session.touch()
+            self.reused += 1
+        else:
+            session = CalculatorSession(next(self._ids))
+            self.created += 1
+        self._active[session.session_id] = session
+        return session
+
+    def release(self, session: CalculatorSession) -> None:
+        """Devuelve una sesión al pool."""
+        if self._active.pop(session.session_id, None) is None:
+            return
+        if len(self._free) < self._max_free:
+            session.reset()
+            self._free.append(session)
+
+    def idle_sessions(self, now: float = None) -> list[CalculatorSession]:
+        """Retorna las sesiones activas sin uso por más de idle_timeout."""
+        now = time.monotonic() if now is None else now
+        limit = now - self.idle_timeout
+        return [s for s in self._active.values() if s.last_active < limit]
+
+    def evict(self, session: CalculatorSession) -> None:
+        """
+        Expulsa una sesión inactiva (el llamador cierra su conexión).
+        No se recicla: su conexión puede seguir liberándola al terminar,
+        y esa llamada tardía no debe afectar a otro cliente.
+        """
+        if self._active.pop(session.session_id, None) is not None:
+            self.evicted += 1
+
+    def active_count(self) -> int:
+        """Cantidad de sesiones en uso."""
+        return len(self._active)
+
+    def get_stats_dict(self) -> dict:
+        """Contadores del pool."""
+        return {
+            "active": len(self._active),
+            "free": len(self._free),
+            "created": self.created,
+            "reused": self.reused,
+            "evicted": self.evicted,
+        }
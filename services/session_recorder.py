@@ -0,0 +1,119 @@
+# =============================================================================
+# SRP: SessionRecorder - ÚNICA responsabilidad: grabar sesiones de uso
+# Alta Cohesión: todos los métodos escriben o leen el flujo de eventos grabado
+# =============================================================================
+#
+# Formato del archivo (texto, una línea por evento, opcionalmente .gz):
+#
+#   #calc-session v1
+#   <delta_us>\t<handler>[\t<args_json>]
+#
+# delta_us es el tiempo en microsegundos desde el evento anterior, lo que
+# mantiene las líneas cortas y permite reproducir el ritmo original.
+# =============================================================================
+
+import gzip
+import json
+import time
+
+SESSION_HEADER = "#calc-session v1"
+
+
+class SessionRecorder:
+    """
+    Graba el flujo de callbacks del controlador con sus tiempos.
+
+    Responsabilidad única: persistir y leer la secuencia de eventos de entrada.
+    Alta cohesión: todos los métodos operan sobre el archivo de sesión.
+
+    Razón para cambiar: solo si cambia el formato del archivo de sesión.
+
+    Solo se graban las llamadas de nivel superior: si un handler invoca a
+    otro (on_operator → on_equals), la llamada anidada no se duplica.
+    """
+
+    def __init__(self, filepath: str):
+        self._file = self.open_session(filepath, "w")
+        self._file.write(SESSION_HEADER + "\n")
+        self._last_ns = time.perf_counter_ns()
+        self._depth = 0
+        self.event_count = 0
+
+    @staticmethod
+    def open_session(filepath: str, mode: str):
+        """Abre un archivo de sesión en modo texto, comprimido si termina en .gz."""
+        if filepath.endswith(".gz"):
+            return gzip.open(filepath, mode + "t", encoding="utf-8")
+        return open(filepath, mode, encoding="utf-8")
+
+    def attach(self, controller) -> None:
+        """Envuelve los handlers del controlador (antes de initialize())."""
+        controller.wrap_handlers(self._wrap)
+
+    def record(self, handler_name: str, args: tuple = ()) -> None:
+        """Escribe un evento con el tiempo transcurrido desde el anterior."""
+        now = time.perf_counter_ns()
+        delta_us = (now - self._last_ns) // 1000
+        self._last_ns = now
+
+        self._file.write(self._format_event(delta_us, handler_name, args))
+        self.event_count += 1
+
+    def close(self) -> None:
+        """Cierra el archivo de sesión."""
+        if not self._file.closed:
+            self._file.close()
+
+    @classmethod
+    def write_events(cls, filepath: str, events) -> int:
+        """
+        Escribe eventos (delta_us, handler, args) ya construidos, por ejemplo
+        los de un WorkloadGenerator. Retorna la cantidad escrita.
+        """
+        count = 0
+        with cls.open_session(filepath, "w") as f:
+            f.write(SESSION_HEADER + "\n")
+            for delta_us, name, args in events:
+                f.write(cls._format_event(delta_us, name, args))
+                count += 1
+        return count
+
+    @classmethod
+    def read_events(cls, filepath: str):
+        """
+        Genera los eventos grabados como tuplas (delta_us, handler, args).
+        Lanza ValueError si el archivo no es una sesión válida.
+        """
+        with cls.open_session(filepath, "r") as f:
+            header = f.readline().rstrip("\n")
+            if header != SESSION_HEADER:
+                raise ValueError(f"Archivo de sesión no reconocido: {filepath}")
+
+            for line in f:
+                parts = line.rstrip("\n").split("\t")
+                if len(parts) < 2:
+                    continue
+                args = tuple(json.loads(parts[2])) if len(parts) > 2 else ()
+                yield int(parts[0]), parts[1], args
+
+    @staticmethod
+    def _format_event(delta_us: int, handler_name: str, args: tuple) -> str:
+        """Serializa un evento como una línea del archivo de sesión."""
+        line = f"{delta_us}\t{handler_name}"
+        if args:
+            line += "\t" + json.dumps(list(args), separators=(",", ":"))
+        return line + "\n"
+
+    def _wrap(self, name: str, handler):
+        """Crea la versión grabadora de un handler."""
+
+        def recorded(*args):
+            if self._depth == 0:
+                self.record(name, args)
+            self._depth += 1
+            try:
+                return handler(*args)
+            finally:
+                self._depth -= 1
+
+        return recorded
@@ -0,0 +1,187 @@
+# =============================================================================
+# SRP: SessionReplayer - ÚNICA responsabilidad: reproducir sesiones grabadas
+# Alta Cohesión: todos los métodos ejecutan eventos y miden su rendimiento
+# =============================================================================
+#
+# Uso desde la línea de comandos:
+#
+#   python -m services.session_replayer sesion.rec [--realtime] [--json]
+# =============================================================================
+
+import hashlib
+import json
+import time
+from array import array
+
+from controllers.calculator_controller import CalculatorController
+from services.session_recorder import SessionRecorder
+from views.headless_view import HeadlessView
+
+
+class ReplayReport:
+    """
+    Resultado de una reproducción: rendimiento y estado final.
+
+    Responsabilidad única: resumir las métricas de una reproducción.
+    Alta cohesión: todos los métodos calculan o presentan esas métricas.
+
+    Razón para cambiar: solo si cambian las métricas reportadas.
+    """
+
+    def __init__(self, event_count: int, elapsed_s: float,
+                 latencies: dict, final_state: dict):
+        self.event_count = event_count
+        self.elapsed_s = elapsed_s
+        self.final_state = final_state
+        self._latencies = latencies
+
+    @property
+    def keystrokes_per_second(self) -> float:
+        """Eventos procesados por segundo de reloj."""
+        return self.event_count / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def handler_summary(self) -> dict:
+        """Retorna conteo y latencias (µs) por handler."""
+        summary = {}
+        for name, samples in sorted(self._latencies.items()):
+            ordered = sorted(samples)
+            count = len(ordered)
+            summary[name] = {
+                "count": count,
+                "mean_us": sum(ordered) / count / 1000,
+                "p50_us": ordered[(count - 1) // 2] / 1000,
+                "p99_us": ordered[min(count - 1, int(count * 0.99))] / 1000,
+                "max_us": ordered[-1] / 1000,
+            }
+        return summary
+
+    def to_dict(self) -> dict:
+        """Representación serializable a JSON."""
+        return {
+            "events": self.event_count,
+            "elapsed_s": self.elapsed_s,
+            "keystrokes_per_second": self.keystrokes_per_second,
+            "handlers": self.handler_summary(),
+            "final_state": self.final_state,
+        }
+
+    def to_text(self) -> str:
+        """Reporte legible para la consola."""
+        lines = [
+            f"Eventos:        {self.event_count}",
+            f"Tiempo total:   {self.elapsed_s:.3f} s",
+            f"Teclas/s:       {self.keystrokes_per_second:,.0f}",
+            "",
+            f"{'Handler':<22}{'n':>9}{'media µs':>11}{'p50 µs':>10}"
+            f"{'p99 µs':>10}{'máx µs':>10}",
+        ]
+        for name, s in self.handler_summary().items():
+            lines.append(
+                f"{name:<22}{s['count']:>9}{s['mean_us']:>11.2f}"
+                f"{s['p50_us']:>10.2f}{s['p99_us']:>10.2f}{s['max_us']:>10.2f}"
+            )
+        lines.append("")
+        lines.append("Estado final:")
+        for key, value in self.final_state.items():
+            lines.append(f"  {key}: {value}")
+        return "\n".join(lines)
+
+
+class SessionReplayer:
+    """
+    Reproduce eventos grabados contra un CalculatorController sin UI.
+
+    Responsabilidad única: ejecutar una secuencia de eventos y medirla.
+    Alta cohesión: todos los métodos conducen o miden la reproducción.
+
+    Razón para cambiar: solo si cambia la forma de reproducir sesiones.
+
+    Cada reproducción usa un controlador nuevo, por lo que dos
+    reproducciones del mismo archivo producen el mismo estado final.
+    """
+
+    def __init__(self, controller_factory=None):
+        self._controller_factory = controller_factory or self._default_controller
+
+    @staticmethod
+    def _default_controller() -> CalculatorController:
+        controller = CalculatorController(HeadlessView())
+        controller.initialize()
+        return controller
+
+    def replay_file(self, filepath: str, realtime: bool = False) -> ReplayReport:
+        """Reproduce un archivo grabado por SessionRecorder."""
+        return self.replay(SessionRecorder.read_events(filepath), realtime)
+
+    def replay(self, events, realtime: bool = False) -> ReplayReport:
+        """
+        Reproduce eventos (delta_us, handler, args).
+        realtime=True respeta el ritmo original; False va a máxima velocidad.
+        """
+        controller = self._controller_factory()
+        latencies = {}
+        count = 0
+        clock = time.perf_counter_ns
+
+        start = clock()
+        due = start
+        for delta_us, name, args in events:
+            if realtime:
+                due += delta_us * 1000
+                wait = due - clock()
+                if wait > 0:
+                    time.sleep(wait / 1e9)
+
+            handler = getattr(controller, name)
+            t0 = clock()
+            handler(*args)
+            if controller.view.has_scheduled():
+                # Cálculos en segundo plano: esperar su resultado mantiene
+                # la reproducción determinista
+                controller.view.run_scheduled()
+            elapsed = clock() - t0
+
+            samples = latencies.get(name)
+            if samples is None:
+                samples = latencies[name] = array("q")
+            samples.append(elapsed)
+            count += 1
+        total_s = (clock() - start) / 1e9
+
+        return ReplayReport(count, total_s, latencies, self.capture_state(controller))
+
+    @staticmethod
+    def capture_state(controller) -> dict:
+        """Estado final determinista (sin timestamps) para comparar reproducciones."""
+        digest = hashlib.sha256()
+        for record in controller.history.get_all_records():
+            digest.update(f"{record['expression']}={record['result']!r}\n".encode())
+
+        return {
+            "display": controller.view.get_display_value(),
+            "current_input": controller.current_input,
+            "first_number": controller.first_number,
+            "operator": controller.operator,
+            "memory": controller.memory.recall(),
+            "history_count": controller.history.count(),
+            "history_digest": digest.hexdigest(),
+            "stats": controller.stats.get_stats_dict(),
+        }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Reproduce una sesión grabada.")
+    parser.add_argument("session", help="archivo grabado por SessionRecorder")
+    parser.add_argument("--realtime", action="store_true",
+                        help="respetar el ritmo original de la sesión")
+    parser.add_argument("--json", action="store_true",
+                        help="imprimir el reporte en JSON")
+    options = parser.parse_args()
+
+    report = SessionReplayer().replay_file(options.session, options.realtime)
+    if options.json:
+        print(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        print(report.to_text())
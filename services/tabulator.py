@@ -0,0 +1,89 @@
+# =============================================================================
+# SRP: Tabulator - ÚNICA responsabilidad: tabular f(x) sobre un rango y
+#      enviar la tabla a un archivo sin acumularla en memoria
+# Alta Cohesión: todos los métodos generan o exportan bloques de la tabla
+# =============================================================================
+#
+# El rango se recorre en bloques de chunk_size puntos (vectorizados con
+# NumPy si está instalado); cada bloque se escribe y se descarta, así que la
+# memoria es O(chunk_size) aunque la tabla tenga millones de filas. Nada se
+# guarda en el HistoryManager.
+#
+#   python -m services.tabulator "sqrt(x)" 0 1000000 1 -o raices.csv
+#   python -m services.tabulator "square(x) / 2" -10 10 0.5 -o tabla.json
+# =============================================================================
+
+import math
+
+from models.function_expression import FunctionExpression, numpy
+from services.file_manager import FileManager
+
+
+class Tabulator:
+    """
+    Evalúa una FunctionExpression en start, start + step, ..., stop.
+
+    Responsabilidad única: recorrer el rango por bloques de memoria acotada.
+    Alta cohesión: todos los métodos producen o consumen esos bloques.
+
+    Razón para cambiar: solo si cambia cómo se recorre o exporta el rango.
+    """
+
+    def __init__(self, expression, start: float, stop: float, step: float,
+                 chunk_size: int = 65536):
+        if not isinstance(expression, FunctionExpression):
+            expression = FunctionExpression(expression)
+        if step == 0 or not all(map(math.isfinite, (start, stop, step))):
+            raise ValueError("El rango debe ser finito y el paso distinto de cero")
+        if (stop - start) * step < 0:
+            raise ValueError("El paso no avanza de start hacia stop")
+
+        self.expression = expression
+        self.start = start
+        self.step = step
+        self.chunk_size = chunk_size
+        # Tolerancia para que 0..1 en pasos de 0.1 incluya el 1
+        self.count = math.floor((stop - start) / step + 1e-9) + 1
+
+    def chunks(self):
+        """Genera bloques (xs, ys) como listas de a lo sumo chunk_size puntos."""
+        start, step, expression = self.start, self.step, self.expression
+        for first in range(0, self.count, self.chunk_size):
+            last = min(first + self.chunk_size, self.count)
+            if numpy is not None:
+                xs = start + step * numpy.arange(first, last, dtype=float)
+                ys = expression.evaluate_many(xs)
+                yield xs.tolist(), ys.tolist()
+            else:
+                xs = [start + step * k for k in range(first, last)]
+                yield xs, expression.evaluate_many(xs)
+
+    def export(self, filepath: str, file_mgr: FileManager = None) -> int:
+        """Escribe la tabla (CSV o JSON según la extensión). Retorna las filas."""
+        file_mgr = file_mgr or FileManager()
+        return file_mgr.save_table(
+            filepath, ("x", f"f(x) = {self.expression.source}"), self.chunks()
+        )
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Tabula f(x) sobre un rango.")
+    parser.add_argument("expression", help='p. ej. "sqrt(x)" o "square(x) + 1"')
+    parser.add_argument("start", type=float)
+    parser.add_argument("stop", type=float)
+    parser.add_argument("step", type=float)
+    parser.add_argument("-o", "--output", required=True,
+                        help="archivo .csv, .txt o .json")
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    options = parser.parse_args()
+
+    tabulator = Tabulator(options.expression, options.start, options.stop,
+                          options.step, options.chunk_size)
+    began = time.perf_counter()
+    rows = tabulator.export(options.output)
+    mode = "NumPy" if tabulator.expression.vectorized else "Python"
+    print(f"{rows:,} filas en {time.perf_counter() - began:.2f} s ({mode}) "
+          f"→ {options.output}")
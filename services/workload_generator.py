@@ -0,0 +1,172 @@
+# =============================================================================
+# SRP: WorkloadGenerator - ÚNICA responsabilidad: generar cargas sintéticas
+# Alta Cohesión: todos los métodos producen o entregan eventos de entrada
+# =============================================================================
+#
+# Los eventos generados tienen la misma forma que los de SessionRecorder,
+# (delta_us, handler, args), por lo que pueden alimentar directamente al
+# controlador, a SessionReplayer o escribirse a un archivo de sesión.
+#
+#   python -m services.workload_generator carga.rec.gz --count 1000000 --seed 7
+# =============================================================================
+
+import math
+import random
+from itertools import islice
+
+from services.session_recorder import SessionRecorder
+
+
+class WorkloadGenerator:
+    """
+    Genera secuencias de eventos realistas para pruebas de carga.
+
+    Responsabilidad única: producir mezclas ponderadas de operaciones.
+    Alta cohesión: todos los métodos construyen o consumen el flujo de eventos.
+
+    Razón para cambiar: solo si cambia el modelo de carga sintética.
+
+    Cada acción elegida se traduce en los eventos que haría un usuario
+    (teclear operandos, operador, "=", etc.). La generación es perezosa:
+    se pueden producir millones de eventos sin mantenerlos en memoria.
+    """
+
+    DEFAULT_WEIGHTS = {
+        "+": 30,
+        "-": 20,
+        "*": 15,
+        "/": 12,
+        "√": 4,
+        "x²": 4,
+        "%": 3,
+        "±": 2,
+        "π": 1,
+        "memory": 4,
+        "div_zero": 1,
+        "negative_sqrt": 1,
+        "history_open": 1,
+        "history_save": 0.5,
+        "clear": 3,
+    }
+
+    _SCIENTIFIC_HANDLERS = {
+        "√": "on_sqrt",
+        "x²": "on_square",
+        "%": "on_percentage",
+        "±": "on_toggle_sign",
+    }
+
+    _MEMORY_HANDLERS = (
+        "on_memory_add",
+        "on_memory_subtract",
+        "on_memory_recall",
+        "on_memory_clear",
+    )
+
+    def __init__(self, seed: int = 0, weights: dict = None,
+                 mean_think_us: int = 150_000):
+        """
+        `weights` reemplaza a DEFAULT_WEIGHTS (acción → peso relativo). Lanza
+        ValueError si nombra acciones desconocidas, si algún peso es negativo
+        o no finito, o si ninguno es mayor que cero.
+        """
+        self._seed = seed
+        self._weights = dict(weights if weights is not None else self.DEFAULT_WEIGHTS)
+        unknown = set(self._weights) - set(self.DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Acciones desconocidas: {sorted(unknown)}")
+        invalid = sorted(a for a, w in self._weights.items() if not 0 <= w < math.inf)
+        if invalid:
+            raise ValueError(f"Pesos negativos o no finitos: {invalid}")
+        if not any(self._weights.values()):
+            raise ValueError("Al menos una acción debe tener peso mayor que cero")
+        self._mean_think_us = mean_think_us
+
+    def events(self, count: int = None):
+        """
+        Genera eventos (delta_us, handler, args). Con count=None es infinito.
+        La misma semilla produce siempre la misma secuencia.
+        """
+        stream = self._generate()
+        return stream if count is None else islice(stream, count)
+
+    def feed(self, controller, count: int) -> int:
+        """Envía count eventos directamente al controlador."""
+        sent = 0
+        for _, name, args in self.events(count):
+            getattr(controller, name)(*args)
+            sent += 1
+        return sent
+
+    def write(self, filepath: str, count: int) -> int:
+        """Escribe count eventos en un archivo de sesión reproducible."""
+        return SessionRecorder.write_events(filepath, self.events(count))
+
+    # -------------------------------------------------------------------------
+    #  Generación interna
+    # -------------------------------------------------------------------------
+
+    def _generate(self):
+        rng = random.Random(self._seed)
+        actions = list(self._weights)
+        weights = [self._weights[a] for a in actions]
+        rate = 1 / self._mean_think_us
+
+        while True:
+            action = rng.choices(actions, weights)[0]
+            for name, args in self._action_events(rng, action):
+                yield int(rng.expovariate(rate)), name, args
+
+    def _action_events(self, rng: random.Random, action: str):
+        """Traduce una acción de alto nivel a la secuencia de handlers."""
+        if action in ("+", "-", "*", "/"):
+            yield from self._type_number(rng)
+            yield "on_operator", (action,)
+            yield from self._type_number(rng)
+            yield "on_equals", ()
+        elif action in self._SCIENTIFIC_HANDLERS:
+            yield from self._type_number(rng)
+            yield self._SCIENTIFIC_HANDLERS[action], ()
+        elif action == "π":
+            yield "on_insert_pi", ()
+        elif action == "memory":
+            yield from self._type_number(rng)
+            yield rng.choice(self._MEMORY_HANDLERS), ()
+        elif action == "div_zero":
+            yield from self._type_number(rng)
+            yield "on_operator", ("/",)
+            yield "on_digit", ("0",)
+            yield "on_equals", ()
+        elif action == "negative_sqrt":
+            yield from self._type_number(rng)
+            yield "on_toggle_sign", ()
+            yield "on_sqrt", ()
+        elif action == "history_open":
+            yield "on_show_history", ()
+        elif action == "history_save":
+            yield "on_save_history", ()
+        else:
+            yield "on_clear", ()
+
+    @staticmethod
+    def _type_number(rng: random.Random):
+        """Teclea un operando: entero de 1 a 4 cifras, a veces con decimales."""
+        text = str(rng.randint(1, 9999))
+        if rng.random() < 0.3:
+            text += "." + str(rng.randint(0, 99))
+        for char in text:
+            yield "on_digit", (char,)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Genera una carga sintética.")
+    parser.add_argument("output", help="archivo de sesión de salida (.rec o .gz)")
+    parser.add_argument("--count", type=int, default=100_000,
+                        help="cantidad de eventos a generar")
+    parser.add_argument("--seed", type=int, default=0, help="semilla aleatoria")
+    options = parser.parse_args()
+
+    written = WorkloadGenerator(seed=options.seed).write(options.output, options.count)
+    print(f"{written} eventos escritos en {options.output}")
@@ -4,9 +4,11 @@
 from utils.theme_manager import ThemeManager
 from utils.number_formatter import NumberFormatter
 from utils.input_validator import InputValidator
+from utils.clock import Clock
 
 __all__ = [
     "ThemeManager",
     "NumberFormatter",
     "InputValidator",
+    "Clock",
 ]
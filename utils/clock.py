@@ -0,0 +1,85 @@
+# =============================================================================
+# SRP: Clock - ÚNICA responsabilidad: tomar marcas de tiempo baratas y
+#      convertirlas a texto solo cuando se muestran o exportan
+# Alta Cohesión: todos los métodos toman, convierten o formatean marcas
+# =============================================================================
+#
+# En el camino caliente (HistoryManager.add_record) solo se guarda un entero
+# de time.time_ns(): unos 50 ns frente a los microsegundos de
+# datetime.now().strftime(). El texto se arma al mostrar o exportar, y la
+# parte "%H:%M:%S" se reutiliza mientras no cambie el segundo.
+#
+# Las marcas son de pared (época Unix), no monótonas: un desfase fijado al
+# arrancar se desviaría de la hora real tras un ajuste de NTP o una
+# suspensión, en la que el reloj monótono no avanza. Con precise=True el
+# texto incluye fecha y microsegundos.
+# =============================================================================
+
+import time
+
+TIME_FORMAT = "%H:%M:%S"
+DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+_NS_PER_SECOND = 1_000_000_000
+
+
+class Clock:
+    """
+    Reloj compartido por historial, logger y exportaciones.
+
+    Responsabilidad única: producir marcas crudas y su texto diferido.
+    Alta cohesión: todos los métodos trabajan con la misma escala de tiempo.
+
+    Razón para cambiar: solo si cambia la fuente o el formato de las marcas.
+    """
+
+    _shared = None
+
+    # Marca cruda del camino caliente (nanosegundos desde la época)
+    stamp = staticmethod(time.time_ns)
+
+    def __init__(self, precise: bool = False):
+        self.precise = precise
+        # Último segundo formateado por formato: {con_fecha: (segundo, texto)}.
+        # Cada entrada se reemplaza entera, así que un lector concurrente
+        # nunca ve el texto de un segundo con la clave de otro
+        self._rendered = {False: (None, ""), True: (None, "")}
+
+    @classmethod
+    def shared(cls) -> "Clock":
+        """Retorna el reloj común del proceso (se crea en el primer uso)."""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    @classmethod
+    def set_shared(cls, clock: "Clock") -> None:
+        """Reemplaza el reloj común (por ejemplo, uno con precise=True)."""
+        cls._shared = clock
+
+    def format(self, stamp: int, with_date: bool = None) -> str:
+        """Texto de una marca tomada con stamp()."""
+        return self.format_epoch(stamp, with_date)
+
+    def format_epoch(self, epoch_ns: int, with_date: bool = None) -> str:
+        """
+        Texto de un instante en nanosegundos desde la época: "%H:%M:%S", o
+        con fecha si with_date (por defecto, solo en modo preciso); en modo
+        preciso se agregan los microsegundos.
+        """
+        if with_date is None:
+            with_date = self.precise
+        second, nanos = divmod(epoch_ns, _NS_PER_SECOND)
+
+        cached_second, text = self._rendered[with_date]
+        if cached_second != second:
+            text = time.strftime(DATE_FORMAT if with_date else TIME_FORMAT,
+                                 time.localtime(second))
+            self._rendered[with_date] = (second, text)
+
+        if self.precise:
+            return f"{text}.{nanos // 1000:06d}"
+        return text
+
+    def now(self, with_date: bool = True) -> str:
+        """Texto del instante actual (por defecto con fecha, para logs y archivos)."""
+        return self.format_epoch(time.time_ns(), with_date)
@@ -15,14 +15,15 @@ class InputValidator:
     """
 
     @staticmethod
-    def parse_number(value: str):
+    def parse_number(value: str, number_type=float):
         """
-        Intenta convertir un string a número.
-        Retorna el float si es válido, None si no lo es.
+        Intenta convertir un string a número del tipo indicado (float por
+        defecto, o el `parse` de un NumericBackend: Decimal, Fraction).
+        Retorna el número si es válido, None si no lo es.
         """
         try:
-            return float(value)
-        except (ValueError, TypeError):
+            return number_type(value)
+        except (ValueError, TypeError, ArithmeticError):
             return None
 
     @staticmethod
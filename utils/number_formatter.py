@@ -3,6 +3,19 @@
 # Alta Cohesión: todos los métodos se relacionan con el formateo de números
 # =============================================================================
 
+from collections import OrderedDict
+from decimal import Decimal
+
+from models.operator_registry import OperatorRegistry
+
+try:
+    import numpy
+except ImportError:  # NumPy es opcional: format_many acepta cualquier iterable
+    numpy = None
+
+# Los float enteros menores que esto se convierten en bloque a int64
+_INT64_SAFE = 2.0**63
+
 
 class NumberFormatter:
     """
@@ -12,21 +25,143 @@ class NumberFormatter:
     Alta cohesión: todos los métodos transforman datos numéricos a texto.
 
     Razón para cambiar: solo si cambian las reglas de formato numérico.
+
+    Un mismo valor se formatea varias veces seguidas (resultado en el
+    display, operando en la siguiente expresión, fila del historial): los
+    float formateados quedan en un caché FIFO de cache_size entradas, así
+    que display, etiquetas del historial y format_many reutilizan el texto.
     """
 
+    # Rango de exponentes de Decimal que se muestra sin notación científica
+    DECIMAL_FIXED_RANGE = (-12, 40)
+
+    def __init__(self, operators: OperatorRegistry = None, cache_size: int = 4096):
+        # Tabla operador → símbolo compilada una vez del registro
+        self._symbols = (operators or OperatorRegistry.default()).symbols()
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def format(self, number) -> str:
+        """
+        Formatea un número para mostrar en el display. Los float se redondean
+        a 8 cifras; Decimal y Fraction se muestran completos (el texto vuelve
+        a parsearse al encadenar operaciones, así que no debe perder dígitos).
+        """
+        # Solo se memorizan float: 1.5 == Decimal("1.5") pero su texto puede
+        # diferir, y los float son el caso frecuente
+        if type(number) is float:
+            cache = self._cache
+            text = cache.get(number)
+            if text is not None:
+                self.cache_hits += 1
+                return text
+            self.cache_misses += 1
+            text = self._format_float(number)
+            if len(cache) >= self._cache_size:
+                cache.popitem(last=False)
+            cache[number] = text
+            return text
+        return self._format_uncached(number)
+
+    def format_many(self, values) -> list:
+        """
+        Formatea una secuencia completa (historial, exportaciones) con el
+        mismo resultado que format() elemento a elemento, pero cada valor
+        distinto se formatea una sola vez. Un arreglo float de NumPy se
+        formatea en bloque: los enteros de una vez vía int64 y el resto con
+        "%.8g" vectorizado.
+        """
+        if numpy is not None and isinstance(values, numpy.ndarray) \
+                and values.dtype.kind == "f":
+            return self._format_array(values.ravel())
+
+        values = values if isinstance(values, list) else list(values)
+        if len(values) <= self._cache_size:
+            # Lote pequeño (la ventana de historial): usa y alimenta el caché
+            # compartido con el display
+            format_one = self.format
+            return [format_one(value) for value in values]
+
+        # Lote grande: no se vacía el caché con valores que no se volverán a
+        # mostrar. Deduplicar solo compensa si hay pocos valores distintos:
+        # si una muestra repartida de ~1024 casi no repite, se formatea directo
+        sample = values[::max(1, len(values) // 1024)]
+        if len(set(sample)) > 0.9 * len(sample):
+            return self._format_list(values)
+        distinct = dict.fromkeys(values)
+        if len(set(map(type, distinct))) > 1:
+            # Tipos mezclados: 1.5 y Decimal("1.5") serían la misma clave
+            return self._format_list(values)
+        texts = dict(zip(distinct, self._format_list(distinct)))
+        return list(map(texts.__getitem__, values))
+
+    def get_cache_stats(self) -> dict:
+        """Aciertos, fallos y tamaño del caché de textos."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "entries": len(self._cache),
+        }
+
     @staticmethod
-    def format(number) -> str:
-        """Formatea un número para mostrar en el display."""
+    def _format_list(values) -> list:
+        """format() sin caché sobre un iterable, con el caso float en línea."""
+        format_other = NumberFormatter._format_uncached
+        return [
+            (str(int(value)) if value.is_integer() else f"{value:.8g}")
+            if type(value) is float else format_other(value)
+            for value in values
+        ]
+
+    @staticmethod
+    def _format_float(number: float) -> str:
+        if number.is_integer():
+            return str(int(number))
+        return f"{number:.8g}"
+
+    @staticmethod
+    def _format_array(values) -> list:
+        unique, inverse = numpy.unique(values, return_inverse=True)
+        texts = numpy.empty(len(unique), dtype=object)
+
+        integral = numpy.isfinite(unique) & (numpy.floor(unique) == unique)
+        small = integral & (numpy.abs(unique) < _INT64_SAFE)
+        texts[small] = unique[small].astype(numpy.int64).astype(str)
+        # Enteros que no caben en int64 (p. ej. 1e300): como en format()
+        for index in numpy.flatnonzero(integral & ~small):
+            texts[index] = str(int(unique[index]))
+        rest = ~integral
+        if rest.any():
+            texts[rest] = numpy.char.mod("%.8g", unique[rest])
+
+        return texts[inverse].tolist()
+
+    @staticmethod
+    def _format_uncached(number) -> str:
         if number is None:
             return "Error"
-        if isinstance(number, float) and number == int(number):
-            return str(int(number))
         if isinstance(number, float):
-            return f"{number:.8g}"
+            return NumberFormatter._format_float(number)
+        if isinstance(number, Decimal):
+            return NumberFormatter._format_decimal(number)
+        # int y Fraction ("3" o "1/3")
         return str(number)
 
     @staticmethod
-    def get_operator_symbol(operator: str) -> str:
+    def _format_decimal(number: Decimal) -> str:
+        """Decimal sin ceros sobrantes: 5.00 → "5", 1E+2 → "100"."""
+        if number.is_zero():
+            return "0"
+        low, high = NumberFormatter.DECIMAL_FIXED_RANGE
+        if not number.is_finite() or not low <= number.adjusted() < high:
+            return str(number)
+        text = f"{number:f}"
+        if "." in text:
+            text = text.rstrip("0").rstrip(".")
+        return text
+
+    def get_operator_symbol(self, operator: str) -> str:
         """Convierte un operador interno a su símbolo visual."""
-        symbols = {"+": "+", "-": "−", "*": "×", "/": "÷"}
-        return symbols.get(operator, operator)
+        return self._symbols.get(operator, operator)
@@ -3,6 +3,8 @@
 # Alta Cohesión: todos los métodos están relacionados con la apariencia visual
 # =============================================================================
 
+from types import MappingProxyType
+
 
 class ThemeManager:
     """
@@ -64,19 +66,24 @@ class ThemeManager:
         "border": "#b2bec3",
     }
 
+    # Vistas de solo lectura compartidas por todas las instancias: varias
+    # ventanas usan las mismas paletas sin copiarlas.
+    _DARK_VIEW = MappingProxyType(DARK_THEME)
+    _LIGHT_VIEW = MappingProxyType(LIGHT_THEME)
+
     def __init__(self):
         self.is_dark_mode = True
-        self._current_theme = self.DARK_THEME.copy()
+        self._current_theme = self._DARK_VIEW
 
     def get_colors(self) -> dict:
-        """Retorna la paleta de colores del tema actual."""
+        """Retorna la paleta de colores del tema actual (solo lectura)."""
         return self._current_theme
 
     def toggle_theme(self) -> dict:
         """Alterna entre tema oscuro y claro. Retorna la nueva paleta."""
         self.is_dark_mode = not self.is_dark_mode
         self._current_theme = (
-            self.DARK_THEME.copy() if self.is_dark_mode else self.LIGHT_THEME.copy()
+            self._DARK_VIEW if self.is_dark_mode else self._LIGHT_VIEW
         )
         return self._current_theme
 
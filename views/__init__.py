@@ -3,8 +3,10 @@
 
 from views.calculator_view import CalculatorView
 from views.history_view import HistoryView
+from views.headless_view import HeadlessView
 
 __all__ = [
     "CalculatorView",
     "HistoryView",
+    "HeadlessView",
 ]
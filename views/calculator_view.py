@@ -4,6 +4,9 @@
 # =============================================================================
 
 import tkinter as tk
+from tkinter import messagebox, filedialog
+
+from views.history_view import HistoryView
 
 
 class CalculatorView:
@@ -184,9 +187,12 @@ class CalculatorView:
         buttons_frame = tk.Frame(self.window, bg=self.colors["bg_main"])
         buttons_frame.pack(fill="both", expand=True, padx=15, pady=(5, 15))
 
-        for i in range(5):
+        # 5×4 de base; los operadores registrados pueden agregar filas
+        rows = max([5] + [row + 1 for _, row, *_ in button_layout])
+        columns = max([4] + [col + 1 for _, _, col, *_ in button_layout])
+        for i in range(rows):
             buttons_frame.rowconfigure(i, weight=1)
-        for j in range(4):
+        for j in range(columns):
             buttons_frame.columnconfigure(j, weight=1)
 
         for text, row, col, bg, fg, cmd in button_layout:
@@ -251,3 +257,62 @@ class CalculatorView:
     def bind_keyboard(self, handler) -> None:
         """Enlaza el handler de teclado a la ventana."""
         self.window.bind("<Key>", handler)
+
+    def schedule(self, delay_ms: int, callback) -> None:
+        """Programa callback en el hilo de Tk tras delay_ms (window.after)."""
+        self.window.after(delay_ms, callback)
+
+    def schedule_idle(self, callback) -> None:
+        """Programa callback cuando Tk termine los eventos pendientes."""
+        self.window.after_idle(callback)
+
+    def bind_undo_redo(self, on_undo, on_redo) -> None:
+        """Enlaza Ctrl+Z (deshacer) y Ctrl+Y / Ctrl+Shift+Z (rehacer)."""
+        self.window.bind("<Control-z>", lambda e: on_undo())
+        self.window.bind("<Control-y>", lambda e: on_redo())
+        self.window.bind("<Control-Z>", lambda e: on_redo())
+
+    def bind_trace_toggle(self, on_toggle) -> None:
+        """Enlaza F12 a pausar / reanudar la traza de rendimiento."""
+        self.window.bind("<F12>", lambda e: on_toggle())
+
+    # -------------------------------------------------------------------------
+    #  Diálogos y ventanas secundarias
+    # -------------------------------------------------------------------------
+
+    def show_info(self, title: str, message: str) -> None:
+        """Muestra un mensaje informativo."""
+        messagebox.showinfo(title, message)
+
+    def show_warning(self, title: str, message: str) -> None:
+        """Muestra un mensaje de advertencia."""
+        messagebox.showwarning(title, message)
+
+    def show_error(self, title: str, message: str) -> None:
+        """Muestra un mensaje de error."""
+        messagebox.showerror(title, message)
+
+    def ask_save_path(self) -> str:
+        """Pregunta al usuario la ruta donde guardar el historial."""
+        return filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[
+                ("JSON files", "*.json"),
+                ("Text files", "*.txt"),
+                ("Compact history", "*.chist"),
+                ("All files", "*.*"),
+            ],
+            title="Guardar historial",
+        )
+
+    def open_history(
+        self, records: list[dict], format_many, on_clear, on_statistics
+    ) -> None:
+        """Abre la ventana emergente de historial delegando a HistoryView."""
+        history_view = HistoryView(self.window, self.colors)
+        history_view.show(
+            records=records,
+            format_many=format_many,
+            on_clear=on_clear,
+            on_statistics=on_statistics,
+        )
@@ -0,0 +1,144 @@
+# =============================================================================
+# SRP: HeadlessView - ÚNICA responsabilidad: simular la vista sin interfaz
+# Alta Cohesión: todos los métodos guardan en memoria lo que la UI mostraría
+# =============================================================================
+
+import heapq
+import itertools
+import time
+from collections import deque
+
+
+class HeadlessView:
+    """
+    Vista sin ventana que cumple la misma interfaz que CalculatorView.
+
+    Responsabilidad única: conservar en memoria el estado visible de la UI.
+    Alta cohesión: todos los métodos registran lo que se mostraría en pantalla.
+
+    Razón para cambiar: solo si cambia la interfaz pública de la vista.
+
+    Permite ejecutar el CalculatorController sin Tk (reproducción de
+    sesiones, pruebas de carga, servidores), sin diálogos bloqueantes.
+    """
+
+    def __init__(self, colors: dict = None, max_messages: int = 100):
+        self.window = None
+        self.colors = colors or {}
+
+        self.display_value = "0"
+        self.history_text = ""
+        self.stats_text = "Operaciones realizadas: 0"
+
+        # Solo se conservan los últimos diálogos para acotar la memoria
+        self.messages = deque(maxlen=max_messages)
+        self.message_count = 0
+        self.history_opened = 0
+        self.save_path = None
+        self.keyboard_handler = None
+
+        # Callbacks programados con schedule(): (vencimiento, orden, callback)
+        self._scheduled = []
+        self._sequence = itertools.count()
+
+    # -------------------------------------------------------------------------
+    #  Construcción (sin widgets)
+    # -------------------------------------------------------------------------
+
+    def setup_window(self) -> None:
+        pass
+
+    def build_top_bar(self, on_toggle_theme) -> None:
+        pass
+
+    def build_display(self) -> None:
+        pass
+
+    def build_memory_buttons(self, callbacks: list[tuple]) -> None:
+        pass
+
+    def build_scientific_buttons(self, callbacks: list[tuple]) -> None:
+        pass
+
+    def build_keypad(self, button_layout: list[tuple], get_hover_color) -> None:
+        pass
+
+    def build_stats_bar(self) -> None:
+        pass
+
+    # -------------------------------------------------------------------------
+    #  Actualización del estado visible
+    # -------------------------------------------------------------------------
+
+    def update_display(self, value: str) -> None:
+        self.display_value = value
+
+    def update_history_text(self, text: str) -> None:
+        self.history_text = text
+
+    def update_stats_text(self, text: str) -> None:
+        self.stats_text = text
+
+    def update_theme(self, colors: dict, icon: str) -> None:
+        self.colors = colors
+
+    def get_display_value(self) -> str:
+        return self.display_value
+
+    def bind_keyboard(self, handler) -> None:
+        self.keyboard_handler = handler
+
+    def bind_undo_redo(self, on_undo, on_redo) -> None:
+        pass
+
+    def bind_trace_toggle(self, on_toggle) -> None:
+        pass
+
+    # -------------------------------------------------------------------------
+    #  Programación de callbacks (equivalente a window.after)
+    # -------------------------------------------------------------------------
+
+    def schedule(self, delay_ms: int, callback) -> None:
+        due = time.monotonic() + delay_ms / 1000
+        heapq.heappush(self._scheduled, (due, next(self._sequence), callback))
+
+    def schedule_idle(self, callback) -> None:
+        self.schedule(0, callback)
+
+    def has_scheduled(self) -> bool:
+        return bool(self._scheduled)
+
+    def run_scheduled(self) -> None:
+        """Ejecuta los callbacks programados (y los que éstos programen)."""
+        while self._scheduled:
+            due, _, callback = heapq.heappop(self._scheduled)
+            wait = due - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            callback()
+
+    # -------------------------------------------------------------------------
+    #  Diálogos (no bloqueantes)
+    # -------------------------------------------------------------------------
+
+    def show_info(self, title: str, message: str) -> None:
+        self._add_message("info", title, message)
+
+    def show_warning(self, title: str, message: str) -> None:
+        self._add_message("warning", title, message)
+
+    def show_error(self, title: str, message: str) -> None:
+        self._add_message("error", title, message)
+
+    def ask_save_path(self) -> str:
+        """Retorna la ruta preconfigurada en save_path (None = cancelar)."""
+        return self.save_path
+
+    def open_history(
+        self, records: list[dict], format_many, on_clear, on_statistics
+    ) -> None:
+        self.history_opened += 1
+
+    def _add_message(self, kind: str, title: str, message: str) -> None:
+        self.messages.append((kind, title, message))
+        self.message_count += 1
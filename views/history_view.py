@@ -16,6 +16,9 @@ class HistoryView:
     Razón para cambiar: solo si cambia la presentación del historial.
     """
 
+    # Registros por página de la lista
+    PAGE_SIZE = 100
+
     def __init__(self, parent: tk.Tk, colors: dict):
         self._parent = parent
         self._colors = colors
@@ -23,7 +26,7 @@ class HistoryView:
     def show(
         self,
         records: list[dict],
-        format_number,
+        format_many,
         on_clear: callable,
         on_statistics: callable,
     ) -> None:
@@ -53,15 +56,20 @@ class HistoryView:
                 fg="#a0a0a0",
             ).pack(pady=20)
         else:
-            self._build_records_list(hist_window, records, format_number)
+            self._build_records_list(hist_window, records, format_many)
 
         # Botones de acción
         self._build_action_buttons(hist_window, on_clear, on_statistics)
 
     def _build_records_list(
-        self, parent_window: tk.Toplevel, records: list[dict], format_number
+        self, parent_window: tk.Toplevel, records: list[dict], format_many
     ) -> None:
-        """Construye la lista scrollable de registros del historial."""
+        """
+        Construye la lista scrollable de registros del historial. Se muestran
+        de a PAGE_SIZE (botón "Mostrar más"): records puede ser un
+        RecordSequence que lee del disco solo las páginas pedidas. Los
+        resultados de cada página se formatean en un solo lote (format_many).
+        """
         canvas = tk.Canvas(
             parent_window, bg=self._colors["bg_main"], highlightthickness=0
         )
@@ -77,36 +85,63 @@ class HistoryView:
         canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        for record in records:
-            item_frame = tk.Frame(
-                scroll_frame,
-                bg=self._colors["bg_display"],
-                highlightbackground=self._colors["border"],
-                highlightthickness=1,
-            )
-            item_frame.pack(fill="x", padx=15, pady=3)
-
-            tk.Label(
-                item_frame,
-                text=f"  {record['expression']} = {format_number(record['result'])}",
-                font=("Segoe UI", 11),
-                bg=self._colors["bg_display"],
-                fg="#ffffff",
-                anchor="w",
-            ).pack(fill="x", padx=5, pady=(5, 0))
-
-            tk.Label(
-                item_frame,
-                text=f"  🕐 {record['timestamp']}",
-                font=("Segoe UI", 8),
-                bg=self._colors["bg_display"],
-                fg="#636e72",
-                anchor="w",
-            ).pack(fill="x", padx=5, pady=(0, 5))
+        more_button = tk.Button(
+            scroll_frame,
+            font=("Segoe UI", 9),
+            bg=self._colors["bg_display"],
+            fg="#a0a0a0",
+            bd=0,
+            cursor="hand2",
+        )
+        shown = 0
+
+        def show_page() -> None:
+            nonlocal shown
+            page = records[shown:shown + self.PAGE_SIZE]
+            results = format_many([record["result"] for record in page])
+            more_button.pack_forget()
+            for record, result in zip(page, results):
+                self._build_record_item(scroll_frame, record, result)
+            shown += len(page)
+            remaining = len(records) - shown
+            if remaining > 0:
+                more_button.configure(text=f"Mostrar más ({remaining:,} restantes)")
+                more_button.pack(fill="x", padx=15, pady=6)
+
+        more_button.configure(command=show_page)
+        show_page()
 
         canvas.pack(side="left", fill="both", expand=True, padx=(10, 0))
         scrollbar.pack(side="right", fill="y")
 
+    def _build_record_item(self, parent: tk.Frame, record: dict, result: str) -> None:
+        """Construye la tarjeta de un registro (expresión = resultado y hora)."""
+        item_frame = tk.Frame(
+            parent,
+            bg=self._colors["bg_display"],
+            highlightbackground=self._colors["border"],
+            highlightthickness=1,
+        )
+        item_frame.pack(fill="x", padx=15, pady=3)
+
+        tk.Label(
+            item_frame,
+            text=f"  {record['expression']} = {result}",
+            font=("Segoe UI", 11),
+            bg=self._colors["bg_display"],
+            fg="#ffffff",
+            anchor="w",
+        ).pack(fill="x", padx=5, pady=(5, 0))
+
+        tk.Label(
+            item_frame,
+            text=f"  🕐 {record['timestamp']}",
+            font=("Segoe UI", 8),
+            bg=self._colors["bg_display"],
+            fg="#636e72",
+            anchor="w",
+        ).pack(fill="x", padx=5, pady=(0, 5))
+
     def _build_action_buttons(
         self, parent_window: tk.Toplevel, on_clear: callable, on_statistics: callable
     ) -> None: